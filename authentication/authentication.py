@@ -0,0 +1,56 @@
+from typing import Optional
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from authentication import token_cache
+from authentication.services import UserCacheService, TokenRevocationService
+from users.models import User
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that skips signature and claim verification for bearer tokens already
+    verified by this process, rejects revoked tokens, and resolves the token's user through
+    UserCacheService instead of querying users_user on every request.
+    """
+
+    def __init__(
+            self,
+            *args,
+            user_cache_service: Optional[UserCacheService] = None,
+            token_revocation_service: Optional[TokenRevocationService] = None,
+            **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.user_cache_service = user_cache_service or UserCacheService()
+        self.token_revocation_service = token_revocation_service or TokenRevocationService()
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        validated_token = token_cache.verified_token_cache.get(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            token_cache.verified_token_cache.put(raw_token, validated_token)
+
+        if self.token_revocation_service.is_revoked(validated_token.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken(_("Token has been revoked"))
+        return validated_token
+
+    def get_user(self, validated_token: Token) -> User:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = self.user_cache_service.get_user(user_id)
+        except User.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
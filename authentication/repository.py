@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import List
+
+from django.utils import timezone
+
+from authentication.models import RevokedToken
+from users.models import User
+from utils.redis_client import get_binary_redis_client
+
+
+class RevokedTokenRepository:
+
+    @staticmethod
+    def add(jti: str, user: User, expires_at: datetime) -> None:
+        RevokedToken.objects.get_or_create(jti=jti, defaults={"user": user, "expires_at": expires_at})
+
+    @staticmethod
+    def is_revoked(jti: str) -> bool:
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    @staticmethod
+    def get_unexpired_jtis() -> List[str]:
+        return list(RevokedToken.objects.filter(expires_at__gt=timezone.now()).values_list('jti', flat=True))
+
+    @staticmethod
+    def get_jtis_revoked_since(revoked_at: datetime) -> List[str]:
+        return list(RevokedToken.objects.filter(revoked_at__gte=revoked_at).values_list('jti', flat=True))
+
+    @staticmethod
+    def delete_expired() -> int:
+        deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        return deleted
+
+
+class RevocationFilterRepository:
+    FILTER_KEY = "auth:revoked:bloom"
+
+    @staticmethod
+    def set_bits(positions: List[int]) -> None:
+        pipeline = get_binary_redis_client().pipeline(transaction=False)
+        for position in positions:
+            pipeline.setbit(RevocationFilterRepository.FILTER_KEY, position, 1)
+        pipeline.execute()
+
+    @staticmethod
+    def get_bitmap() -> bytes:
+        return get_binary_redis_client().get(RevocationFilterRepository.FILTER_KEY) or b""
+
+    @staticmethod
+    def replace_bitmap(bitmap: bytes) -> None:
+        get_binary_redis_client().set(RevocationFilterRepository.FILTER_KEY, bitmap)
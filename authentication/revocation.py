@@ -0,0 +1,90 @@
+import hashlib
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+
+
+class BloomFilter:
+    """
+    Bit array over the revoked token ids. Bits are laid out like a Redis bitmap (bit 0 is the
+    most significant bit of byte 0), so the in-process copy can be loaded from GET and
+    updated with SETBIT offsets.
+    """
+
+    def __init__(self, size_bits: int, hash_count: int, bitmap: Optional[bytes] = None):
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.bits = bytearray(size_bits // 8 + 1)
+        if bitmap:
+            self.load(bitmap)
+
+    def positions(self, value: str) -> List[int]:
+        # Double hashing: k positions from the two halves of one SHA-256 digest.
+        digest = hashlib.sha256(value.encode()).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return [(first + i * second) % self.size_bits for i in range(self.hash_count)]
+
+    def add(self, value: str) -> List[int]:
+        positions = self.positions(value)
+        self.set_positions(positions)
+        return positions
+
+    def set_positions(self, positions: Iterable[int]) -> None:
+        for position in positions:
+            self.bits[position // 8] |= 0x80 >> (position % 8)
+
+    def might_contain(self, value: str) -> bool:
+        return all(self.bits[position // 8] & (0x80 >> (position % 8)) for position in self.positions(value))
+
+    def load(self, bitmap: bytes) -> None:
+        bits = bytearray(len(self.bits))
+        bits[:len(bitmap)] = bitmap[:len(bits)]
+        self.bits = bits
+
+    @classmethod
+    def from_values(cls, size_bits: int, hash_count: int, values: Iterable[str]) -> "BloomFilter":
+        bloom_filter = cls(size_bits, hash_count)
+        for value in values:
+            bloom_filter.add(value)
+        return bloom_filter
+
+
+class RevocationFilterMirror:
+    """
+    This process's copy of the shared revocation filter, replaced from Redis at most once
+    every `sync_interval` seconds.
+    """
+
+    def __init__(self, size_bits: int, hash_count: int, sync_interval: float):
+        self.bloom_filter = BloomFilter(size_bits, hash_count)
+        self.sync_interval = sync_interval
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def claim_sync(self) -> bool:
+        """
+        Returns True to the single caller that should sync now.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._synced_at is not None and now - self._synced_at < self.sync_interval:
+                return False
+            self._synced_at = now
+            return True
+
+    def load(self, bitmap: bytes) -> None:
+        self.bloom_filter.load(bitmap)
+
+    def reset(self) -> None:
+        self.bloom_filter = BloomFilter(self.bloom_filter.size_bits, self.bloom_filter.hash_count)
+        self._synced_at = None
+
+
+revocation_filter = RevocationFilterMirror(
+    size_bits=settings.AUTH_REVOCATION_FILTER_BITS,
+    hash_count=settings.AUTH_REVOCATION_FILTER_HASHES,
+    sync_interval=settings.AUTH_REVOCATION_SYNC_INTERVAL,
+)
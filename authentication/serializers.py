@@ -1,7 +1,16 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.contrib.auth.models import update_last_login
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import PasswordField, TokenObtainSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 
+from authentication.services import TokenRevocationService
 
-class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+
+class CustomTokenObtainPairSerializer(TokenObtainSerializer):
+    token_class = RefreshToken
 
     @classmethod
     def get_token(cls, user):
@@ -12,9 +21,16 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return token
 
     def validate(self, attrs):
+        # Authenticates and sets self.user; the one token pair of the login is minted below.
         super().validate(attrs)
+        return self.get_token_pair(self.user)
+
+    @classmethod
+    def get_token_pair(cls, user) -> dict:
+        token = cls.get_token(user)
 
-        token = self.get_token(self.user)
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
 
         response = {
             'access_token': str(token.access_token),
@@ -22,3 +38,40 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         }
 
         return response
+
+
+class CredentialsSerializer(serializers.Serializer):
+    """
+    The login fields of CustomTokenObtainPairSerializer, without authenticating. The async token
+    view checks the password itself, in the hashing process pool.
+    """
+    email = serializers.CharField(write_only=True)
+    password = PasswordField()
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+
+    def validate(self, attrs):
+        try:
+            refresh = self.token_class(attrs["refresh"])
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+
+        if TokenRevocationService().is_revoked(refresh.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken(_("Token has been revoked"))
+
+        return super().validate(attrs)
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    refresh_token = serializers.CharField(required=False)
+
+    def validate_refresh_token(self, value):
+        try:
+            refresh = RefreshToken(value)
+        except TokenError as e:
+            raise serializers.ValidationError(str(e))
+
+        if refresh.get(api_settings.USER_ID_CLAIM) != self.context["request"].user.id:
+            raise serializers.ValidationError("The refresh token belongs to another user.")
+        return refresh
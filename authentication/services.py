@@ -0,0 +1,187 @@
+import logging
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from authentication import revocation
+from authentication.repository import RevokedTokenRepository, RevocationFilterRepository
+from authentication.revocation import BloomFilter
+from users.models import User
+from users.repository import UserRepository
+from utils.hashing import acheck_password, amake_password, must_update
+
+logger = logging.getLogger(__name__)
+
+
+class UserCacheService:
+    """
+    Keeps a snapshot of the user fields requests need, keyed by user id, so authenticating a
+    JWT does not query users_user on every request. Saving, deleting, update()/bulk_update() and the
+    bulk import drop the snapshot (authentication.signals), so a role change is picked up on the
+    next request. Raw SQL writes are only picked up once the snapshot expires (AUTH_USER_CACHE_TTL).
+    """
+    FIELDS = ("name", "email", "role", "is_active", "is_staff", "is_superuser")
+
+    def __init__(self, user_repository: Optional[UserRepository] = None):
+        self.user_repository = user_repository or UserRepository()
+
+    @staticmethod
+    def cache_key(user_id: int) -> str:
+        return f"auth:user:{user_id}"
+
+    def get_user(self, user_id: int) -> User:
+        """
+        Returns the user from its cached snapshot, loading and caching it on a miss.
+        Raises User.DoesNotExist if there is no such user.
+        """
+        key = self.cache_key(user_id)
+        try:
+            snapshot = cache.get(key)
+        except Exception as e:
+            logger.warning(f"User cache unavailable, loading user {user_id} from the database: {e}")
+            return self.user_repository.get_user_by_id(user_id)
+
+        if snapshot is not None:
+            return self.build_user(user_id, snapshot)
+
+        user = self.user_repository.get_user_by_id(user_id)
+        try:
+            cache.set(key, {field: getattr(user, field) for field in self.FIELDS}, settings.AUTH_USER_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Failed to cache user {user_id}: {e}")
+        return user
+
+    @staticmethod
+    def build_user(user_id: int, snapshot: dict) -> User:
+        """
+        A User carrying only the cached fields. It compares equal to the stored user and can be
+        used as a foreign key, but must not be saved.
+        """
+        user = User(id=user_id, **snapshot)
+        user._state.adding = False
+        user._state.db = 'default'
+        return user
+
+    @classmethod
+    def invalidate(cls, user_id: int) -> None:
+        try:
+            cache.delete(cls.cache_key(user_id))
+        except Exception as e:
+            logger.error(f"Failed to invalidate cached user {user_id}: {e}")
+
+
+class AsyncLoginService:
+    """
+    Checks email and password for the async token view. The password check runs in the hashing
+    process pool (utils.hashing), so a login storm does not block the event loop.
+    """
+
+    def __init__(self, user_repository: Optional[UserRepository] = None):
+        self.user_repository = user_repository or UserRepository()
+
+    async def authenticate(self, email: str, password: str) -> Optional[User]:
+        """
+        Returns the user if the credentials are valid and the account may log in, None otherwise.
+        """
+        user = await self.user_repository.aget_user_by_email(email)
+        if user is None:
+            # Hash anyway, like ModelBackend, so response times do not reveal which emails exist.
+            await amake_password(password)
+            return None
+
+        if not await acheck_password(password, user.password):
+            return None
+
+        if must_update(user.password):
+            await self.user_repository.aset_password_hash(user, await amake_password(password))
+
+        return user if api_settings.USER_AUTHENTICATION_RULE(user) else None
+
+
+class TokenRevocationService:
+    """
+    Revoked tokens are stored as RevokedToken rows and added to a bloom filter shared through
+    Redis. Requests are checked against this process's copy of the filter, so a token that was
+    never revoked costs no network round trip; only filter matches are confirmed in the database.
+    """
+    # Revocations committed this long before a rebuild started are re-added after it, in case
+    # they were written to Redis while the new filter was being built.
+    REBUILD_OVERLAP = timedelta(minutes=1)
+
+    def __init__(
+            self,
+            revoked_token_repository: Optional[RevokedTokenRepository] = None,
+            filter_repository: Optional[RevocationFilterRepository] = None
+    ):
+        self.revoked_token_repository = revoked_token_repository or RevokedTokenRepository()
+        self.filter_repository = filter_repository or RevocationFilterRepository()
+
+    @transaction.atomic
+    def revoke(self, token: Token, user: User) -> None:
+        jti = token[api_settings.JTI_CLAIM]
+        expires_at = datetime.fromtimestamp(token["exp"], tz=dt_timezone.utc)
+        self.revoked_token_repository.add(jti, user, expires_at)
+
+        positions = revocation.revocation_filter.bloom_filter.add(jti)
+        transaction.on_commit(lambda: self._publish(jti, positions))
+        logger.info(f"Token {jti} of user {user.id} revoked.")
+
+    def _publish(self, jti: str, positions: list) -> None:
+        try:
+            self.filter_repository.set_bits(positions)
+        except Exception as e:
+            # The next rebuild adds it from the database; until then only this process rejects it.
+            logger.error(f"Failed to add revoked token {jti} to the shared filter: {e}")
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None:
+            return False
+        self.schedule_sync()
+        if not revocation.revocation_filter.bloom_filter.might_contain(jti):
+            return False
+        return self.revoked_token_repository.is_revoked(jti)
+
+    def schedule_sync(self) -> None:
+        """
+        Reloads the filter on a background thread when a sync is due. Requests keep checking the
+        current copy in the meantime, so they never wait on Redis.
+        """
+        if revocation.revocation_filter.claim_sync():
+            threading.Thread(target=self._load_filter, name="revocation-filter-sync", daemon=True).start()
+
+    def sync_filter(self) -> None:
+        if revocation.revocation_filter.claim_sync():
+            self._load_filter()
+
+    def _load_filter(self) -> None:
+        mirror = revocation.revocation_filter
+        try:
+            mirror.load(self.filter_repository.get_bitmap())
+        except Exception as e:
+            logger.warning(f"Failed to sync the token revocation filter, keeping the local copy: {e}")
+
+    def rebuild_filter(self) -> int:
+        """
+        Replaces the shared filter with one built from the unexpired revocations, dropping expired
+        tokens from it. Returns the number of revoked tokens in the new filter.
+        """
+        started_at = timezone.now()
+        self.revoked_token_repository.delete_expired()
+        jtis = self.revoked_token_repository.get_unexpired_jtis()
+
+        mirror = revocation.revocation_filter
+        bloom_filter = BloomFilter.from_values(mirror.bloom_filter.size_bits, mirror.bloom_filter.hash_count, jtis)
+        self.filter_repository.replace_bitmap(bytes(bloom_filter.bits))
+
+        for jti in self.revoked_token_repository.get_jtis_revoked_since(started_at - self.REBUILD_OVERLAP):
+            self.filter_repository.set_bits(bloom_filter.add(jti))
+
+        mirror.load(bytes(bloom_filter.bits))
+        return len(jtis)
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.services import UserCacheService
+from users.models import User
+from users.signals import users_updated
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    UserCacheService.invalidate(instance.id)
+
+
+@receiver(users_updated, sender=User)
+def invalidate_cached_users(sender, user_ids, **kwargs):
+    for user_id in user_ids:
+        UserCacheService.invalidate(user_id)
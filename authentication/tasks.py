@@ -0,0 +1,13 @@
+import logging
+
+from celery import shared_task
+
+from authentication.services import TokenRevocationService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def rebuild_token_revocation_filter():
+    revoked = TokenRevocationService().rebuild_filter()
+    logger.info(f"Token revocation filter rebuilt with {revoked} revoked tokens.")
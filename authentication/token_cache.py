@@ -0,0 +1,56 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from django.conf import settings
+from rest_framework_simplejwt.tokens import Token
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of bearer tokens whose signature and claims were already verified, keyed by
+    the SHA-256 digest of the raw token. An entry expires at the token's `exp` claim, so a
+    hit never returns a token that token validation would now reject as expired.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Token]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(raw_token: bytes) -> bytes:
+        return hashlib.sha256(raw_token).digest()
+
+    def get(self, raw_token: bytes) -> Optional[Token]:
+        if not self.max_size:
+            return None
+        key = self._key(raw_token)
+        with self._lock:
+            token = self._entries.get(key)
+            if token is None:
+                return None
+            if token["exp"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return token
+
+    def put(self, raw_token: bytes, token: Token) -> None:
+        if not self.max_size or "exp" not in token:
+            return
+        key = self._key(raw_token)
+        with self._lock:
+            self._entries[key] = token
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache(max_size=settings.AUTH_TOKEN_CACHE_SIZE)
@@ -1,9 +1,11 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenRefreshView
 
-from authentication.views import CustomTokenObtainPairView
+from authentication.views import AsyncTokenObtainPairView, CustomTokenObtainPairView, CustomTokenRefreshView, \
+    TokenRevokeView
 
 urlpatterns = [
     path('token/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('token/async/', AsyncTokenObtainPairView.as_view(), name='token_obtain_pair_async'),
+    path('token/refresh/', CustomTokenRefreshView.as_view(), name='token_refresh'),
+    path('token/revoke/', TokenRevokeView.as_view(), name='token_revoke'),
 ]
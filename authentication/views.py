@@ -1,7 +1,103 @@
-from rest_framework_simplejwt.views import TokenObtainPairView
+from typing import Optional
 
-from authentication.serializers import CustomTokenObtainPairSerializer
+from asgiref.sync import sync_to_async
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from authentication.serializers import CredentialsSerializer, CustomTokenObtainPairSerializer, \
+    CustomTokenRefreshSerializer, TokenRevokeSerializer
+from authentication.services import AsyncLoginService, TokenRevocationService
+from utils.async_views import AsyncAPIView
 
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
+
+
+class AsyncTokenObtainPairView(AsyncAPIView):
+    """
+    CustomTokenObtainPairView for ASGI deployments: the password check runs in the hashing process
+    pool (utils.hashing) while the event loop keeps serving other requests.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    www_authenticate_realm = "api"
+
+    def __init__(
+            self,
+            login_service: Optional[AsyncLoginService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.login_service = login_service or AsyncLoginService()
+
+    def get_authenticate_header(self, request):
+        # Like simplejwt's TokenViewBase, so failed logins are 401 rather than 403.
+        return f'{api_settings.AUTH_HEADER_TYPES[0]} realm="{self.www_authenticate_realm}"'
+
+    @swagger_auto_schema(
+        operation_description="Obtain an access and refresh token pair. Same contract as /token/, "
+                              "served asynchronously.",
+        request_body=CredentialsSerializer,
+        responses={
+            200: "Token pair",
+            400: "Validation error.",
+            401: "No active account found with the given credentials"
+        }
+    )
+    async def post(self, request):
+        serializer = CredentialsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user = await self.login_service.authenticate(**serializer.validated_data)
+        if user is None:
+            raise AuthenticationFailed(
+                TokenObtainSerializer.default_error_messages["no_active_account"],
+                "no_active_account",
+            )
+
+        tokens = await sync_to_async(CustomTokenObtainPairSerializer.get_token_pair)(user)
+        return Response(tokens, status=status.HTTP_200_OK)
+
+
+class CustomTokenRefreshView(TokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
+
+
+class TokenRevokeView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(
+            self,
+            token_revocation_service: Optional[TokenRevocationService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.token_revocation_service = token_revocation_service or TokenRevocationService()
+
+    @swagger_auto_schema(
+        operation_description="Revoke the access token of the request and, if given, its refresh token.",
+        request_body=TokenRevokeSerializer,
+        responses={
+            200: "Tokens revoked",
+            400: "Invalid refresh token",
+            401: "Authentication credentials were not provided or are invalid."
+        }
+    )
+    def post(self, request):
+        serializer = TokenRevokeSerializer(data=request.data, context={"request": request})
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        self.token_revocation_service.revoke(request.auth, request.user)
+        refresh_token = serializer.validated_data.get("refresh_token")
+        if refresh_token is not None:
+            self.token_revocation_service.revoke(refresh_token, request.user)
+        return Response({"message": "Tokens revoked."}, status=status.HTTP_200_OK)
@@ -0,0 +1,40 @@
+"""
+Helpers shared by the benchmark scripts.
+"""
+import argparse
+import os
+import time
+
+import django
+
+
+def setup_django() -> None:
+    """
+    Configures Django with the project settings. Call it before importing models.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+    django.setup()
+
+
+def argument_parser(description: str) -> argparse.ArgumentParser:
+    """
+    A parser whose help prints the script's docstring as written.
+    """
+    return argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+
+def measure(operation, iterations: int) -> list:
+    """
+    Seconds taken by each of `iterations` sequential calls to `operation`.
+    """
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def percentile(timings: list, fraction: float) -> float:
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
@@ -0,0 +1,142 @@
+"""
+Compares the WSGI entry point (gunicorn gthread workers) with the ASGI one (gunicorn uvicorn workers,
+async views from hotel_api/asgi_urls.py) at a fixed number of concurrent keep-alive connections.
+Starts both servers against the configured database, one after the other, with the same number of
+worker processes, and reports throughput and latency percentiles for a read endpoint.
+
+Load shedding and throttling limits are raised for the servers under test, so the numbers show
+serving capacity rather than admission control.
+
+    python -m benchmarks.asgi_concurrency --connections 500 --requests 20000 --workers 4 --path /rooms/
+"""
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks._common import argument_parser, percentile, setup_django
+
+setup_django()
+
+from rooms.enums import RoomStatus, RoomType  # noqa: E402
+from rooms.models import Room  # noqa: E402
+
+UNLIMITED = {
+    "LOAD_SHEDDING_MAX_IN_FLIGHT": "1000000",
+    "LOAD_SHEDDING_LOW_PRIORITY_MAX_IN_FLIGHT": "1000000",
+    "LOAD_SHEDDING_P95_LATENCY_LIMIT": "1000000",
+    "THROTTLE_RATE_IP": "1000000000/min",
+    "THROTTLE_RATE_USER": "1000000000/min",
+    "THROTTLE_RATE_PARTNER": "1000000000/min",
+}
+
+
+def server_command(entry_point: str, port: int, workers: int, threads: int) -> list:
+    command = [sys.executable, "-m", "gunicorn", "--bind", f"127.0.0.1:{port}", "--workers", str(workers),
+               "--log-level", "warning"]
+    if entry_point == "wsgi":
+        return command + ["--worker-class", "gthread", "--threads", str(threads), "hotel_api.wsgi:application"]
+    return command + ["-c", "gunicorn.conf.py", "hotel_api.asgi:application"]
+
+
+async def wait_until_listening(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple:
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {name.lower(): value.strip() for name, _, value in (line.partition(":") for line in lines[1:] if line)}
+    await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers.get("connection", "").lower() == "close"
+
+
+async def connection_worker(port: int, path: str, remaining: list, timings: list, errors: list) -> None:
+    request = f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: keep-alive\r\n\r\n".encode()
+    reader = writer = None
+    while remaining[0] > 0:
+        remaining[0] -= 1
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            status, closed = await asyncio.wait_for(read_response(reader), timeout=60)
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+            errors.append(type(e).__name__)
+            writer = None
+            continue
+        timings.append(time.perf_counter() - started)
+        if status != 200:
+            errors.append(str(status))
+        if closed:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def load(port: int, path: str, connections: int, requests: int) -> tuple:
+    await wait_until_listening(port)
+    remaining, timings, errors = [requests], [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        connection_worker(port, path, remaining, timings, errors) for _ in range(connections)
+    ))
+    return time.perf_counter() - started, timings, errors
+
+
+def run(entry_point: str, args) -> None:
+    env = {**os.environ, **UNLIMITED}
+    server = subprocess.Popen(server_command(entry_point, args.port, args.workers, args.threads), env=env)
+    try:
+        # Warm up every worker (imports, database connections) before timing.
+        asyncio.run(load(args.port, args.path, args.workers * 4, args.workers * 40))
+        elapsed, timings, errors = asyncio.run(load(args.port, args.path, args.connections, args.requests))
+    finally:
+        server.terminate()
+        server.wait()
+
+    label = f"WSGI, gthread x{args.threads}" if entry_point == "wsgi" else "ASGI, uvicorn"
+    print(f"{label:<20} {len(timings) / elapsed:10.1f} req/s {statistics.median(timings) * 1000:9.1f} ms "
+          f"{percentile(timings, 0.99) * 1000:9.1f} ms {max(timings) * 1000:9.1f} ms {len(errors):8d}")
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--threads", type=int, default=8, help="Threads per gthread worker on the WSGI side.")
+    parser.add_argument("--path", default="/rooms/")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed-rooms", type=int, default=0,
+                        help="Create rooms numbered BENCH-<n> until there are this many, so the list is not empty.")
+    args = parser.parse_args()
+
+    for n in range(Room.objects.filter(number__startswith="BENCH-").count(), args.seed_rooms):
+        Room.objects.create(number=f"BENCH-{n}", status=RoomStatus.AVAILABLE.value,
+                            room_type=RoomType.SINGLE.value, price=100)
+
+    print(f"GET {args.path}: {args.requests} requests over {args.connections} keep-alive connections, "
+          f"{args.workers} worker processes")
+    print(f"{'':<20} {'throughput':>16} {'p50':>12} {'p99':>12} {'max':>12} {'errors':>8}")
+    for entry_point in ("wsgi", "asgi"):
+        run(entry_point, args)
+
+
+if __name__ == "__main__":
+    main()
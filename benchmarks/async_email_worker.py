@@ -0,0 +1,93 @@
+"""
+Compares the prefork Celery path (a pool of worker processes, each task calling `send_mail`
+over a fresh connection) with the asyncio notification worker against a local SMTP sink.
+
+    python -m benchmarks.async_email_worker --messages 500 --prefork-concurrency 4 --async-concurrency 50
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.mail import send_mail  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+
+from benchmarks.smtp_sink import SMTPSink  # noqa: E402
+from notifications.async_worker import AsyncEmailWorker  # noqa: E402
+
+
+def _send_one(index: int) -> None:
+    send_mail(
+        subject="Booking Confirmation",
+        message=f"Your booking for Room {index} is confirmed!",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[f"client{index}@example.com"],
+    )
+
+
+def run_prefork(count: int, concurrency: int) -> None:
+    with multiprocessing.get_context("fork").Pool(processes=concurrency) as pool:
+        pool.map(_send_one, range(count), chunksize=1)
+
+
+def run_async(count: int, concurrency: int) -> None:
+    messages = [
+        {
+            "to": [f"client{i}@example{i % 10}.com"],
+            "subject": "Booking Confirmation",
+            "body": f"Your booking for Room {i} is confirmed!",
+            "attempts": 0,
+        }
+        for i in range(count)
+    ]
+    worker = AsyncEmailWorker(concurrency=concurrency, default_domain_rate=0, domain_rates={})
+
+    async def deliver():
+        await worker.send_all(messages)
+        await worker.close()
+
+    asyncio.run(deliver())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--prefork-concurrency", type=int, default=os.cpu_count())
+    parser.add_argument("--async-concurrency", type=int, default=50)
+    parser.add_argument("--connect-delay", type=float, default=0.05,
+                        help="Seconds added per connection to emulate TLS handshake and AUTH.")
+    parser.add_argument("--message-delay", type=float, default=0.02,
+                        help="Seconds the sink waits before accepting each message.")
+    args = parser.parse_args()
+
+    with SMTPSink(connect_delay=args.connect_delay, message_delay=args.message_delay) as sink:
+        with override_settings(**sink.smtp_settings):
+            results = []
+            for label, runner in (
+                    (f"prefork send_mail (processes={args.prefork_concurrency})",
+                     lambda: run_prefork(args.messages, args.prefork_concurrency)),
+                    (f"asyncio worker (concurrency={args.async_concurrency})",
+                     lambda: run_async(args.messages, args.async_concurrency)),
+            ):
+                received_before = sink.messages_received
+                started = time.perf_counter()
+                runner()
+                sink.wait_for(received_before + args.messages)
+                elapsed = time.perf_counter() - started
+                results.append((label, elapsed, sink.messages_received - received_before))
+
+    print(f"{args.messages} messages, {args.connect_delay * 1000:.0f} ms connection setup, "
+          f"{args.message_delay * 1000:.0f} ms per message")
+    for label, elapsed, received in results:
+        print(f"{label:<45} {elapsed:8.3f}s  {received / elapsed:8.1f} msg/s  {received} delivered")
+
+
+if __name__ == "__main__":
+    main()
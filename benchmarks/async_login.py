@@ -0,0 +1,102 @@
+"""
+Measures login latency under a burst of concurrent logins in one web process: a sync worker
+checking passwords on its request threads against the async token view's path, which awaits the
+check in the hashing process pool (utils/hashing.py). Also times a cheap request sent in the middle
+of the burst, which shows whether the worker stays responsive. No database access: the user is
+built in memory.
+
+    python -m benchmarks.async_login --logins 64 --threads 4 --workers 4
+"""
+import asyncio
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._common import argument_parser, percentile, setup_django
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.hashers import check_password, get_hasher  # noqa: E402
+
+from authentication.serializers import CustomTokenObtainPairSerializer  # noqa: E402
+from users.enums import UserRole  # noqa: E402
+from users.models import User  # noqa: E402
+from utils import hashing  # noqa: E402
+
+PASSWORD = "BenchmarkPass123!"
+
+
+def mint_pair(user: User) -> None:
+    token = CustomTokenObtainPairSerializer.get_token(user)
+    str(token.access_token)
+    str(token)
+
+
+def sync_burst(user: User, logins: int, threads: int) -> tuple:
+    def login(submitted: float) -> float:
+        check_password(PASSWORD, user.password)
+        mint_pair(user)
+        return time.perf_counter() - submitted
+
+    def probe(submitted: float) -> float:
+        return time.perf_counter() - submitted
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        futures = [executor.submit(login, started) for _ in range(logins)]
+        probe_future = executor.submit(probe, time.perf_counter())
+        return [future.result() for future in futures], probe_future.result()
+
+
+async def async_burst(user: User, logins: int) -> tuple:
+    async def login(submitted: float) -> float:
+        await hashing.acheck_password(PASSWORD, user.password)
+        mint_pair(user)
+        return time.perf_counter() - submitted
+
+    async def probe() -> float:
+        submitted = time.perf_counter()
+        await asyncio.sleep(0)
+        return time.perf_counter() - submitted
+
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(login(started)) for _ in range(logins)]
+    await asyncio.sleep(0)
+    probe_latency = await probe()
+    return await asyncio.gather(*tasks), probe_latency
+
+
+def report(label: str, timings: list, probe_latency: float) -> None:
+    print(f"{label:<36} {statistics.median(timings) * 1000:9.1f} ms {percentile(timings, 0.99) * 1000:9.1f} ms "
+          f"{max(timings) * 1000:9.1f} ms {probe_latency * 1000:11.2f} ms")
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--logins", type=int, default=64, help="Concurrent logins in the burst.")
+    parser.add_argument("--threads", type=int, default=4, help="Request threads of the sync worker.")
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASHING_WORKERS,
+                        help="Processes in the hashing pool.")
+    args = parser.parse_args()
+
+    settings.PASSWORD_HASHING_WORKERS = args.workers
+    hasher = get_hasher()
+    user = User(id=1, name="Benchmark User", email="benchmark@example.com", role=UserRole.CLIENT.value)
+    user.password = hasher.encode(PASSWORD, hasher.salt())
+
+    mint_pair(user)  # warm up imports and the signing key before timing
+    # Start the pool processes before timing, as a long-running web process would have.
+    asyncio.run(async_burst(user, args.workers))
+
+    print(f"{args.logins} concurrent logins, {hasher.algorithm} ({getattr(hasher, 'iterations', 'n/a')} iterations), "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'':<36} {'p50':>12} {'p99':>12} {'max':>12} {'probe request':>14}")
+    report(f"sync worker, {args.threads} threads", *sync_burst(user, args.logins, args.threads))
+    report(f"async view, {args.workers} hashing processes", *asyncio.run(async_burst(user, args.logins)))
+    hashing.get_hashing_executor().shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures per-request database latency with and without the connection pool against the configured
+PostgreSQL database. Each simulated request runs one query and then closes its connection the way
+Django does when a request finishes: without a pool that means a new connection (TCP, TLS, auth)
+for every request, with the pool the connection goes back to the pool.
+
+    python -m benchmarks.db_pool --requests 500 --threads 8
+"""
+import statistics
+import threading
+import time
+
+from benchmarks._common import argument_parser, percentile, setup_django
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.db import connections  # noqa: E402
+
+from rooms.models import Room  # noqa: E402
+
+
+def add_alias(alias: str, pooled: bool, max_size: int) -> None:
+    options = {k: v for k, v in settings.DATABASES['default'].get('OPTIONS', {}).items() if k != 'pool'}
+    if pooled:
+        options['pool'] = {**settings.DB_POOL_OPTIONS, 'min_size': max_size, 'max_size': max_size, 'name': alias}
+    settings_dict = {**settings.DATABASES['default'], 'OPTIONS': options}
+    connections.settings[alias] = connections.configure_settings({alias: settings_dict})[alias]
+
+
+def request(alias: str) -> float:
+    started = time.perf_counter()
+    Room.objects.using(alias).filter(number="101").first()
+    connections[alias].close()
+    return time.perf_counter() - started
+
+
+def measure(alias: str, requests: int, threads: int) -> tuple:
+    timings = []
+    per_thread = requests // threads
+
+    def worker():
+        for _ in range(per_thread):
+            timings.append(request(alias))
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - started, timings
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent request threads, as in one web process.")
+    parser.add_argument("--pool-size", type=int, default=settings.DB_POOL_SIZES['web']['max_size'])
+    args = parser.parse_args()
+
+    add_alias("unpooled", pooled=False, max_size=args.pool_size)
+    add_alias("pooled", pooled=True, max_size=args.pool_size)
+    for alias in ("unpooled", "pooled"):
+        request(alias)  # warm up imports and open the pool before timing
+
+    print(f"{args.requests} requests over {args.threads} threads against {settings.DATABASES['default']['HOST']}, "
+          f"pool of {args.pool_size}")
+    print(f"{'':<24} {'p50':>12} {'p99':>12} {'throughput':>16}")
+    for label, alias in (("new connection each", "unpooled"), ("connection pool", "pooled")):
+        elapsed, timings = measure(alias, args.requests, args.threads)
+        print(f"{label:<24} {statistics.median(timings) * 1000:9.2f} ms {percentile(timings, 0.99) * 1000:9.2f} ms "
+              f"{len(timings) / elapsed:10.1f} req/s")
+    connections["pooled"].close_pool()
+
+
+if __name__ == "__main__":
+    main()
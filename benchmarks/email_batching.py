@@ -0,0 +1,84 @@
+"""
+Compares per-message `send_mail` (a new SMTP connection per email, as the original tasks did)
+with `EmailBatchService.send_batch` (one connection for the whole batch) against a local SMTP sink.
+
+    python -m benchmarks.email_batching --messages 200 --connect-delay 0.05
+"""
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.mail import send_mail  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+
+from benchmarks.smtp_sink import SMTPSink  # noqa: E402
+from notifications.services import EmailBatchService  # noqa: E402
+
+
+def run_per_message(count: int) -> None:
+    for i in range(count):
+        send_mail(
+            subject="Booking Confirmation",
+            message=f"Your booking for Room {i} is confirmed!",
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[f"client{i}@example.com"],
+        )
+
+
+def run_batched(count: int, batch_size: int) -> None:
+    messages = [
+        {
+            "to": [f"client{i}@example.com"],
+            "subject": "Booking Confirmation",
+            "body": f"Your booking for Room {i} is confirmed!",
+            "attempts": 0,
+        }
+        for i in range(count)
+    ]
+    for start in range(0, count, batch_size):
+        EmailBatchService.send_batch(messages[start:start + batch_size])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--connect-delay", type=float, default=0.05,
+                        help="Seconds added per connection to emulate TLS handshake and AUTH.")
+    args = parser.parse_args()
+
+    with SMTPSink(connect_delay=args.connect_delay) as sink:
+        with override_settings(**sink.smtp_settings):
+            results = []
+            for label, runner in (
+                    ("per-message send_mail", lambda: run_per_message(args.messages)),
+                    (f"batched send_messages (batch={args.batch_size})",
+                     lambda: run_batched(args.messages, args.batch_size)),
+            ):
+                received_before = sink.messages_received
+                connections_before = sink.connections_opened
+                started = time.perf_counter()
+                runner()
+                sink.wait_for(received_before + args.messages)
+                elapsed = time.perf_counter() - started
+                results.append((
+                    label,
+                    elapsed,
+                    sink.messages_received - received_before,
+                    sink.connections_opened - connections_before,
+                ))
+
+    print(f"{args.messages} messages, {args.connect_delay * 1000:.0f} ms emulated connection setup")
+    for label, elapsed, received, connections in results:
+        print(f"{label:<40} {elapsed:8.3f}s  {received / elapsed:8.1f} msg/s  "
+              f"{connections:4d} connections  {received} delivered")
+
+
+if __name__ == "__main__":
+    main()
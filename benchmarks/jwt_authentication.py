@@ -0,0 +1,61 @@
+"""
+Measures authentication overhead per request for a bearer token that is reused across requests:
+simplejwt's JWTAuthentication (verify the signature and claims every time, one user query) against
+CachedJWTAuthentication with a warm verified-token LRU and user snapshot. The user query is replaced
+by an in-memory lookup so only CPU cost is compared; the database round trip saved comes on top.
+
+    python -m benchmarks.jwt_authentication --requests 20000
+"""
+import argparse
+import os
+import time
+from unittest.mock import patch
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+django.setup()
+
+from django.test.utils import override_settings  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from rest_framework_simplejwt.authentication import JWTAuthentication  # noqa: E402
+
+from authentication.authentication import CachedJWTAuthentication  # noqa: E402
+from authentication.serializers import CustomTokenObtainPairSerializer  # noqa: E402
+from authentication.services import UserCacheService  # noqa: E402
+from users.enums import UserRole  # noqa: E402
+from users.models import User  # noqa: E402
+
+
+def measure(authentication, request, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        authentication.authenticate(request)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    user = User(id=1, name="Benchmark User", email="benchmark@example.com", role=UserRole.CLIENT.value)
+    token = CustomTokenObtainPairSerializer.get_token(user).access_token
+    request = APIRequestFactory().get("/bookings/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    locmem = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    with override_settings(CACHES=locmem), \
+            patch('users.repository.UserRepository.get_user_by_id', return_value=user), \
+            patch.object(User.objects, 'get', return_value=user):
+        print(f"{args.requests} authentications of the same bearer token")
+        for label, authentication in (
+                ("JWTAuthentication", JWTAuthentication()),
+                ("CachedJWTAuthentication", CachedJWTAuthentication(user_cache_service=UserCacheService())),
+        ):
+            authentication.authenticate(request)
+            elapsed = measure(authentication, request, args.requests)
+            print(f"{label:<26} {elapsed:8.3f}s  {elapsed / args.requests * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measures login cost per request: checking the password with the configured hasher and minting
+the JWT pair. Compares the old serializer path (two token pairs per login) with the current one,
+and repeats the password check at other PBKDF2 iteration counts so the hasher cost can be tuned
+against measured latency. No database access: the user is built in memory.
+
+    python -m benchmarks.login_throughput --logins 20 --iterations 100000 300000 600000
+"""
+import argparse
+import os
+import statistics
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+django.setup()
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, check_password, get_hasher  # noqa: E402
+
+from authentication.serializers import CustomTokenObtainPairSerializer  # noqa: E402
+from users.enums import UserRole  # noqa: E402
+from users.models import User  # noqa: E402
+
+PASSWORD = "BenchmarkPass123!"
+
+
+def mint_pair(user: User) -> None:
+    token = CustomTokenObtainPairSerializer.get_token(user)
+    str(token.access_token)
+    str(token)
+
+
+def mint_two_pairs(user: User) -> None:
+    # TokenObtainPairSerializer.validate minted a pair, then the custom validate minted another.
+    mint_pair(user)
+    mint_pair(user)
+
+
+def measure(operation, logins: int) -> list:
+    timings = []
+    for _ in range(logins):
+        started = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def report(label: str, timings: list) -> None:
+    mean = statistics.mean(timings)
+    print(f"{label:<44} {mean * 1000:9.2f} ms  {max(timings) * 1000:9.2f} ms  {1 / mean:9.1f} logins/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--iterations", type=int, nargs="*", default=[100000, 300000, 600000],
+                        help="PBKDF2 iteration counts to compare with the configured hasher.")
+    args = parser.parse_args()
+
+    hasher = get_hasher()
+    user = User(id=1, name="Benchmark User", email="benchmark@example.com", role=UserRole.CLIENT.value)
+    user.password = hasher.encode(PASSWORD, hasher.salt())
+
+    mint_pair(user)  # warm up imports and the signing key before timing
+
+    print(f"{args.logins} logins per row, configured hasher: {hasher.algorithm} "
+          f"({getattr(hasher, 'iterations', 'n/a')} iterations)")
+    print(f"{'':<44} {'mean':>12} {'max':>12} {'throughput':>16}")
+    report("token pair x2 (previous serializer)", measure(lambda: mint_two_pairs(user), args.logins))
+    report("token pair x1", measure(lambda: mint_pair(user), args.logins))
+    report("password check + token pair x2", measure(
+        lambda: (check_password(PASSWORD, user.password), mint_two_pairs(user)), args.logins
+    ))
+    report("password check + token pair x1", measure(
+        lambda: (check_password(PASSWORD, user.password), mint_pair(user)), args.logins
+    ))
+
+    for iterations in args.iterations:
+        tuned = type("TunedPBKDF2PasswordHasher", (PBKDF2PasswordHasher,), {"iterations": iterations})()
+        encoded = tuned.encode(PASSWORD, tuned.salt())
+        report(f"password check, PBKDF2 {iterations} iterations", measure(
+            lambda: tuned.verify(PASSWORD, encoded), args.logins
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measures notification render throughput in a single worker process: templates compiled once per
+process (`notifications.messages`) against parsing the template source for every message.
+
+    python -m benchmarks.notification_templates --renders 20000
+"""
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+django.setup()
+
+from django.template import engines  # noqa: E402
+from django.template.loader import get_template  # noqa: E402
+from django.utils.safestring import mark_safe  # noqa: E402
+
+from notifications import messages  # noqa: E402
+from notifications.enums import NotificationKind  # noqa: E402
+
+PAYLOADS = {
+    NotificationKind.BOOKING_CREATION: {
+        "booking_id": 1, "room_number": "101", "check_in_date": "2024-11-01", "check_out_date": "2024-11-03",
+    },
+    NotificationKind.BOOKING_MODIFICATION: {
+        "booking_id": 1,
+        "room_number_before": "101", "check_in_date_before": "2024-11-01", "check_out_date_before": "2024-11-03",
+        "room_number_after": "102", "check_in_date_after": "2024-11-02", "check_out_date_after": "2024-11-04",
+    },
+    NotificationKind.BOOKING_CONFIRMATION: {"booking_id": 1, "room_number": "101", "check_in_date": "2024-11-01"},
+    NotificationKind.BOOKING_CANCELLATION: {"booking_id": 1, "room_number": "101", "check_in_date": "2024-11-01"},
+    NotificationKind.CHECK_IN: {"booking_id": 1, "room_number": "101"},
+    NotificationKind.CHECK_OUT: {"booking_id": 1, "room_number": "101"},
+    NotificationKind.NO_SHOW: {"booking_id": 1, "room_number": "101"},
+}
+
+
+def template_source(name: str) -> str:
+    return get_template(name).template.source
+
+
+def render_parsing_every_time(kind: NotificationKind, details: dict, sources: dict) -> None:
+    engine = engines['django']
+    name = kind.value.lower()
+    engine.from_string(sources[f"notifications/{name}.txt"]).render(details)
+    html = engine.from_string(sources[f"notifications/{name}.html"]).render(details)
+    engine.from_string(sources[messages.LAYOUT_TEMPLATE]).render({
+        "sections": [{"subject": messages.SUBJECTS[kind], "html": mark_safe(html)}],
+    })
+
+
+def render_precompiled(kind: NotificationKind, details: dict, sources: dict) -> None:
+    messages.render_notification(kind, details)
+
+
+def measure(renderer, renders: int, sources: dict) -> float:
+    kinds = list(PAYLOADS)
+    started = time.perf_counter()
+    for i in range(renders):
+        kind = kinds[i % len(kinds)]
+        renderer(kind, PAYLOADS[kind], sources)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=20000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    messages.load_templates()
+    load_time = time.perf_counter() - started
+    sources = {name: template_source(name) for name in messages._template_names()}
+
+    print(f"{args.renders} renders (text + HTML) cycling over {len(PAYLOADS)} notification kinds, "
+          f"templates loaded in {load_time * 1000:.1f} ms")
+    for label, renderer in (
+            ("parse template on every render", render_parsing_every_time),
+            ("precompiled once per process", render_precompiled),
+    ):
+        elapsed = measure(renderer, args.renders, sources)
+        print(f"{label:<34} {elapsed:8.3f}s  {args.renders / elapsed:10.1f} renders/s")
+
+
+if __name__ == "__main__":
+    main()
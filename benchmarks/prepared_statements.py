@@ -0,0 +1,105 @@
+"""
+Measures the hot repository queries against the configured PostgreSQL database with and without
+server-side prepared statements (DB_PREPARED_STATEMENTS, utils/prepared_statements.py), on one
+connection. Reports round-trip latency per query, the planning time PostgreSQL reports for the plain
+statement, and how often each prepared statement ran from a generic (cached) or a custom plan.
+
+The check-in and check-out updates run for a client id that matches no booking, so no row changes.
+
+    python -m benchmarks.prepared_statements --iterations 2000
+"""
+import re
+import statistics
+from datetime import timedelta
+
+from benchmarks._common import argument_parser, measure, percentile, setup_django
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from bookings.models import Booking  # noqa: E402
+from bookings.repository import BookingRepository  # noqa: E402
+from checkins.repository import CheckInCheckOutRepository  # noqa: E402
+from rooms.enums import RoomType  # noqa: E402
+from rooms.repository import RoomRepository  # noqa: E402
+from users.models import User  # noqa: E402
+from utils.exceptions import RoomNotAvailableForSelectedDatesException  # noqa: E402
+
+
+def hot_queries(booking_id: int) -> dict:
+    today = timezone.localdate()
+    nobody = User(id=0)
+
+    def available_room():
+        try:
+            RoomRepository.get_available_room(room_type=RoomType.SINGLE.value)
+        except RoomNotAvailableForSelectedDatesException:
+            pass
+
+    def booking_by_id():
+        try:
+            BookingRepository.get_booking_by_id(booking_id)
+        except Booking.DoesNotExist:
+            pass
+
+    return {
+        "get_available_room": available_room,
+        "get_booking_by_id": booking_by_id,
+        "is_room_available_excluding_booking": lambda: BookingRepository.is_room_available_excluding_booking(
+            room_id=1, check_in_date=today, check_out_date=today + timedelta(days=3),
+            exclude_booking_id=booking_id),
+        "complete_check_in": lambda: CheckInCheckOutRepository.complete_check_in(booking_id, client_id=0),
+        "complete_check_out": lambda: CheckInCheckOutRepository.complete_check_out(booking_id, client=nobody),
+    }
+
+
+def planning_time(query) -> float:
+    with CaptureQueriesContext(connection) as captured:
+        query()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (ANALYZE, SUMMARY) {captured.captured_queries[-1]['sql']}")
+        plan = "\n".join(row[0] for row in cursor.fetchall())
+    return float(re.search(r"Planning Time: ([\d.]+) ms", plan).group(1))
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument("--iterations", type=int, default=2000, help="Executions of each query per mode.")
+    parser.add_argument("--booking-id", type=int, default=None, help="Defaults to the first booking, if any.")
+    args = parser.parse_args()
+
+    booking_id = args.booking_id
+    if booking_id is None:
+        booking_id = Booking.objects.values_list("id", flat=True).order_by("id").first() or 0
+    queries = hot_queries(booking_id)
+
+    print(f"{args.iterations} executions per query on one connection to {settings.DATABASES['default']['HOST']}")
+    print(f"{'':<38} {'plain p50':>12} {'prepared p50':>14} {'plain p99':>12} {'prepared p99':>14} "
+          f"{'planning':>12}")
+    for name, query in queries.items():
+        settings.DB_PREPARED_STATEMENTS = False
+        query()  # warm up before timing
+        plain = measure(query, args.iterations)
+        planning = planning_time(query)
+
+        settings.DB_PREPARED_STATEMENTS = True
+        query()
+        prepared = measure(query, args.iterations)
+
+        print(f"{name:<38} {statistics.median(plain) * 1000:9.3f} ms {statistics.median(prepared) * 1000:11.3f} ms "
+              f"{percentile(plain, 0.99) * 1000:9.3f} ms {percentile(prepared, 0.99) * 1000:11.3f} ms "
+              f"{planning:9.3f} ms")
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT generic_plans, custom_plans, statement FROM pg_prepared_statements")
+        print("\nPrepared on this connection (generic plans, custom plans, statement):")
+        for generic_plans, custom_plans, statement in cursor.fetchall():
+            print(f"{generic_plans:>8} {custom_plans:>8}  {' '.join(statement.split())[:100]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Minimal SMTP stand-in server for benchmarks.
+
+It speaks just enough SMTP for Django's EmailBackend and aiosmtplib (EHLO/HELO, MAIL, RCPT,
+DATA, RSET, NOOP, QUIT), accepts every message and counts it. `connect_delay` is added before
+the greeting of every new connection to stand in for the TLS handshake and AUTH round trips
+of a real provider, which a plain local socket does not have. `message_delay` is added before
+accepting each message to stand in for the provider's processing time.
+"""
+import asyncio
+import threading
+import time
+
+
+class SMTPSink:
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            connect_delay: float = 0.0,
+            message_delay: float = 0.0
+    ):
+        self.host = host
+        self.port = port
+        self.connect_delay = connect_delay
+        self.message_delay = message_delay
+        self.messages_received = 0
+        self.connections_opened = 0
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    async def _handle(self, reader, writer):
+        self.connections_opened += 1
+        if self.connect_delay:
+            await asyncio.sleep(self.connect_delay)
+        writer.write(b"220 smtp-sink ESMTP\r\n")
+        await writer.drain()
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode(errors="replace").strip().upper()
+
+            if command.startswith("EHLO"):
+                writer.write(b"250-smtp-sink\r\n250-8BITMIME\r\n250 SIZE 10485760\r\n")
+            elif command.startswith("DATA"):
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                while (await reader.readline()) not in (b".\r\n", b".\n", b""):
+                    pass
+                if self.message_delay:
+                    await asyncio.sleep(self.message_delay)
+                self.messages_received += 1
+                writer.write(b"250 OK queued\r\n")
+            elif command.startswith("QUIT"):
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+
+        writer.close()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self) -> "SMTPSink":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def wait_for(self, count: int, timeout: float = 30.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self.messages_received < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    @property
+    def smtp_settings(self) -> dict:
+        """
+        Django email settings pointing at this sink, for use with override_settings.
+        """
+        return dict(
+            EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            EMAIL_HOST=self.host,
+            EMAIL_PORT=self.port,
+            EMAIL_USE_TLS=False,
+            EMAIL_USE_SSL=False,
+            EMAIL_HOST_USER='',
+            EMAIL_HOST_PASSWORD='',
+        )
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
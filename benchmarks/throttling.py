@@ -0,0 +1,59 @@
+"""
+Measures the per-request overhead of the sliding-window throttles against the configured Redis
+(REDIS_URL): one EVALSHA round trip per throttled request. Keys use a separate benchmark scope.
+
+    python -m benchmarks.throttling --requests 5000 --clients 50
+"""
+import argparse
+import os
+import statistics
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+django.setup()
+
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from rest_framework.views import APIView  # noqa: E402
+
+from utils.redis_client import get_redis_client  # noqa: E402
+from utils.throttling import IPRateThrottle  # noqa: E402
+
+
+class BenchmarkThrottle(IPRateThrottle):
+    scope = 'benchmark'
+    rate = '1000000/min'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=50, help="Distinct client IPs, one window each.")
+    args = parser.parse_args()
+
+    factory = APIRequestFactory()
+    requests = [
+        APIView().initialize_request(factory.get("/rooms/", REMOTE_ADDR=f"10.0.{i // 256}.{i % 256}"))
+        for i in range(args.clients)
+    ]
+    throttle = BenchmarkThrottle()
+    throttle.allow_request(requests[0], None)
+
+    timings = []
+    for i in range(args.requests):
+        started = time.perf_counter()
+        throttle.allow_request(requests[i % args.clients], None)
+        timings.append(time.perf_counter() - started)
+
+    redis = get_redis_client()
+    redis.delete(*redis.keys("throttle:benchmark:*"))
+
+    timings.sort()
+    print(f"{args.requests} throttled requests over {args.clients} client windows")
+    print(f"mean {statistics.mean(timings) * 1000:.3f} ms  p50 {timings[len(timings) // 2] * 1000:.3f} ms  "
+          f"p99 {timings[int(len(timings) * 0.99)] * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.2 on 2026-10-18 22:35
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+CHECK_IN_OUT_FIELDS = ('check_in_status', 'check_out_status', 'check_in_timestamp', 'check_out_timestamp')
+
+
+def copy_check_in_out_to_booking(apps, schema_editor):
+    Booking = apps.get_model('bookings', 'Booking')
+    CheckInCheckOut = apps.get_model('checkins', 'CheckInCheckOut')
+
+    check_in_out = CheckInCheckOut.objects.filter(booking_id=OuterRef('pk'))
+    Booking.objects.filter(id__in=CheckInCheckOut.objects.values('booking_id')).update(**{
+        field: Subquery(check_in_out.values(field)[:1]) for field in CHECK_IN_OUT_FIELDS
+    })
+
+
+def copy_booking_to_check_in_out(apps, schema_editor):
+    Booking = apps.get_model('bookings', 'Booking')
+    CheckInCheckOut = apps.get_model('checkins', 'CheckInCheckOut')
+
+    CheckInCheckOut.objects.bulk_create(
+        [
+            CheckInCheckOut(booking_id=booking['id'], **{field: booking[field] for field in CHECK_IN_OUT_FIELDS})
+            for booking in Booking.objects.filter(check_in_status__isnull=False).values('id', *CHECK_IN_OUT_FIELDS)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_initial'),
+        ('checkins', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='check_in_status',
+            field=models.CharField(blank=True, choices=[('PENDING', 'Pending'), ('COMPLETED', 'Completed'), ('CANCELED', 'Canceled')], max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='check_in_timestamp',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='check_out_status',
+            field=models.CharField(blank=True, choices=[('PENDING', 'Pending'), ('COMPLETED', 'Completed'), ('CANCELED', 'Canceled')], max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='check_out_timestamp',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(copy_check_in_out_to_booking, copy_booking_to_check_in_out),
+    ]
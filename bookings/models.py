@@ -1,6 +1,7 @@
 from django.db import models
 
 from bookings.enums import BookingStatus
+from checkins.enums import CheckInStatus, CheckOutStatus
 from rooms.models import RoomStatus
 
 
@@ -13,10 +14,23 @@ class Booking(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     cancelled_at = models.DateTimeField(null=True, blank=True)
+    check_in_timestamp = models.DateTimeField(null=True, blank=True)
+    check_out_timestamp = models.DateTimeField(null=True, blank=True)
+    check_in_status = models.CharField(max_length=20, choices=CheckInStatus.choices(), null=True, blank=True)
+    check_out_status = models.CharField(max_length=20, choices=CheckOutStatus.choices(), null=True, blank=True)
 
     def __str__(self):
         return f"Reservation for {self.client.email} - Room {self.room.number}"
 
+    @property
+    def check_in_out(self):
+        """
+        Compatibility with the former CheckInCheckOut relation. The check-in/out fields now live on
+        the booking and are set when it is confirmed, so this returns the booking itself, or None
+        while there is nothing to check in.
+        """
+        return self if self.check_in_status is not None else None
+
     class Meta:
         unique_together = ('check_in_date', 'room')
 
@@ -1,15 +1,17 @@
 from datetime import datetime, date
 
-from django.db.models import QuerySet
+from django.db.models import QuerySet, Q, Min
 from django.utils import timezone
 
-from checkins.enums import CheckInStatus
+from checkins.enums import CheckInStatus, CheckOutStatus
 from users.models import User
 from bookings.models import Booking
 from rooms.enums import RoomStatus
 from rooms.models import Room
 from bookings.enums import BookingStatus
-from typing import Optional, List
+from typing import Optional, List, Dict
+from utils.db_router import replica_for_read
+from utils.prepared_statements import prepared_statements
 
 
 class BookingRepository:
@@ -38,6 +40,7 @@ class BookingRepository:
         return Booking.objects.filter(client=client)
 
     @staticmethod
+    @prepared_statements()
     def get_booking_by_id(
             booking_id: int
     ) -> Booking:
@@ -67,6 +70,7 @@ class BookingRepository:
         )
 
     @staticmethod
+    @replica_for_read
     def get_filtered_bookings(filter_criteria: dict):
         """
         Fetch bookings based on filter criteria.
@@ -74,6 +78,12 @@ class BookingRepository:
         queryset = Booking.objects.filter(**filter_criteria)
         return queryset
 
+    @staticmethod
+    @replica_for_read
+    async def aget_filtered_bookings(filter_criteria: dict) -> List[Booking]:
+        queryset = Booking.objects.filter(**filter_criteria).select_related("room", "client")
+        return [booking async for booking in queryset]
+
     @staticmethod
     def get_no_show_bookings(threshold_time):
         return Booking.objects.filter(
@@ -92,24 +102,7 @@ class BookingRepository:
         booking.save()
 
     @staticmethod
-    def get_completed_checkouts(current_time: datetime) -> List[Booking]:
-        """
-        Retrieves bookings that are completed and have a past checkout timestamp.
-        """
-        return Booking.objects.filter(
-            status=BookingStatus.COMPLETED.value,
-            check_in_out__check_out_timestamp__lte=current_time
-        )
-
-    @staticmethod
-    def free_up_room(booking: Booking) -> None:
-        """
-        Frees up the room by setting its status to AVAILABLE.
-        """
-        booking.room.status = RoomStatus.AVAILABLE.value
-        booking.room.save()
-
-    @staticmethod
+    @prepared_statements()
     def is_room_available_excluding_booking(
             room_id: int,
             check_in_date: date,
@@ -128,9 +121,59 @@ class BookingRepository:
     @staticmethod
     def confirm_booking(booking: Booking) -> None:
         booking.status = BookingStatus.CONFIRMED.value
+        booking.check_in_status = CheckInStatus.PENDING.value
+        booking.check_out_status = CheckOutStatus.PENDING.value
         booking.save()
 
     @staticmethod
-    def update_booking_status_to_complete(booking: Booking) -> None:
-        booking.status = BookingStatus.COMPLETED.value
-        booking.save()
+    def get_booking_with_room_and_client(booking_id: int) -> Booking:
+        return Booking.objects.select_related('room', 'client').get(id=booking_id)
+
+    @staticmethod
+    def get_bookings_with_room_and_client(booking_ids: List[int]) -> List[Booking]:
+        return list(Booking.objects.select_related('room', 'client').filter(id__in=booking_ids))
+
+    @staticmethod
+    def get_front_desk_bookings(day: date) -> List[Booking]:
+        """
+        Everything the front desk board shows for a day, in one query: confirmed arrivals,
+        guests currently in house and departures of checked in guests.
+        """
+        return list(
+            Booking.objects
+            .select_related('room', 'client')
+            .filter(
+                Q(check_in_date=day, status=BookingStatus.CONFIRMED.value)
+                | Q(check_in_status=CheckInStatus.COMPLETED.value, check_out_status=CheckOutStatus.PENDING.value)
+                | Q(check_out_date=day, check_in_status=CheckInStatus.COMPLETED.value)
+            )
+        )
+
+    @staticmethod
+    def get_next_arrival_dates(room_types: List[str], day: date) -> Dict[str, date]:
+        """
+        The earliest upcoming check-in date for each room type, in one aggregate query.
+        """
+        return dict(
+            Booking.objects
+            .filter(
+                room__room_type__in=room_types,
+                check_in_date__gte=day,
+                status__in=[BookingStatus.PENDING.value, BookingStatus.CONFIRMED.value]
+            )
+            .values_list('room__room_type')
+            .annotate(next_arrival=Min('check_in_date'))
+        )
+
+    @staticmethod
+    def lock_bookings(booking_ids: List[int]) -> List[Booking]:
+        """
+        Fetches the bookings with their room and client in one query, locking the booking rows.
+        Must be called inside a transaction.
+        """
+        return list(
+            Booking.objects
+            .select_related('room', 'client')
+            .select_for_update(of=('self',))
+            .filter(id__in=booking_ids)
+        )
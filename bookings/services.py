@@ -1,6 +1,6 @@
 import logging
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
@@ -8,7 +8,8 @@ from django.db import transaction
 from bookings.enums import BookingStatus
 from bookings.models import Booking
 from bookings.repository import BookingRepository
-from checkins.repository import CheckInCheckOutRepository
+from checkins.kiosk import KioskTokenService
+from checkins.services import FrontDeskBoardService
 from rooms.enums import RoomStatus, RoomType
 from rooms.repository import RoomRepository
 from users.enums import UserRole
@@ -26,12 +27,15 @@ class BookingService:
             self,
             booking_repository: Optional[BookingRepository] = None,
             room_repository: Optional[RoomRepository] = None,
-            check_in_out_repository: Optional[CheckInCheckOutRepository] = None
+            front_desk_board_service: Optional[FrontDeskBoardService] = None,
+            kiosk_token_service: Optional[KioskTokenService] = None
     ):
         self.booking_repository = booking_repository or BookingRepository()
         self.room_repository = room_repository or RoomRepository()
-        self.check_in_out_repository = check_in_out_repository or CheckInCheckOutRepository()
+        self.front_desk_board_service = front_desk_board_service or FrontDeskBoardService(self.booking_repository)
+        self.kiosk_token_service = kiosk_token_service or KioskTokenService()
 
+    @transaction.atomic
     def create_booking(
             self,
             client: User,
@@ -56,10 +60,12 @@ class BookingService:
             room.save()
 
             EmailService.send_booking_creation(client.email, {
+                "booking_id": booking.id,
                 "room_number": room.number,
                 "check_in_date": check_in_date,
                 "check_out_date": check_out_date
             })
+            self.front_desk_board_service.refresh_after_commit([booking.id])
             return booking
 
         except RoomNotAvailableForSelectedDatesException as e:
@@ -69,6 +75,7 @@ class BookingService:
             logger.exception("Failed to create booking")
             raise e
 
+    @transaction.atomic
     def modify_booking(
             self,
             booking_id: int,
@@ -85,7 +92,6 @@ class BookingService:
             original_room_number = booking.room.number
             original_check_in_date = booking.check_in_date
             original_check_out_date = booking.check_out_date
-            original_room_price = booking.room.price
 
             if booking.room.room_type != room_type:
                 new_room = self.room_repository.get_available_room(room_type=room_type)
@@ -111,16 +117,16 @@ class BookingService:
             EmailService.send_booking_modification(
                 booking.client.email,
                 {
+                    "booking_id": booking.id,
                     "room_number_before": original_room_number,
                     "check_in_date_before": original_check_in_date,
                     "check_out_date_before": original_check_out_date,
-                    "room_price_before": original_room_price,
                     "room_number_after": booking.room.number,
                     "check_in_date_after": new_check_in_date,
                     "check_out_date_after": new_check_out_date,
-                    "room_price_after": booking.room.price,
                 }
             )
+            self.front_desk_board_service.refresh_after_commit([booking.id])
             return booking
 
         except RoomNotAvailableForSelectedDatesException:
@@ -147,15 +153,19 @@ class BookingService:
                 raise UnauthorizedOrInvalidBookingException()
 
             self.booking_repository.confirm_booking(booking)
-
-            self.check_in_out_repository.create_check_in_out(booking)
+            # Presented at the kiosk or in the mobile app to check in without logging in.
+            booking.kiosk_token = self.kiosk_token_service.issue(booking)
 
             EmailService.send_booking_confirmation(booking.client.email, {
+                "booking_id": booking.id,
                 "room_number": booking.room.number,
-                "check_in_date": booking.check_in_date
+                "check_in_date": booking.check_in_date,
+                "kiosk_token": booking.kiosk_token
             })
 
-            logger.info(f"Booking {booking.id} confirmed and CheckInCheckOut created for client {booking.client.id}")
+            self.front_desk_board_service.refresh_after_commit([booking.id])
+
+            logger.info(f"Booking {booking.id} confirmed and ready for check-in for client {booking.client.id}")
             return booking
 
         except UnauthorizedOrInvalidBookingException as e:
@@ -181,10 +191,13 @@ class BookingService:
             self.booking_repository.cancel_booking(booking)
 
             EmailService.send_booking_cancellation(booking.client.email, {
+                "booking_id": booking.id,
                 "room_number": booking.room.number,
                 "check_in_date": booking.check_in_date
             })
 
+            self.front_desk_board_service.refresh_after_commit([booking.id])
+
             logger.info(f"Booking {booking.id} canceled for client {booking.client.id}")
             return booking
 
@@ -203,43 +216,68 @@ class BookingService:
         Retrieve bookings based on filters. Clients see only their bookings, while managers and admins see all.
         """
         try:
-            filter_criteria = {}
-
-            if user.role == UserRole.CLIENT.value:
-                filter_criteria["client"] = user
-
-            if filters.get("check_in_date"):
-                check_in_date = filters["check_in_date"]
-                if isinstance(check_in_date, str):
-                    try:
-                        check_in_date = datetime.strptime(check_in_date, "%d/%m/%Y").date()
-                    except ValueError:
-                        raise ValidationError("Invalid check-in date format. Use dd/mm/yyyy.")
-                filter_criteria["check_in_date__gte"] = check_in_date
-
-            if filters.get("check_out_date"):
-                check_out_date = filters["check_out_date"]
-                if isinstance(check_out_date, str):
-                    try:
-                        check_out_date = datetime.strptime(check_out_date, "%d/%m/%Y").date()
-                    except ValueError:
-                        raise ValidationError("Invalid check-out date format. Use dd/mm/yyyy.")
-                filter_criteria["check_out_date__lte"] = check_out_date
-
-            if filters.get("status"):
-                filter_criteria["status"] = filters["status"]
-            if filters.get("room_type"):
-                filter_criteria["room__room_type"] = filters["room_type"]
-
-            if user.role in [UserRole.STAFF.value, UserRole.ADMIN.value] and filters.get("client_id"):
-                filter_criteria["client_id"] = filters["client_id"]
-
+            filter_criteria = self._build_filter_criteria(filters, user)
             return self.booking_repository.get_filtered_bookings(filter_criteria)
 
         except Exception as e:
             logger.exception(f"Failed to retrieve filtered bookings with filters: {filters}")
             raise e
 
+    async def aget_filtered_bookings(
+            self,
+            filters: dict,
+            user: User
+    ) -> List[Booking]:
+        """
+        get_filtered_bookings for async views. Rooms and clients are loaded in the same query, since
+        serializing them lazily is not allowed from async code.
+        """
+        try:
+            filter_criteria = self._build_filter_criteria(filters, user)
+            return await self.booking_repository.aget_filtered_bookings(filter_criteria)
+
+        except Exception as e:
+            logger.exception(f"Failed to retrieve filtered bookings with filters: {filters}")
+            raise e
+
+    @staticmethod
+    def _build_filter_criteria(
+            filters: dict,
+            user: User
+    ) -> dict:
+        filter_criteria = {}
+
+        if user.role == UserRole.CLIENT.value:
+            filter_criteria["client"] = user
+
+        if filters.get("check_in_date"):
+            check_in_date = filters["check_in_date"]
+            if isinstance(check_in_date, str):
+                try:
+                    check_in_date = datetime.strptime(check_in_date, "%d/%m/%Y").date()
+                except ValueError:
+                    raise ValidationError("Invalid check-in date format. Use dd/mm/yyyy.")
+            filter_criteria["check_in_date__gte"] = check_in_date
+
+        if filters.get("check_out_date"):
+            check_out_date = filters["check_out_date"]
+            if isinstance(check_out_date, str):
+                try:
+                    check_out_date = datetime.strptime(check_out_date, "%d/%m/%Y").date()
+                except ValueError:
+                    raise ValidationError("Invalid check-out date format. Use dd/mm/yyyy.")
+            filter_criteria["check_out_date__lte"] = check_out_date
+
+        if filters.get("status"):
+            filter_criteria["status"] = filters["status"]
+        if filters.get("room_type"):
+            filter_criteria["room__room_type"] = filters["room_type"]
+
+        if user.role in [UserRole.STAFF.value, UserRole.ADMIN.value] and filters.get("client_id"):
+            filter_criteria["client_id"] = filters["client_id"]
+
+        return filter_criteria
+
     def get_booking_by_id(
             self,
             booking_id: int,
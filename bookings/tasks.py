@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 from celery import shared_task
 from django.conf import settings
 from django.core.mail import send_mail
@@ -6,11 +7,14 @@ from django.utils import timezone
 from datetime import timedelta
 from bookings.services import BookingService
 from bookings.repository import BookingRepository
+from notifications.enums import NotificationKind
+from notifications.messages import render_notification
+from notifications.services import EmailBatchService, NotificationDigestService
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task
+@shared_task(ignore_result=True)
 def expire_pending_bookings():
     booking_service = BookingService()
     booking_repository = BookingRepository()
@@ -25,59 +29,57 @@ def expire_pending_bookings():
             logger.error(f"Failed to cancel booking {booking.id}: {e}")
 
 
-@shared_task
-def send_booking_email(client_email: str, subject: str, message: str):
+@shared_task(ignore_result=True)
+def send_booking_email(client_email: str, subject: str, message: str, html_message: Optional[str] = None):
+    if settings.EMAIL_BATCHING_ENABLED:
+        EmailBatchService().enqueue(client_email, subject, message, html_message)
+        logger.info(f"Email '{subject}' to {client_email} buffered for batch delivery.")
+        return
+
     try:
         send_mail(
             subject=subject,
             message=message,
             from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[client_email],
+            html_message=html_message,
         )
         logger.info(f"Email '{subject}' sent to {client_email}.")
     except Exception as e:
         logger.error(f"Failed to send email '{subject}' to {client_email}: {e}")
 
 
-@shared_task
+def notify_client(client_email: str, kind: NotificationKind, booking_details: dict):
+    if settings.NOTIFICATION_DIGEST_WINDOW:
+        NotificationDigestService().add(client_email, kind, booking_details)
+        logger.info(f"{kind.value} notification for {client_email} held for the digest.")
+        return
+
+    subject, message, html_message = render_notification(kind, booking_details)
+    send_booking_email(client_email, subject, message, html_message)
+
+
+@shared_task(ignore_result=True)
 def send_booking_confirmation_email(client_email: str, booking_details: dict):
-    subject = "Booking Confirmation"
-    message = f"Your booking for Room {booking_details['room_number']} is confirmed!"
-    send_booking_email(client_email, subject, message)
+    notify_client(client_email, NotificationKind.BOOKING_CONFIRMATION, booking_details)
 
 
-@shared_task
+@shared_task(ignore_result=True)
 def send_booking_cancellation_email(client_email: str, booking_details: dict):
-    subject = "Booking Cancellation"
-    message = f"Your booking for Room {booking_details['room_number']} has been canceled."
-    send_booking_email(client_email, subject, message)
+    notify_client(client_email, NotificationKind.BOOKING_CANCELLATION, booking_details)
 
 
-@shared_task
+@shared_task(ignore_result=True)
 def send_booking_creation_email(client_email: str, booking_details: dict):
-    subject = "Booking Created"
-    message = f"Your booking for Room {booking_details['room_number']} is pending confirmation."
-    send_booking_email(client_email, subject, message)
+    notify_client(client_email, NotificationKind.BOOKING_CREATION, booking_details)
 
 
-@shared_task
+@shared_task(ignore_result=True)
 def send_booking_modification_email(client_email: str, booking_details: dict):
-    subject = "Booking Modification"
-    message = (
-        f"Your booking has been modified.\n\n"
-        f"Before Modification:\n"
-        f"Room Number: {booking_details['room_number_before']}\n"
-        f"Check-in Date: {booking_details['check_in_date_before']}\n"
-        f"Check-out Date: {booking_details['check_out_date_before']}\n\n"
-        f"After Modification:\n"
-        f"Room Number: {booking_details['room_number_after']}\n"
-        f"Check-in Date: {booking_details['check_in_date_after']}\n"
-        f"Check-out Date: {booking_details['check_out_date_after']}"
-    )
-    send_booking_email(client_email, subject, message)
-
-
-@shared_task
+    notify_client(client_email, NotificationKind.BOOKING_MODIFICATION, booking_details)
+
+
+@shared_task(ignore_result=True)
 def manage_room_availability():
     now = timezone.now()
     no_show_threshold = now - timedelta(hours=24)
@@ -89,8 +91,4 @@ def manage_room_availability():
         booking_repository.mark_booking_as_no_show(booking)
         logger.info(f"Booking {booking.id} marked as NO_SHOW and room {booking.room.id} set to AVAILABLE.")
 
-    # Free up rooms for completed checkouts
-    completed_checkouts = booking_repository.get_completed_checkouts(now)
-    for booking in completed_checkouts:
-        booking_repository.free_up_room(booking)
-        logger.info(f"Room {booking.room.id} freed up after booking {booking.id} checkout.")
+    # Rooms freed by check-outs go through housekeeping (housekeeping.services) instead of this sweep.
@@ -13,6 +13,7 @@ from bookings.serializers import (
     BookingFilterSerializer, BookingUpdateSerializer
 )
 from bookings.services import BookingService
+from utils.async_views import AsyncAPIView, same_schema_as, sync_handler
 from utils.exceptions import RoomNotAvailableForSelectedDatesException, InvalidBookingModificationException, \
     UnauthorizedCancellationException, AlreadyCanceledException, \
     UnauthorizedOrInvalidBookingException
@@ -191,6 +192,24 @@ class ConfirmBookingView(APIView):
         try:
             booking = self.booking_service.confirm_booking(booking_id, request.user)
             serializer = BookingSerializer(booking)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response({**serializer.data, "kiosk_token": booking.kiosk_token}, status=status.HTTP_200_OK)
         except UnauthorizedOrInvalidBookingException as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncBookingListView(AsyncAPIView, BookingListView):
+    """
+    BookingListView for the ASGI entry point (hotel_api/asgi_urls.py): bookings are read with the
+    async ORM, booking creation keeps the sync handler and runs in a thread.
+    """
+
+    @same_schema_as(BookingListView.get)
+    async def get(self, request):
+        bookings = await self.booking_service.aget_filtered_bookings(
+            request.query_params.dict(),
+            request.user
+        )
+        serializer = BookingSerializer(bookings, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    post = sync_handler(BookingListView.post)
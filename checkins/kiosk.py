@@ -0,0 +1,42 @@
+from datetime import date
+from typing import Optional, Tuple
+
+from django.core.signing import BadSignature, Signer
+from django.utils import timezone
+
+from bookings.models import Booking
+from utils.exceptions import CheckInNotOpenException, InvalidKioskTokenException
+
+
+class KioskTokenService:
+    """
+    Signed self-service check-in tokens. A token carries the booking id, the client id and the
+    days check-in is open, so a kiosk check-in is authorized from the signature alone.
+    """
+    SALT = "checkins.kiosk"
+
+    def __init__(self, signer: Optional[Signer] = None):
+        self.signer = signer or Signer(salt=self.SALT)
+
+    def issue(self, booking: Booking) -> str:
+        return self.signer.sign_object([
+            booking.id,
+            booking.client_id,
+            booking.check_in_date.toordinal(),
+            booking.check_out_date.toordinal(),
+        ])
+
+    def verify(self, token: str, day: Optional[date] = None) -> Tuple[int, int]:
+        """
+        Returns the booking id and client id of a token that is valid today.
+        Check-in opens on the check-in date and closes on the check-out date.
+        """
+        try:
+            booking_id, client_id, opens_on, closes_on = self.signer.unsign_object(token)
+        except (BadSignature, ValueError):
+            raise InvalidKioskTokenException()
+
+        today = (day or timezone.localdate()).toordinal()
+        if not opens_on <= today < closes_on:
+            raise CheckInNotOpenException()
+        return booking_id, client_id
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 22:35
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_booking_check_in_out_fields'),
+        ('checkins', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='CheckInCheckOut',
+        ),
+    ]
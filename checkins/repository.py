@@ -1,29 +1,73 @@
-from typing import Optional
+from typing import List
 from django.utils import timezone
 
-from bookings.models import Booking
+from bookings.enums import BookingStatus
 from checkins.enums import CheckInStatus, CheckOutStatus
-from checkins.models import CheckInCheckOut
+from bookings.models import Booking
+from users.models import User
+from utils.prepared_statements import prepared_statements
 
 
 class CheckInCheckOutRepository:
+    """
+    Check-in and check-out state is stored on the booking row, so every transition
+    is a single UPDATE on bookings_booking.
+    """
 
     @staticmethod
-    def create_check_in_out(booking: Booking) -> CheckInCheckOut:
-        return CheckInCheckOut.objects.create(booking=booking)
+    @prepared_statements()
+    def complete_check_in(booking_id: int, client_id: int) -> bool:
+        """
+        Checks in a confirmed, not yet checked in booking of the client with a single conditional UPDATE,
+        completing the booking at the same time. Returns False if no row matched.
+        """
+        now = timezone.now()
+        return Booking.objects.filter(
+            id=booking_id,
+            client_id=client_id,
+            status=BookingStatus.CONFIRMED.value,
+            check_in_status=CheckInStatus.PENDING.value,
+        ).update(
+            status=BookingStatus.COMPLETED.value,
+            check_in_status=CheckInStatus.COMPLETED.value,
+            check_in_timestamp=now,
+            updated_at=now
+        ) == 1
 
     @staticmethod
-    def get_by_booking(booking: Booking) -> Optional[CheckInCheckOut]:
-        return CheckInCheckOut.objects.filter(booking=booking).first()
+    @prepared_statements()
+    def complete_check_out(booking_id: int, client: User) -> bool:
+        """
+        Checks out a checked in booking of the client with a single conditional UPDATE.
+        Returns False if no row matched.
+        """
+        now = timezone.now()
+        return Booking.objects.filter(
+            id=booking_id,
+            client=client,
+            check_in_status=CheckInStatus.COMPLETED.value,
+            check_out_status=CheckOutStatus.PENDING.value,
+        ).update(
+            check_out_status=CheckOutStatus.COMPLETED.value,
+            check_out_timestamp=now,
+            updated_at=now
+        ) == 1
 
     @staticmethod
-    def update_check_in_status(check_in_out: CheckInCheckOut) -> None:
-        check_in_out.check_in_status = CheckInStatus.COMPLETED.value
-        check_in_out.check_in_timestamp = timezone.now()
-        check_in_out.save()
+    def bulk_complete_check_in(booking_ids: List[int]) -> int:
+        now = timezone.now()
+        return Booking.objects.filter(id__in=booking_ids).update(
+            status=BookingStatus.COMPLETED.value,
+            check_in_status=CheckInStatus.COMPLETED.value,
+            check_in_timestamp=now,
+            updated_at=now
+        )
 
     @staticmethod
-    def update_check_out_status(check_in_out: CheckInCheckOut) -> None:
-        check_in_out.check_out_status = CheckOutStatus.COMPLETED.value
-        check_in_out.check_out_timestamp = timezone.now()
-        check_in_out.save()
+    def bulk_complete_check_out(booking_ids: List[int]) -> int:
+        now = timezone.now()
+        return Booking.objects.filter(id__in=booking_ids).update(
+            check_out_status=CheckOutStatus.COMPLETED.value,
+            check_out_timestamp=now,
+            updated_at=now
+        )
@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+MAX_BATCH_SIZE = 200
+
+
+class BatchCheckInOutSerializer(serializers.Serializer):
+    booking_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_BATCH_SIZE
+    )
+
+
+class BatchCheckInOutResultSerializer(serializers.Serializer):
+    booking_id = serializers.IntegerField()
+    success = serializers.BooleanField()
+    message = serializers.CharField()
+
+
+class KioskCheckInSerializer(serializers.Serializer):
+    token = serializers.CharField(max_length=200)
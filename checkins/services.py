@@ -1,11 +1,21 @@
 import logging
-from typing import Optional
+import uuid
+from contextlib import contextmanager
+from datetime import date
+from typing import Optional, List
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.utils import timezone
+
 from bookings.enums import BookingStatus
+from bookings.models import Booking
 from bookings.repository import BookingRepository
 from checkins.enums import CheckInStatus, CheckOutStatus
+from checkins.kiosk import KioskTokenService
 from checkins.repository import CheckInCheckOutRepository
+from housekeeping.services import HousekeepingService
 from rooms.enums import RoomStatus
 from rooms.repository import RoomRepository
 from utils.email_service import EmailService
@@ -17,96 +27,348 @@ from utils.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+class FrontDeskBoardService:
+    """
+    Today's arrivals, in-house guests and departures, kept as a cached per-day snapshot.
+    Booking changes patch the snapshot after commit instead of invalidating it, so the
+    board is rebuilt from the database only when the cache entry is missing or expired.
+    Writes to a day's snapshot hold a short cache lock, so concurrent patches do not overwrite
+    each other. Nothing waits for the lock: a patch that cannot take it drops the snapshot
+    instead, and a read serves what is cached or builds the board without caching it.
+    """
+    SECTIONS = ("arrivals", "in_house", "departures")
+    # Seconds a lock is held at most, if its holder dies.
+    LOCK_TTL = 5
+
+    def __init__(
+            self,
+            booking_repository: Optional[BookingRepository] = None
+    ):
+        self.booking_repository = booking_repository or BookingRepository()
+
+    @staticmethod
+    def cache_key(day: date) -> str:
+        return f"frontdesk:board:{day.isoformat()}"
+
+    @classmethod
+    @contextmanager
+    def _locked(cls, day: date):
+        """
+        Tries the day's snapshot lock once, yielding whether it was acquired.
+        """
+        lock_key = f"{cls.cache_key(day)}:lock"
+        token = uuid.uuid4().hex
+        acquired = cache.add(lock_key, token, cls.LOCK_TTL)
+        try:
+            yield acquired
+        finally:
+            if acquired and cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    @classmethod
+    def _store(cls, day: date, snapshot: dict) -> None:
+        """
+        Caches the snapshot under the lock, unless a patch was dropped while the lock was held.
+        """
+        key = cls.cache_key(day)
+        cache.set(key, snapshot, settings.FRONT_DESK_BOARD_TTL)
+        # Checked after writing: a patch marks the board stale before deleting it, so one of the two sees the other.
+        if cache.get(f"{key}:stale"):
+            cache.delete(key)
+
+    @classmethod
+    def _drop(cls, day: date) -> None:
+        key = cls.cache_key(day)
+        cache.set(f"{key}:stale", True, cls.LOCK_TTL)
+        cache.delete(key)
+
+    @staticmethod
+    def _sections_for(booking: Booking, day: date) -> List[str]:
+        sections = []
+        if (
+                booking.check_in_date == day
+                and booking.status == BookingStatus.CONFIRMED.value
+                and booking.check_in_status == CheckInStatus.PENDING.value
+        ):
+            sections.append("arrivals")
+        if (
+                booking.check_in_status == CheckInStatus.COMPLETED.value
+                and booking.check_out_status == CheckOutStatus.PENDING.value
+        ):
+            sections.append("in_house")
+        if booking.check_out_date == day and booking.check_in_status == CheckInStatus.COMPLETED.value:
+            sections.append("departures")
+        return sections
+
+    @staticmethod
+    def _entry(booking: Booking) -> dict:
+        return {
+            "booking_id": booking.id,
+            "client_name": booking.client.name,
+            "room_number": booking.room.number,
+            "check_in_date": booking.check_in_date.isoformat(),
+            "check_out_date": booking.check_out_date.isoformat(),
+            "check_in_status": booking.check_in_status,
+            "check_out_status": booking.check_out_status,
+        }
+
+    def _place(self, snapshot: dict, booking: Booking, day: date) -> None:
+        for section in self._sections_for(booking, day):
+            snapshot[section][booking.id] = self._entry(booking)
+
+    def build_snapshot(self, day: date) -> dict:
+        snapshot = {section: {} for section in self.SECTIONS}
+        with self._locked(day) as acquired:
+            for booking in self.booking_repository.get_front_desk_bookings(day):
+                self._place(snapshot, booking, day)
+            # Without the lock a patch may be in progress; serve the build without caching it.
+            if acquired:
+                self._store(day, snapshot)
+        return snapshot
+
+    def get_board(self, day: Optional[date] = None) -> dict:
+        day = day or timezone.localdate()
+        snapshot = cache.get(self.cache_key(day))
+        if snapshot is None:
+            snapshot = self.build_snapshot(day)
+
+        board = {"date": day.isoformat()}
+        for section in self.SECTIONS:
+            board[section] = sorted(snapshot[section].values(), key=lambda entry: entry["room_number"])
+        return board
+
+    def refresh_bookings(self, booking_ids: List[int]) -> None:
+        """
+        Moves the given bookings to the sections they now belong to in today's snapshot.
+        """
+        day = timezone.localdate()
+        key = self.cache_key(day)
+        try:
+            with self._locked(day) as acquired:
+                if not acquired:
+                    # Dropping the snapshot is safe: the next read rebuilds it from the database.
+                    logger.info(f"Front desk board for {day} is locked, dropping it to be rebuilt.")
+                    self._drop(day)
+                    return
+
+                snapshot = cache.get(key)
+                if snapshot is None:
+                    return
+
+                for section in self.SECTIONS:
+                    for booking_id in booking_ids:
+                        snapshot[section].pop(booking_id, None)
+                for booking in self.booking_repository.get_bookings_with_room_and_client(booking_ids):
+                    self._place(snapshot, booking, day)
+                self._store(day, snapshot)
+        except Exception as e:
+            # The change is already committed; a stale board expires with FRONT_DESK_BOARD_TTL.
+            logger.error(f"Failed to update the front desk board for bookings {booking_ids}: {e}")
+
+    def refresh_after_commit(self, booking_ids: List[int]) -> None:
+        transaction.on_commit(lambda: self.refresh_bookings(booking_ids))
+
+
 class CheckInCheckOutService:
 
     def __init__(
             self,
             check_in_out_repository: Optional[CheckInCheckOutRepository] = None,
             booking_repository: Optional[BookingRepository] = None,
-            room_repository: Optional[RoomRepository] = None
+            room_repository: Optional[RoomRepository] = None,
+            front_desk_board_service: Optional[FrontDeskBoardService] = None,
+            housekeeping_service: Optional[HousekeepingService] = None,
+            kiosk_token_service: Optional[KioskTokenService] = None
     ) -> None:
         self.check_in_out_repository = check_in_out_repository or CheckInCheckOutRepository()
         self.booking_repository = booking_repository or BookingRepository()
         self.room_repository = room_repository or RoomRepository()
+        self.front_desk_board_service = front_desk_board_service or FrontDeskBoardService(self.booking_repository)
+        self.housekeeping_service = housekeeping_service or HousekeepingService(
+            self.booking_repository, self.room_repository
+        )
+        self.kiosk_token_service = kiosk_token_service or KioskTokenService()
 
     @transaction.atomic
     def perform_check_in(self, booking_id: int, user) -> CheckInStatus:
-        try:
-            booking = self.booking_repository.get_booking_by_id(booking_id)
-
-            if booking.client != user:
-                logger.warning(f"User {user.id} attempted check-in for booking {booking_id} they do not own.")
-                raise UnauthorizedOrInvalidBookingException()
-
-            check_in_out = self.check_in_out_repository.get_by_booking(booking)
-
-            if booking.status != BookingStatus.CONFIRMED.value:
-                logger.warning(f"Attempted check-in on booking {booking_id} with status {booking.status}.")
-                raise InvalidBookingStatusException()
+        return self._check_in(booking_id, user.id)
 
-            if check_in_out.check_in_status == CheckInStatus.COMPLETED.value:
-                logger.warning(f"Attempted check-in on booking {booking_id} that is already checked in.")
-                raise AlreadyCheckedInException()
-
-            self.check_in_out_repository.update_check_in_status(check_in_out)
+    @transaction.atomic
+    def perform_kiosk_check_in(self, token: str) -> int:
+        """
+        Checks in the booking of a signed kiosk token. The token alone authorizes the
+        check-in, so nothing is read before the conditional UPDATE. Returns the booking id.
+        """
+        booking_id, client_id = self.kiosk_token_service.verify(token)
+        self._check_in(booking_id, client_id)
+        return booking_id
 
-            self.booking_repository.update_booking_status_to_complete(booking)
+    def _check_in(self, booking_id: int, client_id: int) -> CheckInStatus:
+        try:
+            # The conditional UPDATE is both the check and the write, so two concurrent
+            # requests cannot both succeed; only the failure path reads to explain why.
+            if not self.check_in_out_repository.complete_check_in(booking_id, client_id):
+                self._raise_check_in_failure(booking_id, client_id)
 
-            self.room_repository.update_room_status(booking.room, RoomStatus.OCCUPIED)
+            self.room_repository.update_room_status_for_booking(booking_id, RoomStatus.OCCUPIED)
 
+            booking = self.booking_repository.get_booking_with_room_and_client(booking_id)
             EmailService.send_checkin(
                 booking.client.email,
                 {
+                    "booking_id": booking.id,
                     "room_number": booking.room.number,
-                    "check_in_date": check_in_out.check_in_timestamp,
                 }
             )
 
+            self.front_desk_board_service.refresh_after_commit([booking_id])
+
             logger.info(f"Booking {booking_id} successfully checked in, room marked as OCCUPIED.")
             return CheckInStatus.COMPLETED
 
         except (InvalidBookingStatusException, AlreadyCheckedInException, UnauthorizedOrInvalidBookingException) as e:
             logger.error(f"Error during check-in for booking {booking_id}: {str(e)}")
             raise e
+        except Booking.DoesNotExist:
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error during check-in for booking {booking_id}.")
             raise Exception("An unexpected error occurred during check-in.") from e
 
-    @transaction.atomic
-    def perform_check_out(self, booking_id: int, user) -> CheckOutStatus:
-        try:
-            booking = self.booking_repository.get_booking_by_id(booking_id)
+    def _raise_check_in_failure(self, booking_id: int, client_id: int) -> None:
+        booking = self.booking_repository.get_booking_by_id(booking_id)
 
-            if booking.client != user:
-                logger.warning(f"User {user.id} attempted check-out for booking {booking_id} they do not own.")
-                raise UnauthorizedOrInvalidBookingException()
+        if booking.client_id != client_id:
+            logger.warning(f"User {client_id} attempted check-in for booking {booking_id} they do not own.")
+            raise UnauthorizedOrInvalidBookingException()
 
-            check_in_out = self.check_in_out_repository.get_by_booking(booking)
+        if booking.check_in_status == CheckInStatus.COMPLETED.value:
+            logger.warning(f"Attempted check-in on booking {booking_id} that is already checked in.")
+            raise AlreadyCheckedInException()
 
-            if check_in_out.check_in_status != CheckInStatus.COMPLETED.value:
-                logger.warning(f"Attempted check-out on booking {booking_id} without completed check-in.")
-                raise InvalidBookingStatusException()
+        logger.warning(f"Attempted check-in on booking {booking_id} with status {booking.status}.")
+        raise InvalidBookingStatusException()
 
-            if check_in_out.check_out_status == CheckOutStatus.COMPLETED.value:
-                logger.warning(f"Attempted check-out on booking {booking_id} that is already checked out.")
-                raise AlreadyCheckedOutException()
+    @transaction.atomic
+    def perform_check_out(self, booking_id: int, user) -> CheckOutStatus:
+        try:
+            if not self.check_in_out_repository.complete_check_out(booking_id, client=user):
+                self._raise_check_out_failure(booking_id, user)
 
-            self.check_in_out_repository.update_check_out_status(check_in_out)
+            self.room_repository.update_room_status_for_booking(booking_id, RoomStatus.CLEANING)
 
+            booking = self.booking_repository.get_booking_with_room_and_client(booking_id)
+            self.housekeeping_service.queue_rooms([booking.room])
             EmailService.send_checkout(
                 booking.client.email,
                 {
+                    "booking_id": booking.id,
                     "room_number": booking.room.number,
-                    "check_out_date": check_in_out.check_out_timestamp,
                 }
             )
 
-            logger.info(f"Booking {booking_id} successfully checked out.")
+            self.front_desk_board_service.refresh_after_commit([booking_id])
+
+            logger.info(f"Booking {booking_id} successfully checked out, room handed over to housekeeping.")
             return CheckOutStatus.COMPLETED
 
         except (InvalidBookingStatusException, AlreadyCheckedOutException, UnauthorizedOrInvalidBookingException) as e:
             logger.error(f"Error during check-out for booking {booking_id}: {str(e)}")
             raise e
+        except Booking.DoesNotExist:
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error during check-out for booking {booking_id}.")
             raise Exception("An unexpected error occurred during check-out.") from e
+
+    def _raise_check_out_failure(self, booking_id: int, user) -> None:
+        booking = self.booking_repository.get_booking_by_id(booking_id)
+
+        if booking.client != user:
+            logger.warning(f"User {user.id} attempted check-out for booking {booking_id} they do not own.")
+            raise UnauthorizedOrInvalidBookingException()
+
+        if booking.check_in_status != CheckInStatus.COMPLETED.value:
+            logger.warning(f"Attempted check-out on booking {booking_id} without completed check-in.")
+            raise InvalidBookingStatusException()
+
+        logger.warning(f"Attempted check-out on booking {booking_id} that is already checked out.")
+        raise AlreadyCheckedOutException()
+
+    @staticmethod
+    def _batch_result(booking_id: int, success: bool, message: str) -> dict:
+        return {"booking_id": booking_id, "success": success, "message": message}
+
+    @transaction.atomic
+    def perform_batch_check_in(self, booking_ids: List[int]) -> List[dict]:
+        """
+        Checks in every valid booking of a front-desk batch with a fixed number of queries:
+        one locking read and one bulk update for the bookings and one for their rooms.
+        Invalid bookings are reported in the results and do not affect the rest of the batch.
+        """
+        booking_ids = list(dict.fromkeys(booking_ids))
+        bookings = {booking.id: booking for booking in self.booking_repository.lock_bookings(booking_ids)}
+
+        results = []
+        checked_in = []
+        for booking_id in booking_ids:
+            booking = bookings.get(booking_id)
+            if booking is None:
+                results.append(self._batch_result(booking_id, False, "Booking not found."))
+            elif booking.status != BookingStatus.CONFIRMED.value or booking.check_in_status is None:
+                results.append(self._batch_result(booking_id, False, InvalidBookingStatusException().message))
+            elif booking.check_in_status == CheckInStatus.COMPLETED.value:
+                results.append(self._batch_result(booking_id, False, AlreadyCheckedInException().message))
+            else:
+                results.append(self._batch_result(booking_id, True, "Checked in successfully."))
+                checked_in.append(booking)
+
+        if checked_in:
+            self.check_in_out_repository.bulk_complete_check_in([booking.id for booking in checked_in])
+            self.room_repository.bulk_update_room_status([booking.room_id for booking in checked_in], RoomStatus.OCCUPIED)
+            EmailService.send_checkin_batch([
+                (booking.client.email, {"booking_id": booking.id, "room_number": booking.room.number})
+                for booking in checked_in
+            ])
+            self.front_desk_board_service.refresh_after_commit([booking.id for booking in checked_in])
+
+        logger.info(f"Batch check-in: {len(checked_in)} of {len(booking_ids)} bookings checked in.")
+        return results
+
+    @transaction.atomic
+    def perform_batch_check_out(self, booking_ids: List[int]) -> List[dict]:
+        """
+        Checks out every valid booking of a front-desk batch with a fixed number of queries
+        and hands their rooms over to housekeeping.
+        """
+        booking_ids = list(dict.fromkeys(booking_ids))
+        bookings = {booking.id: booking for booking in self.booking_repository.lock_bookings(booking_ids)}
+
+        results = []
+        checked_out = []
+        for booking_id in booking_ids:
+            booking = bookings.get(booking_id)
+            if booking is None:
+                results.append(self._batch_result(booking_id, False, "Booking not found."))
+            elif booking.check_in_status != CheckInStatus.COMPLETED.value:
+                results.append(self._batch_result(booking_id, False, InvalidBookingStatusException().message))
+            elif booking.check_out_status == CheckOutStatus.COMPLETED.value:
+                results.append(self._batch_result(booking_id, False, AlreadyCheckedOutException().message))
+            else:
+                results.append(self._batch_result(booking_id, True, "Checked out successfully."))
+                checked_out.append(booking)
+
+        if checked_out:
+            self.check_in_out_repository.bulk_complete_check_out([booking.id for booking in checked_out])
+            self.room_repository.bulk_update_room_status(
+                [booking.room_id for booking in checked_out], RoomStatus.CLEANING
+            )
+            self.housekeeping_service.queue_rooms([booking.room for booking in checked_out])
+            EmailService.send_checkout_batch([
+                (booking.client.email, {"booking_id": booking.id, "room_number": booking.room.number})
+                for booking in checked_out
+            ])
+            self.front_desk_board_service.refresh_after_commit([booking.id for booking in checked_out])
+
+        logger.info(f"Batch check-out: {len(checked_out)} of {len(booking_ids)} bookings checked out.")
+        return results
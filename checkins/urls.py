@@ -1,8 +1,13 @@
 from django.urls import path
 
-from checkins.views import CheckInView, CheckOutView
+from checkins.views import CheckInView, CheckOutView, BatchCheckInView, BatchCheckOutView, FrontDeskBoardView, \
+    KioskCheckInView
 
 urlpatterns = [
     path('checkin/<int:booking_id>/', CheckInView.as_view(), name='checkin'),
     path('checkout/<int:booking_id>/', CheckOutView.as_view(), name='checkout'),
+    path('checkin/batch/', BatchCheckInView.as_view(), name='checkin-batch'),
+    path('checkout/batch/', BatchCheckOutView.as_view(), name='checkout-batch'),
+    path('checkin/kiosk/', KioskCheckInView.as_view(), name='checkin-kiosk'),
+    path('board/', FrontDeskBoardView.as_view(), name='front-desk-board'),
 ]
@@ -1,16 +1,22 @@
 from typing import Optional
 
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
+from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from bookings.models import Booking
-from checkins.services import CheckInCheckOutService
+from checkins.serializers import BatchCheckInOutSerializer, BatchCheckInOutResultSerializer, KioskCheckInSerializer
+from checkins.services import CheckInCheckOutService, FrontDeskBoardService
 from checkins.enums import CheckInStatus, CheckOutStatus
+from utils.custom_permissions import IsStaffOrAdminUser
 from utils.exceptions import (
     AlreadyCheckedInException,
     InvalidBookingStatusException,
     AlreadyCheckedOutException,
-    UnauthorizedOrInvalidBookingException
+    UnauthorizedOrInvalidBookingException,
+    CheckInNotOpenException,
+    InvalidKioskTokenException
 )
 
 
@@ -62,3 +68,126 @@ class CheckOutView(APIView):
         except Exception as e:
             return Response({"error": f"An unexpected error occurred: {e}"},
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class KioskCheckInView(APIView):
+    # The signed token is the credential: no JWT authentication and no user lookup.
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def __init__(
+            self,
+            check_in_out_service: Optional[CheckInCheckOutService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.check_in_out_service = check_in_out_service or CheckInCheckOutService()
+
+    @swagger_auto_schema(
+        operation_description="Self-service check-in with the signed token issued when the booking was confirmed.",
+        request_body=KioskCheckInSerializer,
+        responses={
+            200: "Checked in successfully.",
+            400: "Check-in is not open for this booking today.",
+            401: "The check-in token is invalid.",
+            404: "Booking not found.",
+            409: "This booking has already been checked in."
+        }
+    )
+    def post(self, request):
+        serializer = KioskCheckInSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            booking_id = self.check_in_out_service.perform_kiosk_check_in(serializer.validated_data["token"])
+            return Response(
+                {"booking_id": booking_id, "message": "Checked in successfully."}, status=status.HTTP_200_OK
+            )
+        except Booking.DoesNotExist:
+            return Response({"error": "Booking not found."}, status=status.HTTP_404_NOT_FOUND)
+        except (
+                InvalidKioskTokenException, CheckInNotOpenException, InvalidBookingStatusException,
+                UnauthorizedOrInvalidBookingException, AlreadyCheckedInException
+        ) as e:
+            return Response({"error": e.message}, status=e.status_code)
+
+
+class BatchCheckInView(APIView):
+    permission_classes = [IsStaffOrAdminUser]
+
+    def __init__(
+            self,
+            check_in_out_service: Optional[CheckInCheckOutService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.check_in_out_service = check_in_out_service or CheckInCheckOutService()
+
+    @swagger_auto_schema(
+        operation_description="Check in a group of bookings at the front desk in one transaction.",
+        request_body=BatchCheckInOutSerializer,
+        responses={
+            200: BatchCheckInOutResultSerializer(many=True),
+            400: "Validation error",
+            403: "Only staff and admins can perform batch check-ins."
+        }
+    )
+    def post(self, request):
+        serializer = BatchCheckInOutSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        results = self.check_in_out_service.perform_batch_check_in(serializer.validated_data["booking_ids"])
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class BatchCheckOutView(APIView):
+    permission_classes = [IsStaffOrAdminUser]
+
+    def __init__(
+            self,
+            check_in_out_service: Optional[CheckInCheckOutService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.check_in_out_service = check_in_out_service or CheckInCheckOutService()
+
+    @swagger_auto_schema(
+        operation_description="Check out a group of bookings at the front desk in one transaction.",
+        request_body=BatchCheckInOutSerializer,
+        responses={
+            200: BatchCheckInOutResultSerializer(many=True),
+            400: "Validation error",
+            403: "Only staff and admins can perform batch check-outs."
+        }
+    )
+    def post(self, request):
+        serializer = BatchCheckInOutSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        results = self.check_in_out_service.perform_batch_check_out(serializer.validated_data["booking_ids"])
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class FrontDeskBoardView(APIView):
+    permission_classes = [IsStaffOrAdminUser]
+
+    def __init__(
+            self,
+            front_desk_board_service: Optional[FrontDeskBoardService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.front_desk_board_service = front_desk_board_service or FrontDeskBoardService()
+
+    @swagger_auto_schema(
+        operation_description="Today's arrivals, in-house guests and departures for the front desk.",
+        responses={
+            200: "Board with arrivals, in_house and departures ordered by room number",
+            403: "Only staff and admins can view the front desk board."
+        }
+    )
+    def get(self, request):
+        return Response(self.front_desk_board_service.get_board(), status=status.HTTP_200_OK)
@@ -0,0 +1,20 @@
+"""
+Gunicorn settings for the production entry point, which runs hotel_api.asgi with uvicorn workers:
+
+    gunicorn -c gunicorn.conf.py hotel_api.asgi:application
+"""
+import multiprocessing
+
+# Imported as a module: gunicorn reads every top-level name here as a setting, and `config` is one.
+import decouple
+
+bind = decouple.config('GUNICORN_BIND', default='0.0.0.0:8000')
+
+# One event loop per worker; each serves many connections, so a worker per CPU is enough.
+workers = decouple.config('WEB_CONCURRENCY', default=multiprocessing.cpu_count(), cast=int)
+worker_class = 'uvicorn_worker.UvicornWorker'
+
+# Idle keep-alive connections cost an event loop almost nothing, unlike a sync worker thread.
+keepalive = decouple.config('GUNICORN_KEEPALIVE', default=5, cast=int)
+timeout = decouple.config('GUNICORN_TIMEOUT', default=30, cast=int)
+graceful_timeout = timeout
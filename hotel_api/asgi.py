@@ -2,6 +2,9 @@
 ASGI config for hotel_api project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Run it with uvicorn workers under gunicorn (see gunicorn.conf.py):
+
+    gunicorn -c gunicorn.conf.py hotel_api.asgi:application
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -12,5 +15,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hotel_api.settings')
+# Serve the async views of the read-heavy routes (hotel_api/asgi_urls.py).
+os.environ.setdefault('ROOT_URLCONF', 'hotel_api.asgi_urls')
 
 application = get_asgi_application()
@@ -0,0 +1,25 @@
+"""
+URL configuration for the ASGI entry point (hotel_api/asgi.py).
+
+Serves the same routes as hotel_api.urls, with the read-heavy endpoints and the password hashing
+endpoints handled by their async views. Django uses the first matching pattern, so the routes
+below take precedence over the sync views of hotel_api.urls.
+"""
+from django.urls import path
+
+from authentication.views import AsyncTokenObtainPairView
+from bookings.views import AsyncBookingListView
+from hotel_api.urls import urlpatterns as sync_urlpatterns
+from rooms.views import AsyncRoomListView, AsyncRoomDetailView, AsyncRoomAvailabilityView, \
+    AsyncRoomAvailabilityFilterView
+from users.views import AsyncClientRegistrationView
+
+urlpatterns = [
+    path('rooms/', AsyncRoomListView.as_view()),
+    path('rooms/<int:room_id>/', AsyncRoomDetailView.as_view()),
+    path('rooms/<str:room_number>/availability/', AsyncRoomAvailabilityView.as_view()),
+    path('rooms/availability/filter/', AsyncRoomAvailabilityFilterView.as_view()),
+    path('bookings/', AsyncBookingListView.as_view()),
+    path('token/', AsyncTokenObtainPairView.as_view()),
+    path('users/register/', AsyncClientRegistrationView.as_view()),
+] + sync_urlpatterns
@@ -13,7 +13,8 @@ from datetime import timedelta
 from pathlib import Path
 
 from celery.schedules import crontab
-from decouple import config
+from decouple import config, Csv
+from kombu import Queue
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -43,25 +44,31 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'users',
+    'authentication',
     'bookings',
     'rooms',
     'utils',
     'checkins',
+    'notifications',
+    'housekeeping',
     'rest_framework',
     'drf_yasg',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'utils.load_shedding.LoadSheddingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'utils.db_router.ReplicaStickinessMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'hotel_api.urls'
+# hotel_api/asgi.py switches to hotel_api.asgi_urls, which routes the read-heavy endpoints to async views.
+ROOT_URLCONF = config('ROOT_URLCONF', default='hotel_api.urls')
 
 TEMPLATES = [
     {
@@ -88,7 +95,7 @@ REST_FRAMEWORK = {
         'rest_framework.renderers.JSONRenderer',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -98,7 +105,49 @@ REST_FRAMEWORK = {
     'DATETIME_FORMAT': "%d/%m/%Y %H:%M",
     'DATE_INPUT_FORMATS': ["%d/%m/%Y"],
     'DATETIME_INPUT_FORMATS': ["%d/%m/%Y %H:%M"],
+    # Sliding-window limits for the throttles in utils/throttling.py, applied to the public room views.
+    'DEFAULT_THROTTLE_RATES': {
+        'ip': config('THROTTLE_RATE_IP', default='60/min'),
+        'user': config('THROTTLE_RATE_USER', default='120/min'),
+        'partner': config('THROTTLE_RATE_PARTNER', default='1200/min'),
+    },
+}
 
+# Partners identify themselves with an X-Partner-Key header holding one of these keys.
+THROTTLE_PARTNER_KEYS = config('THROTTLE_PARTNER_KEYS', default='', cast=Csv())
+
+# After THROTTLE_CIRCUIT_FAILURE_THRESHOLD failed Redis calls in a row, requests skip throttling without calling
+# Redis for THROTTLE_CIRCUIT_RESET_TIMEOUT seconds, instead of each waiting out REDIS_SOCKET_TIMEOUT.
+THROTTLE_CIRCUIT_FAILURE_THRESHOLD = config('THROTTLE_CIRCUIT_FAILURE_THRESHOLD', default=1, cast=int)
+THROTTLE_CIRCUIT_RESET_TIMEOUT = config('THROTTLE_CIRCUIT_RESET_TIMEOUT', default=5.0, cast=float)
+
+# Load shedding (utils/load_shedding.py), per worker process: normal routes are rejected with 503 once
+# LOAD_SHEDDING_MAX_IN_FLIGHT requests are in flight, low priority routes once LOAD_SHEDDING_LOW_PRIORITY_MAX_IN_FLIGHT
+# are or while their p95 over the last LOAD_SHEDDING_LATENCY_WINDOW seconds exceeds LOAD_SHEDDING_P95_LATENCY_LIMIT.
+# Critical routes are never shed. Unlisted views are normal priority.
+LOAD_SHEDDING_MAX_IN_FLIGHT = config('LOAD_SHEDDING_MAX_IN_FLIGHT', default=64, cast=int)
+LOAD_SHEDDING_LOW_PRIORITY_MAX_IN_FLIGHT = config('LOAD_SHEDDING_LOW_PRIORITY_MAX_IN_FLIGHT', default=32, cast=int)
+LOAD_SHEDDING_P95_LATENCY_LIMIT = config('LOAD_SHEDDING_P95_LATENCY_LIMIT', default=2.0, cast=float)
+LOAD_SHEDDING_LATENCY_WINDOW = config('LOAD_SHEDDING_LATENCY_WINDOW', default=30.0, cast=float)
+LOAD_SHEDDING_RETRY_AFTER = config('LOAD_SHEDDING_RETRY_AFTER', default=5, cast=int)
+LOAD_SHEDDING_ROUTE_PRIORITIES = {
+    'CheckInView': 'critical',
+    'CheckOutView': 'critical',
+    'KioskCheckInView': 'critical',
+    'BatchCheckInView': 'critical',
+    'BatchCheckOutView': 'critical',
+    'CustomTokenObtainPairView': 'critical',
+    'AsyncTokenObtainPairView': 'critical',
+    'CustomTokenRefreshView': 'critical',
+    'RoomListView': 'low',
+    'RoomAvailabilityView': 'low',
+    'RoomAvailabilityFilterView': 'low',
+    'AsyncRoomListView': 'low',
+    'AsyncRoomAvailabilityView': 'low',
+    'AsyncRoomAvailabilityFilterView': 'low',
+    'LoadSheddingMetricsView': 'critical',
+    'DatabasePoolMetricsView': 'critical',
+    'DatabaseHealthView': 'critical',
 }
 
 DATE_INPUT_FORMATS = ["%d/%m/%Y"]
@@ -118,6 +167,36 @@ SWAGGER_SETTINGS = {
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Connections come from psycopg 3's pool (Django's native pooling), one pool per process. Sizes depend on
+# the process type, set with DB_PROCESS_TYPE: web processes serve concurrent requests, while each Celery
+# prefork child runs one task at a time. Connections are checked before being handed out (CONN_HEALTH_CHECKS),
+# and the pool is reported at /metrics/db-pool/ and /health/db/ (utils/db_pool.py).
+DB_POOL_ENABLED = config('DB_POOL_ENABLED', default=True, cast=bool)
+DB_PROCESS_TYPE = config('DB_PROCESS_TYPE', default='web')
+DB_POOL_SIZES = {
+    'web': {
+        'min_size': config('DB_POOL_WEB_MIN_SIZE', default=2, cast=int),
+        'max_size': config('DB_POOL_WEB_MAX_SIZE', default=10, cast=int),
+    },
+    'worker': {
+        'min_size': config('DB_POOL_WORKER_MIN_SIZE', default=1, cast=int),
+        'max_size': config('DB_POOL_WORKER_MAX_SIZE', default=2, cast=int),
+    },
+}
+DB_POOL_OPTIONS = {
+    **DB_POOL_SIZES[DB_PROCESS_TYPE],
+    'name': f'default-{DB_PROCESS_TYPE}',
+    # Seconds a request waits for a free connection before failing.
+    'timeout': config('DB_POOL_TIMEOUT', default=10.0, cast=float),
+    # Seconds an idle connection above min_size is kept open.
+    'max_idle': config('DB_POOL_MAX_IDLE', default=300.0, cast=float),
+}
+
+# Hot repository queries (utils/prepared_statements.py) run as server-side prepared statements, so
+# PostgreSQL parses each of them once per connection and can reuse a cached plan. Prepared statements
+# live on the server connection: leave this off behind a transaction-pooling pgbouncer.
+DB_PREPARED_STATEMENTS = config('DB_PREPARED_STATEMENTS', default=False, cast=bool)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -126,9 +205,28 @@ DATABASES = {
         'PASSWORD': config('POSTGRES_PASSWORD'),
         'HOST': config('POSTGRES_HOST'),
         'PORT': config('POSTGRES_PORT'),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'pool': DB_POOL_OPTIONS} if DB_POOL_ENABLED else {},
     }
 }
 
+# Read replicas, one alias per host (replica_1, replica_2, ...) with the primary's credentials. Catalogue,
+# availability and booking listing reads go to a random replica (utils/db_router.py), except inside
+# transactions and for DB_REPLICA_STICKINESS seconds after the same user's last write, which read the primary.
+DB_REPLICA_HOSTS = config('DB_REPLICA_HOSTS', default='', cast=Csv())
+for index, host in enumerate(DB_REPLICA_HOSTS, start=1):
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'OPTIONS': (
+            {'pool': {**DB_POOL_OPTIONS, 'name': f'replica_{index}-{DB_PROCESS_TYPE}'}} if DB_POOL_ENABLED else {}
+        ),
+        'TEST': {'MIRROR': 'default'},
+    }
+DB_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DB_REPLICA_STICKINESS = config('DB_REPLICA_STICKINESS', default=5, cast=int)
+DATABASE_ROUTERS = ['utils.db_router.PrimaryReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -169,6 +267,28 @@ STATIC_URL = '/static/'
 
 MEDIA_URL = '/media/'
 
+# Redis
+
+REDIS_URL = config('REDIS_URL', default='redis://redis:6379/0')
+REDIS_SOCKET_TIMEOUT = config('REDIS_SOCKET_TIMEOUT', default=1.0, cast=float)
+
+# Cache
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'OPTIONS': {
+            'socket_timeout': REDIS_SOCKET_TIMEOUT,
+            'socket_connect_timeout': REDIS_SOCKET_TIMEOUT,
+        },
+    }
+}
+
+# Front desk board: today's snapshot is patched on every booking change and rebuilt
+# from the database at most once every FRONT_DESK_BOARD_TTL seconds.
+FRONT_DESK_BOARD_TTL = config('FRONT_DESK_BOARD_TTL', default=300, cast=int)
+
 # Celery
 
 CELERY_BROKER_URL = 'redis://redis:6379/0'
@@ -179,6 +299,46 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_WORKER_SEND_TASK_EVENTS = True
 
+# Publishing (utils/broker.py) gives up after BROKER_PUBLISH_TIMEOUT seconds and stops trying
+# for BROKER_CIRCUIT_RESET_TIMEOUT seconds after BROKER_CIRCUIT_FAILURE_THRESHOLD failures in a row.
+BROKER_PUBLISH_TIMEOUT = config('BROKER_PUBLISH_TIMEOUT', default=1.0, cast=float)
+BROKER_CIRCUIT_FAILURE_THRESHOLD = config('BROKER_CIRCUIT_FAILURE_THRESHOLD', default=3, cast=int)
+BROKER_CIRCUIT_RESET_TIMEOUT = config('BROKER_CIRCUIT_RESET_TIMEOUT', default=30.0, cast=float)
+
+# Celery queues: notifications and sweeps get their own workers so a long sweep
+# cannot delay emails and an email flood cannot delay expirations.
+# With the Redis broker, priority 0 is the highest.
+
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_QUEUES = (
+    Queue('default', routing_key='default'),
+    Queue('notifications', routing_key='notifications'),
+    Queue('sweeps', routing_key='sweeps'),
+)
+CELERY_TASK_ROUTES = {
+    'notifications.tasks.relay_outbox': {'queue': 'notifications', 'priority': 0},
+    'bookings.tasks.send_booking_confirmation_email': {'queue': 'notifications', 'priority': 1},
+    'bookings.tasks.send_booking_cancellation_email': {'queue': 'notifications', 'priority': 1},
+    'checkins.tasks.*': {'queue': 'notifications', 'priority': 1},
+    'bookings.tasks.send_booking_*': {'queue': 'notifications', 'priority': 3},
+    'notifications.tasks.flush_email_batch': {'queue': 'notifications', 'priority': 5},
+    'notifications.tasks.flush_notification_digest': {'queue': 'notifications', 'priority': 3},
+    'bookings.tasks.expire_pending_bookings': {'queue': 'sweeps', 'priority': 5},
+    'bookings.tasks.manage_room_availability': {'queue': 'sweeps', 'priority': 5},
+    'authentication.tasks.rebuild_token_revocation_filter': {'queue': 'sweeps', 'priority': 5},
+}
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'priority_steps': list(range(10)),
+    'sep': ':',
+    'queue_order_strategy': 'priority',
+    'socket_connect_timeout': BROKER_PUBLISH_TIMEOUT,
+    # Bounds reads and writes on an open connection too, so a stalled broker fails the publish.
+    'socket_timeout': BROKER_PUBLISH_TIMEOUT,
+    'socket_keepalive': True,
+}
+CELERY_BROKER_CONNECTION_TIMEOUT = BROKER_PUBLISH_TIMEOUT
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
 # Celery Beat
 
 CELERY_BEAT_SCHEDULE = {
@@ -190,8 +350,25 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'bookings.tasks.manage_room_availability',
         'schedule': crontab(minute=0, hour='*'),
     },
+    'relay-outbox': {
+        'task': 'notifications.tasks.relay_outbox',
+        'schedule': timedelta(seconds=config('OUTBOX_RELAY_INTERVAL', default=5, cast=int)),
+    },
+    'flush-email-batch': {
+        'task': 'notifications.tasks.flush_email_batch',
+        'schedule': timedelta(seconds=config('EMAIL_BATCH_INTERVAL', default=10, cast=int)),
+    },
+    'rebuild-token-revocation-filter': {
+        'task': 'authentication.tasks.rebuild_token_revocation_filter',
+        'schedule': crontab(minute=30, hour='*'),
+    },
 }
 
+# Outbox
+
+OUTBOX_RELAY_BATCH_SIZE = config('OUTBOX_RELAY_BATCH_SIZE', default=100, cast=int)
+OUTBOX_MAX_ATTEMPTS = config('OUTBOX_MAX_ATTEMPTS', default=5, cast=int)
+
 # SMTP
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
@@ -201,6 +378,32 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL')
 
+# Batched email delivery: messages are buffered in Redis and flushed every
+# EMAIL_BATCH_SIZE messages or EMAIL_BATCH_INTERVAL seconds over one connection.
+EMAIL_BATCHING_ENABLED = config('EMAIL_BATCHING_ENABLED', default=False, cast=bool)
+EMAIL_BATCH_SIZE = config('EMAIL_BATCH_SIZE', default=50, cast=int)
+EMAIL_MAX_ATTEMPTS = config('EMAIL_MAX_ATTEMPTS', default=3, cast=int)
+# Seconds after which a claimed batch that was never acknowledged (its consumer died) goes back to the buffer.
+EMAIL_CLAIM_TIMEOUT = config('EMAIL_CLAIM_TIMEOUT', default=300, cast=int)
+# The async worker retries the n-th failure of a message after EMAIL_RETRY_BACKOFF * 2**n seconds.
+EMAIL_RETRY_BACKOFF = config('EMAIL_RETRY_BACKOFF', default=5.0, cast=float)
+
+# Notification digest: booking notifications for the same client are held for
+# NOTIFICATION_DIGEST_WINDOW seconds and sent as one email; 0 sends them immediately.
+NOTIFICATION_DIGEST_WINDOW = config('NOTIFICATION_DIGEST_WINDOW', default=0, cast=int)
+
+# Async notification worker (manage.py run_notification_worker). Rates are messages
+# per second per recipient domain; 0 disables the limit. When it is enabled it is the only
+# consumer of the email buffer: the periodic and early flush_email_batch runs are turned off.
+ASYNC_EMAIL_WORKER_ENABLED = config('ASYNC_EMAIL_WORKER_ENABLED', default=False, cast=bool)
+EMAIL_WORKER_CONCURRENCY = config('EMAIL_WORKER_CONCURRENCY', default=50, cast=int)
+EMAIL_WORKER_DOMAIN_RATE = config('EMAIL_WORKER_DOMAIN_RATE', default=20.0, cast=float)
+EMAIL_WORKER_DOMAIN_RATES = {
+    'gmail.com': config('EMAIL_WORKER_GMAIL_RATE', default=20.0, cast=float),
+}
+if ASYNC_EMAIL_WORKER_ENABLED:
+    CELERY_BEAT_SCHEDULE.pop('flush-email-batch')
+
 
 # JWT
 
@@ -215,6 +418,23 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Authenticated users are served from a cached snapshot for up to AUTH_USER_CACHE_TTL seconds;
+# saving a user, or updating it through User.objects, drops its snapshot immediately.
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=3600, cast=int)
+
+# Verified bearer tokens kept per process (authentication/token_cache.py) until they expire; 0 disables it.
+AUTH_TOKEN_CACHE_SIZE = config('AUTH_TOKEN_CACHE_SIZE', default=10000, cast=int)
+
+# Processes in the pool async views hash and check passwords in (utils/hashing.py), per web process.
+PASSWORD_HASHING_WORKERS = config('PASSWORD_HASHING_WORKERS', default=2, cast=int)
+
+# Token revocation: revoked token ids go into a Redis bloom filter of AUTH_REVOCATION_FILTER_BITS bits
+# (the default holds about 100k tokens at a 1% false positive rate). Each process keeps a copy, reloaded in the
+# background every AUTH_REVOCATION_SYNC_INTERVAL seconds, and queries the database only when a token matches the filter.
+AUTH_REVOCATION_FILTER_BITS = config('AUTH_REVOCATION_FILTER_BITS', default=2 ** 20, cast=int)
+AUTH_REVOCATION_FILTER_HASHES = config('AUTH_REVOCATION_FILTER_HASHES', default=7, cast=int)
+AUTH_REVOCATION_SYNC_INTERVAL = config('AUTH_REVOCATION_SYNC_INTERVAL', default=5.0, cast=float)
+
 # Logging
 
 LOGGING = {
@@ -22,6 +22,8 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
+from utils.views import DatabaseHealthView, DatabasePoolMetricsView, LoadSheddingMetricsView
+
 schema_view = get_schema_view(
    openapi.Info(
       title="API Documentation",
@@ -39,6 +41,10 @@ urlpatterns = [
     path('users/', include('users.urls')),
     path('bookings/', include('bookings.urls')),
     path('rooms/', include('rooms.urls')),
+    path('housekeeping/', include('housekeeping.urls')),
     path('', include('checkins.urls')),
     path('', include('authentication.urls')),
+    path('metrics/load-shedding/', LoadSheddingMetricsView.as_view(), name='load-shedding-metrics'),
+    path('metrics/db-pool/', DatabasePoolMetricsView.as_view(), name='db-pool-metrics'),
+    path('health/db/', DatabaseHealthView.as_view(), name='db-health'),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
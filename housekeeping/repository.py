@@ -0,0 +1,27 @@
+from typing import Dict, List, Tuple
+
+from utils.redis_client import get_redis_client
+
+
+class HousekeepingQueueRepository:
+    """
+    Rooms waiting to be cleaned, in a Redis sorted set scored by priority (lowest first).
+    """
+    QUEUE_KEY = "housekeeping:queue"
+
+    @staticmethod
+    def push(priorities: Dict[int, float]) -> None:
+        if priorities:
+            get_redis_client().zadd(
+                HousekeepingQueueRepository.QUEUE_KEY,
+                {str(room_id): score for room_id, score in priorities.items()}
+            )
+
+    @staticmethod
+    def get_queue(limit: int) -> List[Tuple[int, float]]:
+        entries = get_redis_client().zrange(HousekeepingQueueRepository.QUEUE_KEY, 0, limit - 1, withscores=True)
+        return [(int(room_id), score) for room_id, score in entries]
+
+    @staticmethod
+    def remove(room_id: int) -> None:
+        get_redis_client().zrem(HousekeepingQueueRepository.QUEUE_KEY, str(room_id))
@@ -0,0 +1,91 @@
+import logging
+from datetime import date
+from typing import Optional, List
+
+from django.db import transaction
+from django.utils import timezone
+
+from bookings.repository import BookingRepository
+from housekeeping.repository import HousekeepingQueueRepository
+from rooms.models import Room
+from rooms.repository import RoomRepository
+from utils.exceptions import RoomNotAwaitingCleaningException, RoomNotFoundException
+
+logger = logging.getLogger(__name__)
+
+
+class HousekeepingService:
+    """
+    Checked out rooms wait in CLEANING until housekeeping marks them clean. Rooms whose
+    type has the nearest upcoming arrival are cleaned first.
+    """
+    # Score of rooms whose type has no upcoming arrival: they go to the end of the queue.
+    NO_UPCOMING_ARRIVAL = date.max.toordinal()
+
+    def __init__(
+            self,
+            booking_repository: Optional[BookingRepository] = None,
+            room_repository: Optional[RoomRepository] = None,
+            queue_repository: Optional[HousekeepingQueueRepository] = None
+    ):
+        self.booking_repository = booking_repository or BookingRepository()
+        self.room_repository = room_repository or RoomRepository()
+        self.queue_repository = queue_repository or HousekeepingQueueRepository()
+
+    def queue_rooms(self, rooms: List[Room]) -> None:
+        """
+        Adds checked out rooms to the housekeeping queue once the check-out commits.
+        """
+        next_arrivals = self.booking_repository.get_next_arrival_dates(
+            list({room.room_type for room in rooms}), timezone.localdate()
+        )
+        priorities = {
+            room.id: next_arrivals[room.room_type].toordinal() if room.room_type in next_arrivals
+            else self.NO_UPCOMING_ARRIVAL
+            for room in rooms
+        }
+        transaction.on_commit(lambda: self._push(priorities))
+
+    def _push(self, priorities: dict) -> None:
+        try:
+            self.queue_repository.push(priorities)
+        except Exception as e:
+            # The rooms stay in CLEANING and can still be marked clean from the room list.
+            logger.error(f"Failed to queue rooms {list(priorities)} for housekeeping: {e}")
+
+    def get_queue(self, limit: int = 100) -> List[dict]:
+        entries = self.queue_repository.get_queue(limit)
+        rooms = {room.id: room for room in self.room_repository.get_rooms_by_ids([room_id for room_id, _ in entries])}
+
+        queue = []
+        for room_id, score in entries:
+            room = rooms.get(room_id)
+            if room is None:
+                continue
+            queue.append({
+                "room_id": room.id,
+                "room_number": room.number,
+                "room_type": room.room_type,
+                "next_arrival": None if score >= self.NO_UPCOMING_ARRIVAL else date.fromordinal(int(score)).isoformat(),
+            })
+        return queue
+
+    @transaction.atomic
+    def mark_clean(self, room_id: int) -> None:
+        if not self.room_repository.release_cleaned_room(room_id):
+            try:
+                self.room_repository.get_room_by_id(room_id)
+            except Room.DoesNotExist:
+                raise RoomNotFoundException()
+            # Drop a stale queue entry left by an earlier failed removal.
+            self._remove(room_id)
+            raise RoomNotAwaitingCleaningException()
+
+        transaction.on_commit(lambda: self._remove(room_id))
+        logger.info(f"Room {room_id} cleaned and back in inventory.")
+
+    def _remove(self, room_id: int) -> None:
+        try:
+            self.queue_repository.remove(room_id)
+        except Exception as e:
+            logger.error(f"Failed to remove room {room_id} from the housekeeping queue: {e}")
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from housekeeping.views import HousekeepingQueueView, MarkRoomCleanView
+
+urlpatterns = [
+    path('queue/', HousekeepingQueueView.as_view(), name='housekeeping-queue'),
+    path('rooms/<int:room_id>/clean/', MarkRoomCleanView.as_view(), name='housekeeping-clean'),
+]
@@ -0,0 +1,60 @@
+from typing import Optional
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from housekeeping.services import HousekeepingService
+from utils.custom_permissions import IsStaffOrAdminUser
+from utils.exceptions import RoomNotAwaitingCleaningException, RoomNotFoundException
+
+
+class HousekeepingQueueView(APIView):
+    permission_classes = [IsStaffOrAdminUser]
+
+    def __init__(
+            self,
+            housekeeping_service: Optional[HousekeepingService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.housekeeping_service = housekeeping_service or HousekeepingService()
+
+    @swagger_auto_schema(
+        operation_description="Rooms waiting to be cleaned, the most urgent first.",
+        responses={
+            200: "Rooms with the next arrival date for their room type",
+            403: "Only staff and admins can view the housekeeping queue."
+        }
+    )
+    def get(self, request):
+        return Response({"rooms": self.housekeeping_service.get_queue()}, status=status.HTTP_200_OK)
+
+
+class MarkRoomCleanView(APIView):
+    permission_classes = [IsStaffOrAdminUser]
+
+    def __init__(
+            self,
+            housekeeping_service: Optional[HousekeepingService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.housekeeping_service = housekeeping_service or HousekeepingService()
+
+    @swagger_auto_schema(
+        operation_description="Mark a checked out room as clean, making it available for booking again.",
+        responses={
+            200: "Room marked as clean",
+            403: "Only staff and admins can mark rooms as clean.",
+            404: "Room not found",
+            409: "Room is not waiting for housekeeping"
+        }
+    )
+    def post(self, request, room_id):
+        try:
+            self.housekeeping_service.mark_clean(room_id)
+            return Response({"message": "Room marked as clean."}, status=status.HTTP_200_OK)
+        except (RoomNotFoundException, RoomNotAwaitingCleaningException) as e:
+            return Response({"error": e.message}, status=e.status_code)
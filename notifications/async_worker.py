@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import aiosmtplib
+from django.conf import settings
+
+from notifications.repository import EmailBufferRepository
+from notifications.services import EmailBatchService
+from utils.redis_client import create_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class DomainRateLimiter:
+    """
+    Token bucket per recipient domain, so a spike to one provider does not get us throttled by it.
+    """
+
+    def __init__(self, default_rate: float, domain_rates: Optional[Dict[str, float]] = None):
+        self.default_rate = default_rate
+        self.domain_rates = domain_rates or {}
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _rate_for(self, domain: str) -> float:
+        return self.domain_rates.get(domain, self.default_rate)
+
+    async def acquire(self, domain: str) -> None:
+        rate = self._rate_for(domain)
+        if rate <= 0:
+            return
+
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            tokens, updated_at = self._buckets.get(domain, (rate, time.monotonic()))
+            now = time.monotonic()
+            tokens = min(rate, tokens + (now - updated_at) * rate)
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / rate)
+                now = time.monotonic()
+                tokens = 1
+            self._buckets[domain] = (tokens - 1, now)
+
+
+class AsyncEmailWorker:
+    """
+    Drains the email buffer filled by the tasks in bookings/tasks.py and checkins/tasks.py and
+    delivers messages concurrently with aiosmtplib. At most `concurrency` messages are in flight,
+    and SMTP connections are kept open and reused between messages. Messages are claimed from the
+    buffer like EmailBatchService.flush does, so a worker that dies mid-batch loses nothing.
+    """
+    # Seconds to wait before claiming again when the buffer is empty.
+    POLL_INTERVAL = 0.2
+
+    def __init__(
+            self,
+            concurrency: Optional[int] = None,
+            default_domain_rate: Optional[float] = None,
+            domain_rates: Optional[Dict[str, float]] = None,
+    ):
+        self.concurrency = concurrency or settings.EMAIL_WORKER_CONCURRENCY
+        self.rate_limiter = DomainRateLimiter(
+            default_domain_rate if default_domain_rate is not None else settings.EMAIL_WORKER_DOMAIN_RATE,
+            domain_rates if domain_rates is not None else settings.EMAIL_WORKER_DOMAIN_RATES,
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._idle_connections: List[aiosmtplib.SMTP] = []
+        self._redis = None
+        self._in_flight_messages = 0
+
+    async def _get_connection(self) -> aiosmtplib.SMTP:
+        if self._idle_connections:
+            return self._idle_connections.pop()
+
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.EMAIL_HOST,
+            port=settings.EMAIL_PORT,
+            username=settings.EMAIL_HOST_USER or None,
+            password=settings.EMAIL_HOST_PASSWORD or None,
+            use_tls=settings.EMAIL_USE_SSL,
+            start_tls=settings.EMAIL_USE_TLS,
+            timeout=settings.EMAIL_TIMEOUT or 60,
+        )
+        await smtp.connect()
+        return smtp
+
+    @staticmethod
+    async def _discard_connection(smtp: aiosmtplib.SMTP) -> None:
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+
+    async def deliver(self, message: dict) -> bool:
+        """
+        Sends a single buffered message. Returns False if it should be retried.
+        """
+        async with self._semaphore:
+            domain = message["to"][0].rsplit("@", 1)[-1].lower()
+            await self.rate_limiter.acquire(domain)
+
+            email = EmailBatchService.build_email(message)
+            smtp = None
+            try:
+                smtp = await self._get_connection()
+                await smtp.send_message(email.message())
+            except Exception as e:
+                logger.error(f"Failed to send email '{message['subject']}' to {message['to']}: {e}")
+                if smtp is not None:
+                    await self._discard_connection(smtp)
+                return False
+
+            self._idle_connections.append(smtp)
+            return True
+
+    async def send_all(self, messages: List[dict]) -> Tuple[int, List[dict]]:
+        results = await asyncio.gather(*(self.deliver(message) for message in messages))
+        failed = [message for message, delivered in zip(messages, results) if not delivered]
+        return len(messages) - len(failed), failed
+
+    async def close(self) -> None:
+        for smtp in self._idle_connections:
+            await self._discard_connection(smtp)
+        self._idle_connections.clear()
+
+    async def _handle_failure(self, message: dict) -> None:
+        """
+        Dead-letters a message out of attempts, or schedules its retry after an exponential backoff,
+        so an unreachable SMTP host is not retried in a loop that also starves the other domains.
+        """
+        message["attempts"] += 1
+        if message["attempts"] >= settings.EMAIL_MAX_ATTEMPTS:
+            await EmailBufferRepository.adead_letter(self._redis, [message])
+            return
+
+        due_at = time.time() + settings.EMAIL_RETRY_BACKOFF * 2 ** message["attempts"]
+        await EmailBufferRepository.aschedule_retry(self._redis, message, due_at)
+
+    async def _deliver_buffered(self, message: dict) -> None:
+        if not await self.deliver(message):
+            await self._handle_failure(message)
+
+    async def _reclaim_stale(self) -> None:
+        reclaimed = await EmailBufferRepository.areclaim_stale(self._redis, settings.EMAIL_CLAIM_TIMEOUT)
+        if reclaimed:
+            logger.warning(f"Put back {reclaimed} emails left unacknowledged by a stopped worker.")
+
+    async def _deliver_claim(self, claim_id: str, messages: List[dict]) -> None:
+        """
+        Delivers a claimed batch and acknowledges it once every message was sent or rescheduled.
+        """
+        try:
+            await asyncio.gather(*(self._deliver_buffered(message) for message in messages))
+            await EmailBufferRepository.aacknowledge(self._redis, claim_id)
+        finally:
+            self._in_flight_messages -= len(messages)
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        Consumes the Redis buffer until stop_event is set.
+        """
+        stop_event = stop_event or asyncio.Event()
+        self._redis = create_async_redis_client()
+        self._in_flight_messages = 0
+        in_flight = set()
+        logger.info(f"Async email worker started with concurrency={self.concurrency}.")
+
+        try:
+            while not stop_event.is_set():
+                await EmailBufferRepository.arequeue_due(self._redis, self.concurrency)
+                await self._reclaim_stale()
+
+                # Keep no more than one round of messages waiting on the semaphore.
+                room = self.concurrency * 2 - self._in_flight_messages
+                if room <= 0:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                claim_id, messages = await EmailBufferRepository.aclaim_batch(self._redis, min(self.concurrency, room))
+                if not messages:
+                    await asyncio.sleep(self.POLL_INTERVAL)
+                    continue
+
+                self._in_flight_messages += len(messages)
+                task = asyncio.create_task(self._deliver_claim(claim_id, messages))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        finally:
+            if in_flight:
+                await asyncio.wait(in_flight)
+            await self.close()
+            await self._redis.aclose()
+            logger.info("Async email worker stopped.")
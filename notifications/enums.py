@@ -0,0 +1,21 @@
+from enum import Enum
+
+
+class OutboxStatus(Enum):
+    PENDING = "PENDING"
+    DISPATCHED = "DISPATCHED"
+    FAILED = "FAILED"
+
+    @classmethod
+    def choices(cls):
+        return [(status.value, status.name.capitalize()) for status in cls]
+
+
+class NotificationKind(Enum):
+    BOOKING_CREATION = "BOOKING_CREATION"
+    BOOKING_MODIFICATION = "BOOKING_MODIFICATION"
+    BOOKING_CONFIRMATION = "BOOKING_CONFIRMATION"
+    BOOKING_CANCELLATION = "BOOKING_CANCELLATION"
+    CHECK_IN = "CHECK_IN"
+    CHECK_OUT = "CHECK_OUT"
+    NO_SHOW = "NO_SHOW"
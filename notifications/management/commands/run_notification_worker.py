@@ -0,0 +1,35 @@
+import asyncio
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from notifications.async_worker import AsyncEmailWorker
+
+
+class Command(BaseCommand):
+    help = "Runs the asyncio email worker that drains the notification buffer over pooled SMTP connections."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, help="Maximum number of emails in flight.")
+        parser.add_argument("--domain-rate", type=float, help="Default messages per second per recipient domain.")
+
+    def handle(self, *args, **options):
+        if not settings.ASYNC_EMAIL_WORKER_ENABLED:
+            raise CommandError(
+                "ASYNC_EMAIL_WORKER_ENABLED is off, so Celery's flush_email_batch drains the buffer. "
+                "Enable it to make this worker the only consumer."
+            )
+        worker = AsyncEmailWorker(
+            concurrency=options["concurrency"],
+            default_domain_rate=options["domain_rate"],
+        )
+        asyncio.run(self._run(worker))
+
+    @staticmethod
+    async def _run(worker: AsyncEmailWorker):
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+        await worker.run(stop_event)
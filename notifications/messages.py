@@ -0,0 +1,80 @@
+from typing import Dict, List, Tuple
+
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+from notifications.enums import NotificationKind
+
+SUBJECTS: Dict[NotificationKind, str] = {
+    NotificationKind.BOOKING_CREATION: "Booking Created",
+    NotificationKind.BOOKING_MODIFICATION: "Booking Modification",
+    NotificationKind.BOOKING_CONFIRMATION: "Booking Confirmation",
+    NotificationKind.BOOKING_CANCELLATION: "Booking Cancellation",
+    NotificationKind.CHECK_IN: "Check-In Confirmation",
+    NotificationKind.CHECK_OUT: "Check-Out Confirmation",
+    NotificationKind.NO_SHOW: "No Show",
+}
+
+LAYOUT_TEMPLATE = "notifications/layout.html"
+
+# Compiled templates, filled once per process by load_templates().
+_templates: Dict[str, object] = {}
+
+
+def _template_names() -> List[str]:
+    names = [LAYOUT_TEMPLATE]
+    for kind in NotificationKind:
+        names.append(f"notifications/{kind.value.lower()}.txt")
+        names.append(f"notifications/{kind.value.lower()}.html")
+    return names
+
+
+def load_templates() -> None:
+    """
+    Compiles every notification template. Called when a worker process starts, so
+    rendering never touches the filesystem or the template parser afterwards.
+    """
+    for name in _template_names():
+        if name not in _templates:
+            _templates[name] = get_template(name)
+
+
+def _render(name: str, context: dict) -> str:
+    if name not in _templates:
+        load_templates()
+    return _templates[name].render(context).strip()
+
+
+def _render_parts(kind: NotificationKind, booking_details: dict) -> Tuple[str, str, str]:
+    name = kind.value.lower()
+    return (
+        SUBJECTS[kind],
+        _render(f"notifications/{name}.txt", booking_details),
+        _render(f"notifications/{name}.html", booking_details),
+    )
+
+
+def _render_layout(sections: List[Tuple[str, str, str]]) -> str:
+    return _render(LAYOUT_TEMPLATE, {
+        "sections": [{"subject": subject, "html": mark_safe(html)} for subject, _, html in sections],
+    })
+
+
+def render_notification(kind: NotificationKind, booking_details: dict) -> Tuple[str, str, str]:
+    """
+    Returns the subject, plain text body and HTML body for a single notification.
+    """
+    section = _render_parts(kind, booking_details)
+    return section[0], section[1], _render_layout([section])
+
+
+def render_digest(events: List[dict]) -> Tuple[str, str, str]:
+    """
+    Returns one subject, plain text body and HTML body covering every event in a client's digest.
+    """
+    if len(events) == 1:
+        return render_notification(NotificationKind(events[0]["kind"]), events[0]["details"])
+
+    sections = [_render_parts(NotificationKind(event["kind"]), event["details"]) for event in events]
+    message = "\n\n".join(f"{subject}\n{text}" for subject, text, _ in sections)
+    return "Booking Updates", message, _render_layout(sections)
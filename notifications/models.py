@@ -0,0 +1,22 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from notifications.enums import OutboxStatus
+
+
+class OutboxMessage(models.Model):
+    task_name = models.CharField(max_length=255)
+    args = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=20, choices=OutboxStatus.choices(), default=OutboxStatus.PENDING.value)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Outbox message {self.id} - {self.task_name} ({self.get_status_display()})"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
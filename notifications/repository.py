@@ -0,0 +1,250 @@
+import json
+import time
+import uuid
+from typing import List, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from notifications.enums import OutboxStatus
+from notifications.models import OutboxMessage
+from utils.redis_client import get_redis_client
+
+
+class OutboxRepository:
+
+    @staticmethod
+    def add_message(
+            task_name: str,
+            args: list
+    ) -> OutboxMessage:
+        return OutboxMessage.objects.create(task_name=task_name, args=args)
+
+    @staticmethod
+    def lock_pending_batch(batch_size: int) -> List[OutboxMessage]:
+        """
+        Locks the oldest pending messages, skipping rows already held by another relay.
+        Must be called inside a transaction.
+        """
+        return list(
+            OutboxMessage.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=OutboxStatus.PENDING.value)
+            .order_by('id')[:batch_size]
+        )
+
+    @staticmethod
+    def mark_dispatched(message_ids: List[int]) -> None:
+        OutboxMessage.objects.filter(id__in=message_ids).update(
+            status=OutboxStatus.DISPATCHED.value,
+            dispatched_at=timezone.now()
+        )
+
+    @staticmethod
+    def mark_failed_attempt(
+            message: OutboxMessage,
+            error: str,
+            max_attempts: int
+    ) -> None:
+        message.attempts += 1
+        message.last_error = error
+        if message.attempts >= max_attempts:
+            message.status = OutboxStatus.FAILED.value
+        message.save(update_fields=['attempts', 'last_error', 'status'])
+
+
+class EmailBufferRepository:
+    """
+    Buffered emails are claimed rather than popped: a claimed batch is moved to its own processing
+    list and only deleted once every message in it was sent, requeued or dead-lettered. Claims whose
+    consumer died are put back in the buffer after EMAIL_CLAIM_TIMEOUT seconds, so delivery is
+    at least once; a consumer that dies after sending but before acknowledging sends its batch twice.
+    Methods prefixed with `a` do the same over an asyncio client, for the async worker.
+    """
+    BUFFER_KEY = "notifications:email:buffer"
+    DEAD_LETTER_KEY = "notifications:email:dead_letter"
+    PROCESSING_KEY_PREFIX = "notifications:email:processing:"
+    # Claim ids of unacknowledged batches, scored by the time they were claimed.
+    CLAIMS_KEY = "notifications:email:claims"
+    # Moves up to ARGV[1] messages from the buffer (KEYS[1]) to the processing list (KEYS[2]) and
+    # records the claim ARGV[3] at time ARGV[2] in KEYS[3].
+    CLAIM_SCRIPT = """
+        local batch = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+        if #batch > 0 then
+            redis.call('LTRIM', KEYS[1], #batch, -1)
+            redis.call('RPUSH', KEYS[2], unpack(batch))
+            redis.call('ZADD', KEYS[3], ARGV[2], ARGV[3])
+        end
+        return batch
+    """
+    # Puts the messages of claims (KEYS[1]) made before ARGV[1] back in the buffer (KEYS[2]).
+    RECLAIM_SCRIPT = """
+        local moved = 0
+        for _, claim in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])) do
+            local key = ARGV[2] .. claim
+            local batch = redis.call('LRANGE', key, 0, -1)
+            if #batch > 0 then
+                redis.call('RPUSH', KEYS[2], unpack(batch))
+                moved = moved + #batch
+            end
+            redis.call('DEL', key)
+            redis.call('ZREM', KEYS[1], claim)
+        end
+        return moved
+    """
+    # Failed messages waiting for their next attempt, scored by the time it is due.
+    RETRY_KEY = "notifications:email:retry"
+    # Moves up to ARGV[2] messages due by ARGV[1] from the retry set (KEYS[1]) to the buffer (KEYS[2]).
+    REQUEUE_DUE_SCRIPT = """
+        local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+        if #due > 0 then
+            redis.call('ZREM', KEYS[1], unpack(due))
+            redis.call('RPUSH', KEYS[2], unpack(due))
+        end
+        return #due
+    """
+
+    @staticmethod
+    def push(message: dict) -> int:
+        """
+        Appends a message to the buffer and returns the buffer length.
+        """
+        return get_redis_client().rpush(EmailBufferRepository.BUFFER_KEY, json.dumps(message))
+
+    @staticmethod
+    def _claim_command(batch_size: int) -> Tuple[str, list]:
+        claim_id = uuid.uuid4().hex
+        return claim_id, [
+            EmailBufferRepository.CLAIM_SCRIPT, 3,
+            EmailBufferRepository.BUFFER_KEY,
+            EmailBufferRepository.PROCESSING_KEY_PREFIX + claim_id,
+            EmailBufferRepository.CLAIMS_KEY,
+            batch_size, time.time(), claim_id,
+        ]
+
+    @staticmethod
+    def _acknowledge_in(pipeline, claim_id: str) -> None:
+        pipeline.delete(EmailBufferRepository.PROCESSING_KEY_PREFIX + claim_id)
+        pipeline.zrem(EmailBufferRepository.CLAIMS_KEY, claim_id)
+
+    @staticmethod
+    def _reclaim_command(timeout: float) -> list:
+        return [
+            EmailBufferRepository.RECLAIM_SCRIPT, 2,
+            EmailBufferRepository.CLAIMS_KEY, EmailBufferRepository.BUFFER_KEY,
+            time.time() - timeout, EmailBufferRepository.PROCESSING_KEY_PREFIX,
+        ]
+
+    @staticmethod
+    def claim_batch(batch_size: int) -> Tuple[str, List[dict]]:
+        """
+        Atomically claims up to batch_size messages from the head of the buffer. Returns the claim id
+        to acknowledge once the batch is handled, and the messages.
+        """
+        claim_id, command = EmailBufferRepository._claim_command(batch_size)
+        raw_messages = get_redis_client().eval(*command)
+        return claim_id, [json.loads(raw) for raw in raw_messages]
+
+    @staticmethod
+    async def aclaim_batch(client, batch_size: int) -> Tuple[str, List[dict]]:
+        claim_id, command = EmailBufferRepository._claim_command(batch_size)
+        raw_messages = await client.eval(*command)
+        return claim_id, [json.loads(raw) for raw in raw_messages]
+
+    @staticmethod
+    def acknowledge(claim_id: str) -> None:
+        pipeline = get_redis_client().pipeline(transaction=True)
+        EmailBufferRepository._acknowledge_in(pipeline, claim_id)
+        pipeline.execute()
+
+    @staticmethod
+    async def aacknowledge(client, claim_id: str) -> None:
+        pipeline = client.pipeline(transaction=True)
+        EmailBufferRepository._acknowledge_in(pipeline, claim_id)
+        await pipeline.execute()
+
+    @staticmethod
+    def reclaim_stale(timeout: float) -> int:
+        """
+        Puts back in the buffer the messages of claims older than timeout seconds, whose consumer
+        presumably died. Returns the number of messages put back.
+        """
+        return get_redis_client().eval(*EmailBufferRepository._reclaim_command(timeout))
+
+    @staticmethod
+    async def areclaim_stale(client, timeout: float) -> int:
+        return await client.eval(*EmailBufferRepository._reclaim_command(timeout))
+
+    @staticmethod
+    async def aschedule_retry(client, message: dict, due_at: float) -> None:
+        """
+        Holds a failed message in the retry set until due_at (a Unix timestamp).
+        """
+        # Identical messages must stay distinct members of the retry set.
+        message.setdefault("retry_id", uuid.uuid4().hex)
+        await client.zadd(EmailBufferRepository.RETRY_KEY, {json.dumps(message): due_at})
+
+    @staticmethod
+    async def arequeue_due(client, limit: int) -> int:
+        """
+        Moves up to limit retries that are due back to the buffer. Returns how many were moved.
+        """
+        return await client.eval(
+            EmailBufferRepository.REQUEUE_DUE_SCRIPT, 2,
+            EmailBufferRepository.RETRY_KEY, EmailBufferRepository.BUFFER_KEY,
+            time.time(), limit,
+        )
+
+    @staticmethod
+    def requeue(messages: List[dict]) -> None:
+        if messages:
+            get_redis_client().rpush(EmailBufferRepository.BUFFER_KEY, *[json.dumps(m) for m in messages])
+
+    @staticmethod
+    def dead_letter(messages: List[dict]) -> None:
+        if messages:
+            get_redis_client().rpush(EmailBufferRepository.DEAD_LETTER_KEY, *[json.dumps(m) for m in messages])
+
+    @staticmethod
+    async def adead_letter(client, messages: List[dict]) -> None:
+        if messages:
+            await client.rpush(EmailBufferRepository.DEAD_LETTER_KEY, *[json.dumps(m) for m in messages])
+
+
+class NotificationDigestRepository:
+    DIGEST_KEY = "notifications:digest:{client_email}"
+    SCHEDULED_KEY = "notifications:digest:{client_email}:scheduled"
+
+    @staticmethod
+    def add_event(client_email: str, event: dict, window: int) -> bool:
+        """
+        Appends an event to the client's digest. Returns True if it opened a new window,
+        i.e. the caller is responsible for scheduling the flush.
+        """
+        pipeline = get_redis_client().pipeline(transaction=True)
+        pipeline.rpush(
+            NotificationDigestRepository.DIGEST_KEY.format(client_email=client_email),
+            json.dumps(event, cls=DjangoJSONEncoder),
+        )
+        # The marker outlives the window so a late flush cannot let a second one be scheduled.
+        pipeline.set(
+            NotificationDigestRepository.SCHEDULED_KEY.format(client_email=client_email),
+            1,
+            nx=True,
+            ex=window * 2,
+        )
+        _, opened = pipeline.execute()
+        return bool(opened)
+
+    @staticmethod
+    def drain(client_email: str) -> List[dict]:
+        """
+        Atomically takes every pending event for the client and closes the window.
+        """
+        digest_key = NotificationDigestRepository.DIGEST_KEY.format(client_email=client_email)
+        pipeline = get_redis_client().pipeline(transaction=True)
+        pipeline.lrange(digest_key, 0, -1)
+        pipeline.delete(digest_key)
+        pipeline.delete(NotificationDigestRepository.SCHEDULED_KEY.format(client_email=client_email))
+        raw_events, _, _ = pipeline.execute()
+        return [json.loads(raw) for raw in raw_events]
@@ -0,0 +1,247 @@
+import logging
+from typing import Optional, List, Tuple, Dict, Set
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+
+from notifications.enums import NotificationKind
+from notifications.repository import OutboxRepository, EmailBufferRepository, NotificationDigestRepository
+from utils.broker import publish
+from utils.exceptions import BrokerUnavailableException
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxService:
+    def __init__(
+            self,
+            outbox_repository: Optional[OutboxRepository] = None
+    ):
+        self.outbox_repository = outbox_repository or OutboxRepository()
+
+    def enqueue(self, task_name: str, *args) -> None:
+        """
+        Records a task to be published once the surrounding transaction commits.
+        """
+        self.outbox_repository.add_message(task_name=task_name, args=list(args))
+
+    @transaction.atomic
+    def relay_batch(self, batch_size: int) -> int:
+        messages = self.outbox_repository.lock_pending_batch(batch_size)
+
+        dispatched_ids = []
+        for message in messages:
+            try:
+                publish(message.task_name, args=message.args, task_id=f"outbox-{message.id}")
+            except BrokerUnavailableException as e:
+                # Only a publish that actually failed counts as an attempt; while the circuit
+                # is open the rest of the batch simply stays pending.
+                if e.__cause__ is not None:
+                    logger.error(f"Failed to relay outbox message {message.id} ({message.task_name}): {e.__cause__}")
+                    self.outbox_repository.mark_failed_attempt(message, str(e.__cause__), settings.OUTBOX_MAX_ATTEMPTS)
+                break
+            dispatched_ids.append(message.id)
+
+        self.outbox_repository.mark_dispatched(dispatched_ids)
+        return len(dispatched_ids)
+
+    def relay_pending(self, batch_size: Optional[int] = None) -> int:
+        """
+        Drains the outbox batch by batch until a batch comes back short or fails to publish.
+        """
+        batch_size = batch_size or settings.OUTBOX_RELAY_BATCH_SIZE
+        total = 0
+        while True:
+            relayed = self.relay_batch(batch_size)
+            total += relayed
+            if relayed < batch_size:
+                break
+
+        if total:
+            logger.info(f"Relayed {total} outbox messages.")
+        return total
+
+
+class EmailBatchService:
+    def __init__(
+            self,
+            email_buffer_repository: Optional[EmailBufferRepository] = None
+    ):
+        self.email_buffer_repository = email_buffer_repository or EmailBufferRepository()
+
+    def enqueue(self, client_email: str, subject: str, message: str, html_message: Optional[str] = None) -> None:
+        """
+        Buffers a message and schedules a flush as soon as a full batch is waiting.
+        """
+        buffered_message = {
+            "to": [client_email],
+            "subject": subject,
+            "body": message,
+            "attempts": 0,
+        }
+        if html_message:
+            buffered_message["html"] = html_message
+        buffered = self.email_buffer_repository.push(buffered_message)
+        # The async worker drains the buffer continuously; a flush task would compete with it.
+        if buffered >= settings.EMAIL_BATCH_SIZE and not settings.ASYNC_EMAIL_WORKER_ENABLED:
+            try:
+                publish('notifications.tasks.flush_email_batch')
+            except BrokerUnavailableException:
+                # The messages are safe in the buffer; the periodic flush will send them.
+                logger.warning("Could not schedule an early email flush, leaving it to the periodic flush.")
+
+    def flush(self, batch_size: Optional[int] = None) -> int:
+        """
+        Sends buffered messages over a single SMTP connection until the buffer is drained.
+        Batches left claimed by a flush that died are put back in the buffer first.
+        """
+        batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+        reclaimed = self.email_buffer_repository.reclaim_stale(settings.EMAIL_CLAIM_TIMEOUT)
+        if reclaimed:
+            logger.warning(f"Put back {reclaimed} emails left unacknowledged by a failed flush.")
+
+        total_sent = 0
+        while True:
+            claim_id, messages = self.email_buffer_repository.claim_batch(batch_size)
+            if not messages:
+                break
+
+            sent, failed = self.send_batch(messages)
+            total_sent += sent
+            self._retry_or_dead_letter(failed)
+            self.email_buffer_repository.acknowledge(claim_id)
+
+            if len(messages) < batch_size or failed:
+                break
+
+        if total_sent:
+            logger.info(f"Flushed {total_sent} buffered emails.")
+        return total_sent
+
+    @staticmethod
+    def build_email(message: dict, connection=None) -> EmailMultiAlternatives:
+        email = EmailMultiAlternatives(
+            subject=message["subject"],
+            body=message["body"],
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=message["to"],
+            connection=connection,
+        )
+        if message.get("html"):
+            email.attach_alternative(message["html"], "text/html")
+        return email
+
+    @staticmethod
+    def send_batch(messages: List[dict]) -> Tuple[int, List[dict]]:
+        """
+        Delivers messages over one connection, one send per message so a single bad
+        recipient does not fail the whole batch. Returns the sent count and the failures.
+        """
+        try:
+            connection = get_connection(fail_silently=False)
+            connection.open()
+        except Exception as e:
+            logger.error(f"Could not open SMTP connection for batch of {len(messages)} emails: {e}")
+            return 0, messages
+
+        sent = 0
+        failed = []
+        try:
+            for message in messages:
+                email = EmailBatchService.build_email(message, connection=connection)
+                try:
+                    sent += connection.send_messages([email])
+                except Exception as e:
+                    logger.error(f"Failed to send email '{message['subject']}' to {message['to']}: {e}")
+                    failed.append(message)
+        finally:
+            connection.close()
+
+        return sent, failed
+
+    def _retry_or_dead_letter(self, failed: List[dict]) -> None:
+        retry, dead = [], []
+        for message in failed:
+            message["attempts"] += 1
+            if message["attempts"] >= settings.EMAIL_MAX_ATTEMPTS:
+                dead.append(message)
+            else:
+                retry.append(message)
+
+        self.email_buffer_repository.requeue(retry)
+        self.email_buffer_repository.dead_letter(dead)
+        if dead:
+            logger.error(f"{len(dead)} emails moved to the dead-letter list after {settings.EMAIL_MAX_ATTEMPTS} attempts.")
+
+
+class NotificationDigestService:
+    # A later notification for the same booking makes these earlier ones redundant.
+    SUPERSEDES: Dict[NotificationKind, Set[NotificationKind]] = {
+        NotificationKind.BOOKING_CONFIRMATION: {NotificationKind.BOOKING_CREATION},
+        NotificationKind.BOOKING_CANCELLATION: {
+            NotificationKind.BOOKING_CREATION,
+            NotificationKind.BOOKING_MODIFICATION,
+            NotificationKind.BOOKING_CONFIRMATION,
+        },
+        NotificationKind.NO_SHOW: {NotificationKind.BOOKING_CONFIRMATION},
+    }
+
+    def __init__(
+            self,
+            digest_repository: Optional[NotificationDigestRepository] = None
+    ):
+        self.digest_repository = digest_repository or NotificationDigestRepository()
+
+    def add(self, client_email: str, kind: NotificationKind, booking_details: dict) -> None:
+        """
+        Holds a notification in the client's digest and schedules the flush when it opens a new window.
+        """
+        window = settings.NOTIFICATION_DIGEST_WINDOW
+        opened = self.digest_repository.add_event(
+            client_email,
+            {"kind": kind.value, "details": booking_details},
+            window,
+        )
+        if opened:
+            try:
+                publish('notifications.tasks.flush_notification_digest', args=[client_email], countdown=window)
+            except BrokerUnavailableException:
+                logger.warning(f"Could not schedule the digest flush for {client_email}, sending it now.")
+                from notifications.tasks import flush_notification_digest
+                flush_notification_digest(client_email)
+
+    def drain(self, client_email: str) -> List[dict]:
+        return self.merge(self.digest_repository.drain(client_email))
+
+    @classmethod
+    def merge(cls, events: List[dict]) -> List[dict]:
+        """
+        Drops notifications overtaken by a later state of the same booking. Repeated
+        modifications collapse into one that spans from the first "before" to the last "after".
+        """
+        merged: List[dict] = []
+        for event in events:
+            kind = NotificationKind(event["kind"])
+            booking_id = event["details"].get("booking_id")
+            if booking_id is None:
+                merged.append(event)
+                continue
+
+            replaced = cls.SUPERSEDES.get(kind, set()) | {kind}
+            kept = []
+            for previous in merged:
+                if previous["details"].get("booking_id") != booking_id \
+                        or NotificationKind(previous["kind"]) not in replaced:
+                    kept.append(previous)
+                elif kind == NotificationKind.BOOKING_MODIFICATION == NotificationKind(previous["kind"]):
+                    event = {
+                        "kind": event["kind"],
+                        "details": {
+                            **event["details"],
+                            **{k: v for k, v in previous["details"].items() if k.endswith("_before")},
+                        },
+                    }
+            merged = kept + [event]
+
+        return merged
@@ -0,0 +1,29 @@
+from celery import shared_task
+from celery.signals import worker_process_init
+
+from bookings.tasks import send_booking_email
+from notifications.messages import render_digest, load_templates
+from notifications.services import OutboxService, EmailBatchService, NotificationDigestService
+
+
+@worker_process_init.connect
+def preload_notification_templates(**kwargs):
+    load_templates()
+
+
+@shared_task(ignore_result=True)
+def relay_outbox():
+    OutboxService().relay_pending()
+
+
+@shared_task(ignore_result=True)
+def flush_email_batch():
+    EmailBatchService().flush()
+
+
+@shared_task(ignore_result=True)
+def flush_notification_digest(client_email: str):
+    events = NotificationDigestService().drain(client_email)
+    if events:
+        subject, message, html_message = render_digest(events)
+        send_booking_email(client_email, subject, message, html_message)
@@ -6,6 +6,7 @@ class RoomStatus(Enum):
     BOOKED = 'BOOKED'
     OCCUPIED = 'OCCUPIED'
     MAINTENANCE = 'MAINTENANCE'
+    CLEANING = 'CLEANING'
 
     @classmethod
     def choices(cls):
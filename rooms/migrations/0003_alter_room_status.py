@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rooms', '0002_rename_type_room_room_type'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='room',
+            name='status',
+            field=models.CharField(choices=[('AVAILABLE', 'Available'), ('BOOKED', 'Booked'), ('OCCUPIED', 'Occupied'), ('MAINTENANCE', 'Maintenance'), ('CLEANING', 'Cleaning')], default='AVAILABLE', max_length=20),
+        ),
+    ]
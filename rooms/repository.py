@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional
+from typing import Optional, List
 
 from django.db.models import QuerySet
 
@@ -7,7 +7,9 @@ from bookings.enums import BookingStatus
 from bookings.models import Booking
 from rooms.enums import RoomStatus, RoomType
 from rooms.models import Room
+from utils.db_router import replica_for_read
 from utils.exceptions import RoomNotAvailableForSelectedDatesException, RoomNotFoundException
+from utils.prepared_statements import prepared_statements
 
 
 class RoomRepository:
@@ -20,6 +22,7 @@ class RoomRepository:
         room.save()
 
     @staticmethod
+    @replica_for_read
     def get_room_by_id(
             room_id: int
     ) -> Room:
@@ -31,6 +34,19 @@ class RoomRepository:
         return room
 
     @staticmethod
+    @replica_for_read
+    async def aget_room_by_id(
+            room_id: int
+    ) -> Room:
+        return await Room.objects.aget(id=room_id)
+
+    @staticmethod
+    @replica_for_read
+    async def aget_room_by_number(room_number: str) -> Optional[Room]:
+        return await Room.objects.filter(number=room_number).afirst()
+
+    @staticmethod
+    @replica_for_read
     def get_room_by_number(room_number: str):
         room = Room.objects.filter(number=room_number).first()
         if not room:
@@ -38,6 +54,7 @@ class RoomRepository:
         return room
 
     @staticmethod
+    @prepared_statements()
     def get_available_room(
             room_type: RoomType = None
     ) -> Room:
@@ -49,6 +66,7 @@ class RoomRepository:
         return room
 
     @staticmethod
+    @replica_for_read
     def get_all_rooms():
         return Room.objects.all()
 
@@ -84,6 +102,7 @@ class RoomRepository:
         room.delete()
 
     @staticmethod
+    @replica_for_read
     def get_available_rooms(
             room_type: Optional[RoomType],
             price: Optional[float],
@@ -115,6 +134,30 @@ class RoomRepository:
         room.status = status.value
         room.save()
 
+    @staticmethod
+    def update_room_status_for_booking(booking_id: int, status: RoomStatus) -> int:
+        return Room.objects.filter(bookings__id=booking_id).update(status=status.value)
+
+    @staticmethod
+    def bulk_update_room_status(room_ids: List[int], status: RoomStatus) -> int:
+        return Room.objects.filter(id__in=room_ids).update(status=status.value)
+
+    @staticmethod
+    def release_cleaned_room(room_id: int) -> int:
+        """
+        Puts a room back in inventory, but only if it is still waiting for housekeeping. Rooms in
+        MAINTENANCE for other reasons are left alone.
+        """
+        return Room.objects.filter(id=room_id, status=RoomStatus.CLEANING.value).update(
+            status=RoomStatus.AVAILABLE.value
+        )
+
+    @staticmethod
+    @replica_for_read
+    def get_rooms_by_ids(room_ids: List[int]) -> List[Room]:
+        return list(Room.objects.filter(id__in=room_ids))
+
+    @replica_for_read
     def filter_rooms(
             self,
             status: Optional[RoomStatus] = None,
@@ -36,6 +36,21 @@ class RoomService:
             logger.error(f"Error listing rooms: {e}")
             raise
 
+    async def alist_rooms(
+            self,
+            status: Optional[RoomStatus] = None,
+            room_type: Optional[RoomType] = None
+    ) -> List[Room]:
+        try:
+            logger.info(f"Listing rooms with status={status} and room_type={room_type}")
+            queryset = self.room_repository.filter_rooms(status=status, room_type=room_type)
+            rooms = [room async for room in queryset]
+            logger.info(f"Listed {len(rooms)} rooms")
+            return rooms
+        except Exception as e:
+            logger.error(f"Error listing rooms: {e}")
+            raise
+
     def get_room(
             self,
             room_id: int
@@ -54,6 +69,22 @@ class RoomService:
             logger.error(f"Error retrieving room: {e}")
             raise
 
+    async def aget_room(
+            self,
+            room_id: int
+    ) -> Room:
+        try:
+            logger.info(f"Getting room with ID={room_id}")
+            room = await self.room_repository.aget_room_by_id(room_id)
+            logger.info(f"Retrieved room with ID={room_id}")
+            return room
+        except Room.DoesNotExist:
+            logger.error(f"Room not found: {room_id}")
+            raise RoomNotFoundException()
+        except Exception as e:
+            logger.error(f"Error retrieving room: {e}")
+            raise
+
     @transaction.atomic
     def create_room(
             self,
@@ -126,6 +157,15 @@ class RoomService:
             raise RoomNotFoundException()
         return room.status
 
+    async def acheck_availability_by_number(
+            self,
+            room_number: str
+    ) -> RoomStatus:
+        room = await self.room_repository.aget_room_by_number(room_number)
+        if not room:
+            raise RoomNotFoundException()
+        return room.status
+
     def get_available_rooms(
             self,
             room_type: Optional[RoomType] = None,
@@ -165,3 +205,32 @@ class RoomService:
 
         logger.info("Successfully fetched available rooms.")
         return available_rooms
+
+    async def aget_available_rooms(
+            self,
+            room_type: Optional[RoomType] = None,
+            price: Optional[float] = None,
+            check_in_date: date = None,
+            check_out_date: date = None
+    ) -> List[Room]:
+        """
+        get_available_rooms for async views, evaluated in a single query.
+        """
+        if not check_in_date or not check_out_date:
+            logger.error("check_in_date or check_out_date missing.")
+            raise ValueError("Both check_in_date and check_out_date must be provided.")
+
+        try:
+            available_rooms = self.room_repository.get_available_rooms(
+                room_type=room_type,
+                price=price,
+                check_in_date=check_in_date,
+                check_out_date=check_out_date
+            )
+            rooms = [room async for room in available_rooms]
+            logger.debug(f"Rooms filtered based on criteria: {len(rooms)} rooms found.")
+            return rooms
+
+        except Exception as e:
+            logger.error(f"Error fetching available rooms: {e}")
+            raise
@@ -14,12 +14,17 @@ from rooms.serializers import (
 )
 from rooms.services import RoomService
 from users.enums import UserRole
+from utils.async_views import AsyncAPIView, same_schema_as, sync_handler
 from utils.custom_permissions import IsAdminUser
 from utils.exceptions import RoomNotAvailableForSelectedDatesException, RoomNotFoundException
+from utils.throttling import IPRateThrottle, UserRateThrottle, PartnerRateThrottle
+
+PUBLIC_THROTTLE_CLASSES = [IPRateThrottle, UserRateThrottle, PartnerRateThrottle]
 
 
 class RoomListView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = PUBLIC_THROTTLE_CLASSES
 
     def __init__(
             self,
@@ -155,6 +160,8 @@ class RoomAvailabilityView(APIView):
 
 
 class RoomAvailabilityFilterView(APIView):
+    throttle_classes = PUBLIC_THROTTLE_CLASSES
+
     def __init__(
             self,
             room_service: Optional[RoomService] = None,
@@ -202,3 +209,84 @@ class RoomAvailabilityFilterView(APIView):
 
         except RoomNotAvailableForSelectedDatesException as e:
             return Response({"error": e.message}, status=e.status_code)
+
+
+# Async variants, served by the ASGI entry point (hotel_api/asgi_urls.py). Reads use the async ORM;
+# writes keep the sync handlers and run in a thread.
+
+
+class AsyncRoomListView(AsyncAPIView, RoomListView):
+    @same_schema_as(RoomListView.get)
+    async def get(self, request):
+        filter_serializer = RoomListFilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
+        filters = filter_serializer.validated_data
+        rooms = await self.room_service.alist_rooms(status=filters.get("status"), room_type=filters.get("room_type"))
+        response_serializer = RoomListSerializer(rooms, many=True)
+
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    post = sync_handler(RoomListView.post)
+
+
+class AsyncRoomDetailView(AsyncAPIView, RoomDetailView):
+    @same_schema_as(RoomDetailView.get)
+    async def get(self, request, room_id):
+        room = await self.room_service.aget_room(room_id)
+        serializer = RoomDetailSerializer(room)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    put = sync_handler(RoomDetailView.put)
+    delete = sync_handler(RoomDetailView.delete)
+
+
+class AsyncRoomAvailabilityView(AsyncAPIView, RoomAvailabilityView):
+    @same_schema_as(RoomAvailabilityView.get)
+    async def get(self, request, room_number):
+        serializer = RoomAvailabilitySerializer(data={"room_number": room_number})
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            room_status = await self.room_service.acheck_availability_by_number(
+                serializer.validated_data["room_number"]
+            )
+            return Response(
+                {
+                    "status": "success",
+                    "room_status": room_status
+                },
+                status=status.HTTP_200_OK,
+            )
+        except RoomNotFoundException:
+            return Response(
+                {"error": "Room not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+
+class AsyncRoomAvailabilityFilterView(AsyncAPIView, RoomAvailabilityFilterView):
+    @same_schema_as(RoomAvailabilityFilterView.get)
+    async def get(self, request):
+        serializer = RoomAvailabilityFilterSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        try:
+            available_rooms = await self.room_service.aget_available_rooms(
+                room_type=validated_data.get('type'),
+                price=validated_data.get('price'),
+                check_in_date=validated_data['check_in_date'],
+                check_out_date=validated_data['check_out_date']
+            )
+
+            if available_rooms:
+                serialized_rooms = RoomListSerializer(available_rooms, many=True)
+                return Response(serialized_rooms.data, status=status.HTTP_200_OK)
+            else:
+                return Response({"message": "No rooms available for the specified criteria."},
+                                status=status.HTTP_404_NOT_FOUND)
+
+        except RoomNotAvailableForSelectedDatesException as e:
+            return Response({"error": e.message}, status=e.status_code)
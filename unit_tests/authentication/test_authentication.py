@@ -0,0 +1,268 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, make_password
+from django.db import connection
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from authentication import revocation
+from authentication.authentication import CachedJWTAuthentication
+from authentication.models import RevokedToken
+from authentication.revocation import BloomFilter
+from authentication.token_cache import VerifiedTokenCache
+from authentication.serializers import CustomTokenObtainPairSerializer
+from authentication.services import UserCacheService, TokenRevocationService
+from users.enums import UserRole
+from users.models import User
+from users.repository import UserRepository
+from utils import hashing
+
+
+@pytest.fixture(autouse=True)
+def verified_token_cache():
+    cache = VerifiedTokenCache(max_size=2)
+    with patch('authentication.token_cache.verified_token_cache', cache):
+        yield cache
+
+
+def user_queries(queries) -> list:
+    return [query["sql"] for query in queries if '"users_user"' in query["sql"]]
+
+
+@pytest.mark.django_db
+def test_authenticated_requests_reuse_the_cached_user(auth_api_client):
+    auth_api_client.get("/bookings/")
+
+    with CaptureQueriesContext(connection) as captured:
+        response = auth_api_client.get("/bookings/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert user_queries(captured.captured_queries) == []
+
+
+@pytest.mark.django_db
+def test_saving_a_user_drops_the_cached_snapshot(admin_user):
+    user_cache_service = UserCacheService()
+    assert user_cache_service.get_user(admin_user.id).role == UserRole.ADMIN.value
+
+    admin_user.role = UserRole.CLIENT.value
+    admin_user.save()
+
+    with CaptureQueriesContext(connection) as captured:
+        user = user_cache_service.get_user(admin_user.id)
+    assert user.role == UserRole.CLIENT.value
+    assert len(user_queries(captured.captured_queries)) == 1
+    assert user_cache_service.get_user(admin_user.id) == admin_user
+
+
+@pytest.mark.django_db
+def test_queryset_updates_drop_the_cached_user(admin_user):
+    user_cache_service = UserCacheService()
+    assert user_cache_service.get_user(admin_user.id).is_active
+
+    User.objects.filter(id=admin_user.id).update(is_active=False, role=UserRole.CLIENT.value)
+
+    user = user_cache_service.get_user(admin_user.id)
+    assert not user.is_active
+    assert user.role == UserRole.CLIENT.value
+
+
+@pytest.mark.django_db
+def test_bulk_writes_drop_the_cached_user(admin_user):
+    user_cache_service = UserCacheService()
+    assert user_cache_service.get_user(admin_user.id).role == UserRole.ADMIN.value
+
+    admin_user.role = UserRole.CLIENT.value
+    User.objects.bulk_update([admin_user], ["role"])
+    assert user_cache_service.get_user(admin_user.id).role == UserRole.CLIENT.value
+
+    imported = User(name="Imported", email="imported@example.com", cpf="71882006020", birth_date="2000-01-01",
+                    password=make_password("Imported123!"))
+    with patch('authentication.signals.UserCacheService.invalidate') as invalidate:
+        assert UserRepository.bulk_create_users([imported], batch_size=10) == 1
+    invalidate.assert_called_once_with(User.objects.get(email="imported@example.com").id)
+
+
+@pytest.mark.django_db
+def test_cached_jwt_authentication_rejects_inactive_and_missing_users(admin_user):
+    authentication = CachedJWTAuthentication()
+    token = AccessToken.for_user(admin_user)
+    assert authentication.get_user(token) == admin_user
+
+    User.objects.filter(id=admin_user.id).update(is_active=False)
+    UserCacheService.invalidate(admin_user.id)
+    with pytest.raises(AuthenticationFailed):
+        authentication.get_user(token)
+
+    admin_user.delete()
+    with pytest.raises(AuthenticationFailed):
+        authentication.get_user(token)
+
+
+@pytest.mark.django_db
+def test_login_mints_a_single_token_pair(api_client, admin_user):
+    with patch.object(
+            CustomTokenObtainPairSerializer, 'get_token', wraps=CustomTokenObtainPairSerializer.get_token
+    ) as mock_get_token:
+        response = api_client.post("/token/", data={"email": admin_user.email, "password": "AdminPass123!"})
+
+    assert response.status_code == status.HTTP_200_OK
+    mock_get_token.assert_called_once_with(admin_user)
+    access_token = AccessToken(response.data["access_token"])
+    assert access_token["role"] == UserRole.ADMIN.value
+    assert access_token["email"] == admin_user.email
+
+
+@pytest.mark.django_db
+def test_verified_tokens_skip_signature_verification(admin_user, verified_token_cache):
+    authentication = CachedJWTAuthentication()
+    raw_token = str(AccessToken.for_user(admin_user)).encode()
+
+    with patch.object(
+            JWTAuthentication, 'get_validated_token', autospec=True, side_effect=JWTAuthentication.get_validated_token
+    ) as mock_verify:
+        first = authentication.get_validated_token(raw_token)
+        second = authentication.get_validated_token(raw_token)
+
+    assert mock_verify.call_count == 1
+    assert second is first
+
+
+@pytest.mark.django_db
+def test_verified_token_cache_evicts_least_recent_and_expired_tokens(admin_user, verified_token_cache):
+    tokens = [AccessToken.for_user(admin_user) for _ in range(3)]
+    raw_tokens = [str(token).encode() for token in tokens]
+    for raw_token, token in zip(raw_tokens[:2], tokens[:2]):
+        verified_token_cache.put(raw_token, token)
+    verified_token_cache.get(raw_tokens[0])
+    verified_token_cache.put(raw_tokens[2], tokens[2])
+
+    assert verified_token_cache.get(raw_tokens[1]) is None
+    assert verified_token_cache.get(raw_tokens[0]) is tokens[0]
+
+    tokens[2]["exp"] = int(time.time()) - 1
+    assert verified_token_cache.get(raw_tokens[2]) is None
+
+
+def test_bloom_filter_uses_the_redis_bit_layout():
+    bloom_filter = BloomFilter(size_bits=64, hash_count=1)
+    bloom_filter.set_positions([0, 9])
+
+    assert bytes(bloom_filter.bits[:2]) == bytes([0x80, 0x40])
+    assert BloomFilter(size_bits=64, hash_count=1, bitmap=bytes(bloom_filter.bits)).bits == bloom_filter.bits
+
+
+@pytest.mark.django_db
+def test_revoked_tokens_are_rejected_for_requests_and_refresh(api_client, admin_user):
+    login = api_client.post("/token/", data={"email": admin_user.email, "password": "AdminPass123!"}).data
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {login["access_token"]}')
+
+    response = api_client.post("/token/revoke/", {"refresh_token": login["refresh_token"]}, format="json")
+    assert response.status_code == status.HTTP_200_OK
+
+    assert api_client.get("/bookings/").status_code == status.HTTP_401_UNAUTHORIZED
+    api_client.credentials()
+    response = api_client.post("/token/refresh/", {"refresh": login["refresh_token"]}, format="json")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_unrevoked_tokens_are_checked_without_a_query(auth_api_client):
+    with CaptureQueriesContext(connection) as captured:
+        auth_api_client.get("/bookings/")
+
+    assert not [query for query in captured.captured_queries if "authentication_revokedtoken" in query["sql"]]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_other_processes_see_revocations_after_syncing(admin_user):
+    token = RefreshToken.for_user(admin_user)
+    TokenRevocationService().revoke(token, admin_user)
+
+    revocation.revocation_filter.reset()
+    assert not revocation.revocation_filter.bloom_filter.might_contain(token["jti"])
+    TokenRevocationService().sync_filter()
+    assert TokenRevocationService().is_revoked(token["jti"])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_revocation_checks_sync_the_filter_without_waiting_on_redis(admin_user, revocation_filter_repository):
+    token = RefreshToken.for_user(admin_user)
+    TokenRevocationService().revoke(token, admin_user)
+    revocation.revocation_filter.reset()
+
+    started, released, sync_threads = threading.Event(), threading.Event(), []
+    shared_bitmap = revocation_filter_repository.get_bitmap.side_effect
+
+    def slow_get_bitmap():
+        sync_threads.append(threading.current_thread())
+        started.set()
+        released.wait(timeout=5)
+        return shared_bitmap()
+
+    revocation_filter_repository.get_bitmap.side_effect = slow_get_bitmap
+    # Served from the stale local copy while the reload is still blocked on Redis.
+    assert not TokenRevocationService().is_revoked(token["jti"])
+
+    assert started.wait(timeout=5)
+    assert threading.current_thread() not in sync_threads
+    released.set()
+    sync_threads[0].join(timeout=5)
+    assert TokenRevocationService().is_revoked(token["jti"])
+
+
+@pytest.mark.django_db
+def test_rebuilding_the_filter_drops_expired_revocations(admin_user):
+    service = TokenRevocationService()
+    expired, active = RefreshToken.for_user(admin_user), RefreshToken.for_user(admin_user)
+    service.revoke(expired, admin_user)
+    service.revoke(active, admin_user)
+    RevokedToken.objects.filter(jti=expired["jti"]).update(expires_at=timezone.now())
+
+    assert service.rebuild_filter() == 1
+    assert not revocation.revocation_filter.bloom_filter.might_contain(expired["jti"])
+    assert service.is_revoked(active["jti"])
+    assert not RevokedToken.objects.filter(jti=expired["jti"]).exists()
+
+
+@pytest.mark.django_db
+def test_async_login_checks_the_password_in_the_hashing_pool(api_client, admin_user):
+    with patch('authentication.services.acheck_password', wraps=hashing.acheck_password) as acheck_password:
+        response = api_client.post("/token/async/", {"email": admin_user.email, "password": "AdminPass123!"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert AccessToken(response.data["access_token"])["user_id"] == admin_user.id
+    assert RefreshToken(response.data["refresh_token"])["role"] == UserRole.ADMIN.value
+    acheck_password.assert_awaited_once()
+
+
+@pytest.mark.django_db
+def test_async_login_rejects_bad_credentials(api_client, admin_user):
+    wrong_password = api_client.post("/token/async/", {"email": admin_user.email, "password": "wrong"})
+    unknown_email = api_client.post("/token/async/", {"email": "nobody@example.com", "password": "AdminPass123!"})
+    admin_user.is_active = False
+    admin_user.save()
+    inactive = api_client.post("/token/async/", {"email": admin_user.email, "password": "AdminPass123!"})
+
+    for response in (wrong_password, unknown_email, inactive):
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert api_client.post("/token/async/", {"email": admin_user.email}).status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_async_login_upgrades_outdated_password_hashes(api_client, admin_user):
+    admin_user.password = PBKDF2PasswordHasher().encode("AdminPass123!", "salt", iterations=1000)
+    admin_user.save()
+
+    response = api_client.post("/token/async/", {"email": admin_user.email, "password": "AdminPass123!"})
+
+    assert response.status_code == status.HTTP_200_OK
+    admin_user.refresh_from_db()
+    assert admin_user.password.startswith("pbkdf2_sha256$")
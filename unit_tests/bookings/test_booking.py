@@ -1,6 +1,6 @@
 import logging
 from datetime import date, timedelta
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, ANY
 
 import pytest
 from django.conf import settings
@@ -11,7 +11,8 @@ from bookings.enums import BookingStatus
 from bookings.models import Booking
 from bookings.services import BookingService
 from bookings.tasks import send_booking_creation_email, send_booking_confirmation_email, manage_room_availability
-from checkins.models import CheckInCheckOut
+from checkins.enums import CheckInStatus, CheckOutStatus
+from checkins.kiosk import KioskTokenService
 from rooms.enums import RoomStatus, RoomType
 from rooms.models import Room
 from users.enums import UserRole
@@ -82,7 +83,7 @@ def test_confirm_booking_success(booking_service, mock_user, booking_data):
     booking = Booking.objects.create(**booking_data)
     confirmed_booking = booking_service.confirm_booking(booking.id, user=mock_user)
     assert confirmed_booking.status == BookingStatus.CONFIRMED.value
-    assert CheckInCheckOut.objects.filter(booking=confirmed_booking).exists()
+    assert confirmed_booking.check_in_out is not None
 
 
 @pytest.mark.django_db
@@ -242,16 +243,22 @@ def test_celery_send_booking_confirmation_email_task():
             subject="Booking Confirmation",
             message="Your booking for Room 101 is confirmed!",
             from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[client_email]
+            recipient_list=[client_email],
+            html_message=ANY
         )
+        html_message = mock_send_mail.call_args.kwargs["html_message"]
+        assert "Room <strong>101</strong> is confirmed!" in html_message
 
 
 @pytest.mark.django_db
-def test_confirm_booking_creates_checkin_checkout_instance(booking_service, mock_user, booking_data):
+def test_confirm_booking_prepares_check_in_on_the_booking(booking_service, mock_user, booking_data):
     booking = Booking.objects.create(**booking_data)
     confirmed_booking = booking_service.confirm_booking(booking.id, user=mock_user)
 
-    assert CheckInCheckOut.objects.filter(booking=confirmed_booking).exists()
+    confirmed_booking.refresh_from_db()
+    assert confirmed_booking.check_in_status == CheckInStatus.PENDING.value
+    assert confirmed_booking.check_out_status == CheckOutStatus.PENDING.value
+    assert confirmed_booking.check_in_timestamp is None
 
 
 @pytest.mark.django_db
@@ -269,11 +276,16 @@ def test_confirm_booking_sends_confirmation_email(booking_service, mock_user, bo
     booking = Booking.objects.create(**booking_data)
 
     with patch('utils.email_service.EmailService.send_booking_confirmation') as mock_send_email:
-        booking_service.confirm_booking(booking.id, user=mock_user)
+        confirmed_booking = booking_service.confirm_booking(booking.id, user=mock_user)
         mock_send_email.assert_called_once_with(mock_user.email, {
+            "booking_id": booking.id,
             "room_number": booking.room.number,
-            "check_in_date": booking.check_in_date
+            "check_in_date": booking.check_in_date,
+            "kiosk_token": confirmed_booking.kiosk_token
         })
+    assert KioskTokenService().verify(confirmed_booking.kiosk_token, day=confirmed_booking.check_in_date) == (
+        booking.id, mock_user.id
+    )
 
 
 @pytest.mark.django_db
@@ -294,7 +306,7 @@ def test_confirm_booking_logs_success_information(booking_service, mock_user, ca
     with caplog.at_level(logging.INFO):
         booking_service.confirm_booking(booking.id, user=mock_user)
 
-    assert f"Booking {booking.id} confirmed and CheckInCheckOut created for client {booking.client.id}" in caplog.text
+    assert f"Booking {booking.id} confirmed and ready for check-in for client {booking.client.id}" in caplog.text
 
 
 @pytest.mark.django_db
@@ -303,21 +315,14 @@ def test_manage_room_availability_task():
     no_show_threshold = fixed_now - timedelta(hours=24)
 
     no_show_booking = Mock(id=1, room=Mock(id=101))
-    completed_checkout_booking = Mock(id=2, room=Mock(id=102))
 
     with patch('bookings.repository.BookingRepository.get_no_show_bookings') as mock_get_no_show, \
-         patch('bookings.repository.BookingRepository.get_completed_checkouts') as mock_get_completed_checkouts, \
          patch('bookings.repository.BookingRepository.mark_booking_as_no_show') as mock_mark_no_show, \
-         patch('bookings.repository.BookingRepository.free_up_room') as mock_free_up_room, \
          patch('django.utils.timezone.now', return_value=fixed_now):
 
         mock_get_no_show.return_value = [no_show_booking]
-        mock_get_completed_checkouts.return_value = [completed_checkout_booking]
 
         manage_room_availability()
 
         mock_get_no_show.assert_called_once_with(no_show_threshold)
         mock_mark_no_show.assert_called_once_with(no_show_booking)
-
-        mock_get_completed_checkouts.assert_called_once_with(fixed_now)
-        mock_free_up_room.assert_called_once_with(completed_checkout_booking)
@@ -1,18 +1,28 @@
+import threading
+import time
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework import status
 
 from bookings.enums import BookingStatus
 from bookings.models import Booking
+from bookings.repository import BookingRepository
 from checkins.enums import CheckInStatus, CheckOutStatus
-from checkins.services import CheckInCheckOutService
+from checkins.kiosk import KioskTokenService
+from checkins.services import CheckInCheckOutService, FrontDeskBoardService
+from notifications.models import OutboxMessage
 from rooms.enums import RoomStatus, RoomType
 from rooms.models import Room
+from users.enums import UserRole
 from users.models import User
-from utils.exceptions import AlreadyCheckedInException, AlreadyCheckedOutException, InvalidBookingStatusException
+from utils.exceptions import (
+    AlreadyCheckedInException, AlreadyCheckedOutException, InvalidBookingStatusException,
+    UnauthorizedOrInvalidBookingException, CheckInNotOpenException, InvalidKioskTokenException
+)
 
 
 @pytest.fixture
@@ -135,3 +145,299 @@ def test_check_out_already_checked_out(auth_api_client, mock_booking):
         response = auth_api_client.post(f"/checkout/{mock_booking.id}/")
     assert response.status_code == status.HTTP_409_CONFLICT
     assert response.data["error"] == "This booking has already been checked out."
+
+
+@pytest.fixture
+def batch_bookings(db, mock_user):
+    bookings = []
+    for number in ("201", "202", "203"):
+        room = Room.objects.create(
+            number=number,
+            status=RoomStatus.BOOKED.value,
+            room_type=RoomType.SINGLE.value,
+            price=100.0
+        )
+        bookings.append(Booking.objects.create(
+            client=mock_user,
+            room=room,
+            check_in_date=timezone.now(),
+            check_out_date=timezone.now() + timedelta(days=1),
+            status=BookingStatus.CONFIRMED.value
+        ))
+    for booking in bookings[:2]:
+        BookingRepository.confirm_booking(booking)
+    bookings[2].status = BookingStatus.PENDING.value
+    bookings[2].save()
+    return bookings
+
+
+@pytest.mark.django_db
+def test_batch_check_in_transitions_valid_bookings(check_in_out_service, batch_bookings, django_assert_max_num_queries):
+    booking_ids = [booking.id for booking in batch_bookings] + [9999]
+
+    with django_assert_max_num_queries(8):
+        results = check_in_out_service.perform_batch_check_in(booking_ids)
+
+    assert [result["success"] for result in results] == [True, True, False, False]
+    assert results[2]["message"] == "The booking status does not allow this action."
+    assert results[3]["message"] == "Booking not found."
+    for booking in batch_bookings[:2]:
+        booking.refresh_from_db()
+        assert booking.status == BookingStatus.COMPLETED.value
+        assert booking.room.status == RoomStatus.OCCUPIED.value
+        assert booking.check_in_out.check_in_status == CheckInStatus.COMPLETED.value
+
+    message = OutboxMessage.objects.get()
+    assert message.task_name == 'checkins.tasks.send_checkin_batch_email'
+    assert [booking_details["booking_id"] for _, booking_details in message.args[0]] == booking_ids[:2]
+
+
+@pytest.mark.django_db
+def test_batch_check_out_rejects_bookings_not_checked_in(check_in_out_service, batch_bookings):
+    check_in_out_service.perform_batch_check_in([batch_bookings[0].id])
+
+    results = check_in_out_service.perform_batch_check_out([batch_bookings[0].id, batch_bookings[1].id])
+
+    assert results == [
+        {"booking_id": batch_bookings[0].id, "success": True, "message": "Checked out successfully."},
+        {
+            "booking_id": batch_bookings[1].id,
+            "success": False,
+            "message": "The booking status does not allow this action."
+        },
+    ]
+    batch_bookings[0].refresh_from_db()
+    assert batch_bookings[0].check_out_status == CheckOutStatus.COMPLETED.value
+
+
+@pytest.mark.django_db
+def test_batch_check_in_requires_staff(auth_api_client, batch_bookings):
+    response = auth_api_client.post("/checkin/batch/", {"booking_ids": [batch_bookings[0].id]}, format="json")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_batch_check_in_view_returns_per_booking_results(api_client, batch_bookings):
+    staff_user = User.objects.create(
+        name="Front Desk",
+        email="frontdesk@example.com",
+        cpf="52998224725",
+        birth_date="1990-01-01",
+        role=UserRole.STAFF.value
+    )
+    api_client.force_authenticate(user=staff_user)
+    response = api_client.post(
+        "/checkin/batch/", {"booking_ids": [batch_bookings[0].id, batch_bookings[2].id]}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [result["success"] for result in response.data["results"]] == [True, False]
+
+
+@pytest.fixture
+def checkin_ready_booking(mock_booking):
+    BookingRepository.confirm_booking(mock_booking)
+    return mock_booking
+
+
+@pytest.mark.django_db
+def test_perform_check_in_is_a_single_transition(check_in_out_service, mock_user, checkin_ready_booking):
+    assert check_in_out_service.perform_check_in(checkin_ready_booking.id, user=mock_user) == CheckInStatus.COMPLETED
+
+    with pytest.raises(AlreadyCheckedInException):
+        check_in_out_service.perform_check_in(checkin_ready_booking.id, user=mock_user)
+
+    checkin_ready_booking.refresh_from_db()
+    assert checkin_ready_booking.status == BookingStatus.COMPLETED.value
+    assert checkin_ready_booking.room.status == RoomStatus.OCCUPIED.value
+    assert OutboxMessage.objects.filter(task_name='checkins.tasks.send_checkin_email').count() == 1
+
+
+@pytest.mark.django_db
+def test_perform_check_in_does_not_read_before_writing(
+        check_in_out_service, mock_user, checkin_ready_booking, django_assert_max_num_queries
+):
+    with django_assert_max_num_queries(7):
+        check_in_out_service.perform_check_in(checkin_ready_booking.id, user=mock_user)
+
+
+@pytest.mark.django_db
+def test_perform_check_in_rejects_other_clients_and_unconfirmed_bookings(
+        check_in_out_service, mock_user, checkin_ready_booking
+):
+    other_user = User.objects.create(
+        name="Other User",
+        email="other@example.com",
+        cpf="52998224725",
+        birth_date="1990-01-01"
+    )
+    with pytest.raises(UnauthorizedOrInvalidBookingException):
+        check_in_out_service.perform_check_in(checkin_ready_booking.id, user=other_user)
+
+    Booking.objects.filter(id=checkin_ready_booking.id).update(status=BookingStatus.PENDING.value)
+    with pytest.raises(InvalidBookingStatusException):
+        check_in_out_service.perform_check_in(checkin_ready_booking.id, user=mock_user)
+
+    checkin_ready_booking.refresh_from_db()
+    assert checkin_ready_booking.check_in_status == CheckInStatus.PENDING.value
+
+
+@pytest.mark.django_db
+def test_perform_check_out_requires_check_in_and_happens_once(check_in_out_service, mock_user, checkin_ready_booking):
+    with pytest.raises(InvalidBookingStatusException):
+        check_in_out_service.perform_check_out(checkin_ready_booking.id, user=mock_user)
+
+    check_in_out_service.perform_check_in(checkin_ready_booking.id, user=mock_user)
+    assert check_in_out_service.perform_check_out(checkin_ready_booking.id, user=mock_user) == CheckOutStatus.COMPLETED
+
+    with pytest.raises(AlreadyCheckedOutException):
+        check_in_out_service.perform_check_out(checkin_ready_booking.id, user=mock_user)
+
+
+@pytest.mark.django_db
+def test_front_desk_board_groups_todays_bookings(check_in_out_service, mock_user, batch_bookings):
+    check_in_out_service.perform_batch_check_in([batch_bookings[1].id])
+
+    board = FrontDeskBoardService().get_board()
+
+    assert board["date"] == timezone.localdate().isoformat()
+    assert [entry["booking_id"] for entry in board["arrivals"]] == [batch_bookings[0].id]
+    assert [entry["booking_id"] for entry in board["in_house"]] == [batch_bookings[1].id]
+    assert board["departures"] == []
+    assert board["in_house"][0]["room_number"] == "202"
+    assert board["in_house"][0]["client_name"] == mock_user.name
+
+
+@pytest.mark.django_db
+def test_front_desk_board_is_built_once_and_served_from_cache(batch_bookings, django_assert_num_queries):
+    board_service = FrontDeskBoardService()
+
+    with django_assert_num_queries(1):
+        board = board_service.get_board()
+    with django_assert_num_queries(0):
+        assert board_service.get_board() == board
+
+
+@pytest.mark.django_db
+def test_front_desk_board_is_patched_after_check_in(
+        check_in_out_service, mock_user, batch_bookings, django_capture_on_commit_callbacks
+):
+    board_service = FrontDeskBoardService()
+    board_service.get_board()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        check_in_out_service.perform_check_in(batch_bookings[0].id, user=mock_user)
+
+    with patch.object(board_service, 'build_snapshot') as build_snapshot:
+        board = board_service.get_board()
+    build_snapshot.assert_not_called()
+    assert [entry["booking_id"] for entry in board["arrivals"]] == [batch_bookings[1].id]
+    assert [entry["booking_id"] for entry in board["in_house"]] == [batch_bookings[0].id]
+
+
+def test_concurrent_front_desk_board_patches_are_not_lost():
+    today = timezone.localdate()
+    client = User(name="Test User")
+    arrivals = {
+        booking_id: Booking(
+            id=booking_id, client=client, room=Room(number=number), check_in_date=today,
+            check_out_date=today + timedelta(days=1), status=BookingStatus.COMPLETED.value,
+            check_in_status=CheckInStatus.COMPLETED.value, check_out_status=CheckOutStatus.PENDING.value
+        )
+        for booking_id, number in ((1, "201"), (2, "202"))
+    }
+    key = FrontDeskBoardService.cache_key(today)
+    cache.set(key, {"arrivals": {1: {}, 2: {}}, "in_house": {}, "departures": {}})
+    board_service = FrontDeskBoardService(Mock(spec=BookingRepository))
+    second = threading.Thread(target=board_service.refresh_bookings, args=([2],))
+
+    def load_bookings(booking_ids):
+        if booking_ids == [1]:
+            # The second refresh starts while the first is between reading and writing the snapshot.
+            second.start()
+            time.sleep(0.05)
+        return [arrivals[booking_id] for booking_id in booking_ids]
+
+    board_service.booking_repository.get_bookings_with_room_and_client.side_effect = load_bookings
+    board_service.refresh_bookings([1])
+    second.join()
+
+    # The second refresh could not take the lock, so the first one's write is dropped with it.
+    assert cache.get(key) is None
+    board_service.booking_repository.get_front_desk_bookings.return_value = list(arrivals.values())
+    board = board_service.get_board(today)
+    assert board["arrivals"] == []
+    assert [entry["booking_id"] for entry in board["in_house"]] == [1, 2]
+
+
+def test_front_desk_board_does_not_wait_for_a_locked_snapshot():
+    today = timezone.localdate()
+    key = FrontDeskBoardService.cache_key(today)
+    board_service = FrontDeskBoardService(Mock(spec=BookingRepository))
+    board_service.booking_repository.get_front_desk_bookings.return_value = []
+    cache.set(key, {"arrivals": {}, "in_house": {}, "departures": {}})
+    cache.set(f"{key}:lock", "someone-else")
+
+    started = time.monotonic()
+    board_service.refresh_bookings([1])
+    assert cache.get(key) is None
+
+    assert board_service.get_board(today)["arrivals"] == []
+    assert cache.get(key) is None
+    assert time.monotonic() - started < 0.5
+    board_service.booking_repository.get_bookings_with_room_and_client.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_front_desk_board_requires_staff(auth_api_client):
+    response = auth_api_client.get("/board/")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.fixture
+def kiosk_token(checkin_ready_booking):
+    checkin_ready_booking.refresh_from_db()
+    return KioskTokenService().issue(checkin_ready_booking)
+
+
+def test_kiosk_token_is_only_valid_during_the_stay():
+    booking = Booking(
+        id=7, client_id=3, check_in_date=timezone.localdate(), check_out_date=timezone.localdate() + timedelta(days=2)
+    )
+    token_service = KioskTokenService()
+    token = token_service.issue(booking)
+
+    assert token_service.verify(token) == (7, 3)
+    assert token_service.verify(token, day=booking.check_out_date - timedelta(days=1)) == (7, 3)
+    with pytest.raises(CheckInNotOpenException):
+        token_service.verify(token, day=booking.check_in_date - timedelta(days=1))
+    with pytest.raises(CheckInNotOpenException):
+        token_service.verify(token, day=booking.check_out_date)
+    with pytest.raises(InvalidKioskTokenException):
+        token_service.verify(token.replace(":", ":x", 1))
+
+
+@pytest.mark.django_db
+def test_kiosk_check_in_writes_before_any_read(
+        check_in_out_service, checkin_ready_booking, kiosk_token, django_assert_max_num_queries
+):
+    with django_assert_max_num_queries(7) as captured:
+        assert check_in_out_service.perform_kiosk_check_in(kiosk_token) == checkin_ready_booking.id
+
+    statements = [query["sql"] for query in captured.captured_queries if not query["sql"].startswith("SAVEPOINT")]
+    assert statements[0].startswith("UPDATE")
+    checkin_ready_booking.refresh_from_db()
+    assert checkin_ready_booking.check_in_status == CheckInStatus.COMPLETED.value
+
+
+@pytest.mark.django_db
+def test_kiosk_check_in_view_needs_no_login(api_client, checkin_ready_booking, kiosk_token):
+    response = api_client.post("/checkin/kiosk/", {"token": kiosk_token}, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["booking_id"] == checkin_ready_booking.id
+
+    response = api_client.post("/checkin/kiosk/", {"token": kiosk_token}, format="json")
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    response = api_client.post("/checkin/kiosk/", {"token": "forged:token"}, format="json")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,10 +1,39 @@
+from unittest.mock import Mock, patch
+
 import pytest
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from authentication.repository import RevocationFilterRepository
+from authentication.revocation import BloomFilter, RevocationFilterMirror
 from users.models import User
 
 
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def revocation_filter_repository():
+    """
+    Keeps the shared token revocation filter in memory instead of Redis.
+    """
+    shared = BloomFilter(size_bits=8192, hash_count=3)
+    repository = Mock(spec=RevocationFilterRepository)
+    repository.get_bitmap.side_effect = lambda: bytes(shared.bits)
+    repository.set_bits.side_effect = shared.set_positions
+    repository.replace_bitmap.side_effect = shared.load
+    mirror = RevocationFilterMirror(size_bits=8192, hash_count=3, sync_interval=60)
+    with patch('authentication.revocation.revocation_filter', mirror), \
+            patch('authentication.services.RevocationFilterRepository', return_value=repository):
+        yield repository
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework import status
+
+from bookings.enums import BookingStatus
+from bookings.models import Booking
+from rooms.enums import RoomStatus, RoomType
+from rooms.models import Room
+from users.enums import UserRole
+from users.models import User
+
+
+@pytest.fixture
+def rooms(db):
+    return [
+        Room.objects.create(number="101", status=RoomStatus.AVAILABLE.value, room_type=RoomType.SINGLE.value,
+                            price=100.00),
+        Room.objects.create(number="102", status=RoomStatus.AVAILABLE.value, room_type=RoomType.DOUBLE.value,
+                            price=150.00),
+    ]
+
+
+@pytest.fixture
+def bookings(rooms):
+    clients = [
+        User.objects.create(name=f"Client {i}", email=f"client{i}@example.com", cpf=f"1234567891{i}",
+                            birth_date="1990-01-01", role=UserRole.CLIENT.value)
+        for i in range(2)
+    ]
+    return [
+        Booking.objects.create(client=client, room=room, check_in_date=date.today() + timedelta(days=1),
+                               check_out_date=date.today() + timedelta(days=3), status=BookingStatus.PENDING.value)
+        for client, room in zip(clients, rooms)
+    ]
+
+
+READ_URLS = [
+    "/rooms/",
+    "/rooms/?room_type=SINGLE",
+    "/rooms/101/availability/",
+    "/rooms/999/availability/",
+    f"/rooms/availability/filter/?check_in_date={(date.today() + timedelta(days=5)).strftime('%d/%m/%Y')}"
+    f"&check_out_date={(date.today() + timedelta(days=7)).strftime('%d/%m/%Y')}",
+    "/bookings/",
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", READ_URLS)
+def test_async_views_answer_like_the_sync_views(auth_api_client, bookings, url, settings):
+    settings.ROOT_URLCONF = "hotel_api.urls"
+    sync_response = auth_api_client.get(url)
+    settings.ROOT_URLCONF = "hotel_api.asgi_urls"
+    async_response = auth_api_client.get(url)
+
+    assert resolve(url.split("?")[0]).func.view_class.__name__.startswith("Async")
+    assert async_response.status_code == sync_response.status_code
+    assert async_response.json() == sync_response.json()
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("hotel_api.asgi_urls")
+def test_async_booking_list_loads_rooms_and_clients_in_one_query(auth_api_client, bookings):
+    with CaptureQueriesContext(connection) as captured:
+        response = auth_api_client.get("/bookings/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data) == 2
+    assert len([query for query in captured.captured_queries if '"bookings_booking"' in query["sql"]]) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("hotel_api.asgi_urls")
+def test_async_room_views_keep_the_sync_write_handlers(auth_api_client, rooms):
+    response = auth_api_client.post(
+        "/rooms/", {"number": "301", "status": "AVAILABLE", "room_type": "SUITE", "price": "300.00"}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    room = Room.objects.get(number="301")
+    assert auth_api_client.get(f"/rooms/{room.id}/").data["number"] == "301"
+    assert auth_api_client.delete(f"/rooms/{room.id}/").status_code == status.HTTP_204_NO_CONTENT
+    assert auth_api_client.get("/rooms/999/").status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("hotel_api.asgi_urls")
+def test_asgi_stack_serves_async_views_without_a_sync_middleware(async_client, rooms):
+    response = async_to_sync(async_client.get)("/rooms/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [room["number"] for room in response.json()] == ["101", "102"]
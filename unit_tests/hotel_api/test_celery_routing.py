@@ -0,0 +1,45 @@
+import pytest
+
+from hotel_api.celery import app
+
+EXPECTED_ROUTES = {
+    'notifications.tasks.relay_outbox': ('notifications', 0),
+    'bookings.tasks.send_booking_confirmation_email': ('notifications', 1),
+    'bookings.tasks.send_booking_cancellation_email': ('notifications', 1),
+    'checkins.tasks.send_checkin_email': ('notifications', 1),
+    'checkins.tasks.send_checkout_email': ('notifications', 1),
+    'checkins.tasks.send_no_show_email': ('notifications', 1),
+    'checkins.tasks.send_checkin_batch_email': ('notifications', 1),
+    'checkins.tasks.send_checkout_batch_email': ('notifications', 1),
+    'bookings.tasks.send_booking_creation_email': ('notifications', 3),
+    'bookings.tasks.send_booking_modification_email': ('notifications', 3),
+    'bookings.tasks.send_booking_email': ('notifications', 3),
+    'notifications.tasks.flush_email_batch': ('notifications', 5),
+    'notifications.tasks.flush_notification_digest': ('notifications', 3),
+    'bookings.tasks.expire_pending_bookings': ('sweeps', 5),
+    'bookings.tasks.manage_room_availability': ('sweeps', 5),
+    'authentication.tasks.rebuild_token_revocation_filter': ('sweeps', 5),
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def registered_tasks():
+    app.loader.import_default_modules()
+
+
+@pytest.mark.parametrize("task_name, expected", EXPECTED_ROUTES.items())
+def test_task_routing_table(task_name, expected):
+    route = app.amqp.router.route({}, task_name)
+
+    assert (route['queue'].name, route.get('priority')) == expected
+
+
+def test_unrouted_tasks_use_default_queue():
+    route = app.amqp.router.route({}, 'hotel_api.celery.debug_task')
+
+    assert route['queue'].name == 'default'
+
+
+@pytest.mark.parametrize("task_name", EXPECTED_ROUTES.keys())
+def test_fire_and_forget_tasks_ignore_results(task_name):
+    assert app.tasks[task_name].ignore_result is True
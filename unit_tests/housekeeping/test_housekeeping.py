@@ -0,0 +1,160 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from bookings.enums import BookingStatus
+from bookings.models import Booking
+from bookings.repository import BookingRepository
+from checkins.services import CheckInCheckOutService
+from housekeeping.repository import HousekeepingQueueRepository
+from housekeeping.services import HousekeepingService
+from rooms.enums import RoomStatus, RoomType
+from rooms.models import Room
+from users.enums import UserRole
+from users.models import User
+from utils.exceptions import RoomNotAwaitingCleaningException, RoomNotFoundException
+
+
+@pytest.fixture
+def queue_repository():
+    return Mock(spec=HousekeepingQueueRepository)
+
+
+@pytest.fixture
+def housekeeping_service(queue_repository):
+    return HousekeepingService(queue_repository=queue_repository)
+
+
+@pytest.fixture
+def mock_user(db):
+    return User.objects.create(
+        name="Housekeeping Guest",
+        email="guest@example.com",
+        cpf="12345678909",
+        birth_date="1990-01-01"
+    )
+
+
+@pytest.fixture
+def staff_user(db):
+    return User.objects.create(
+        name="Housekeeper",
+        email="housekeeper@example.com",
+        cpf="52998224725",
+        birth_date="1990-01-01",
+        role=UserRole.STAFF.value
+    )
+
+
+def create_room(number: str, room_type: RoomType, room_status: RoomStatus = RoomStatus.AVAILABLE) -> Room:
+    return Room.objects.create(number=number, status=room_status.value, room_type=room_type.value, price=100.0)
+
+
+def create_booking(client: User, room: Room, days_from_now: int, booking_status: BookingStatus) -> Booking:
+    return Booking.objects.create(
+        client=client,
+        room=room,
+        check_in_date=timezone.localdate() + timedelta(days=days_from_now),
+        check_out_date=timezone.localdate() + timedelta(days=days_from_now + 1),
+        status=booking_status.value
+    )
+
+
+@pytest.mark.django_db
+def test_check_out_hands_the_room_to_housekeeping(mock_user, queue_repository, django_capture_on_commit_callbacks):
+    room = create_room("101", RoomType.SINGLE)
+    booking = create_booking(mock_user, room, 0, BookingStatus.CONFIRMED)
+    BookingRepository.confirm_booking(booking)
+    check_in_out_service = CheckInCheckOutService(
+        housekeeping_service=HousekeepingService(queue_repository=queue_repository)
+    )
+    check_in_out_service.perform_check_in(booking.id, user=mock_user)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        check_in_out_service.perform_check_out(booking.id, user=mock_user)
+
+    room.refresh_from_db()
+    assert room.status == RoomStatus.CLEANING.value
+    queue_repository.push.assert_called_once_with({room.id: HousekeepingService.NO_UPCOMING_ARRIVAL})
+
+
+@pytest.mark.django_db
+def test_rooms_are_prioritized_by_the_next_arrival_for_their_type(
+        mock_user, housekeeping_service, queue_repository, django_capture_on_commit_callbacks
+):
+    single = create_room("101", RoomType.SINGLE, RoomStatus.CLEANING)
+    double = create_room("201", RoomType.DOUBLE, RoomStatus.CLEANING)
+    suite = create_room("301", RoomType.SUITE, RoomStatus.CLEANING)
+    create_booking(mock_user, create_room("102", RoomType.SINGLE), 3, BookingStatus.CONFIRMED)
+    create_booking(mock_user, create_room("202", RoomType.DOUBLE), 1, BookingStatus.PENDING)
+    create_booking(mock_user, create_room("203", RoomType.DOUBLE), 0, BookingStatus.CANCELLED)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        housekeeping_service.queue_rooms([single, double, suite])
+
+    today = timezone.localdate()
+    queue_repository.push.assert_called_once_with({
+        single.id: (today + timedelta(days=3)).toordinal(),
+        double.id: (today + timedelta(days=1)).toordinal(),
+        suite.id: HousekeepingService.NO_UPCOMING_ARRIVAL,
+    })
+
+
+@pytest.mark.django_db
+def test_get_queue_lists_rooms_in_priority_order(housekeeping_service, queue_repository):
+    double = create_room("201", RoomType.DOUBLE, RoomStatus.CLEANING)
+    suite = create_room("301", RoomType.SUITE, RoomStatus.CLEANING)
+    tomorrow = timezone.localdate() + timedelta(days=1)
+    queue_repository.get_queue.return_value = [
+        (double.id, float(tomorrow.toordinal())),
+        (suite.id, float(HousekeepingService.NO_UPCOMING_ARRIVAL)),
+    ]
+
+    assert housekeeping_service.get_queue() == [
+        {"room_id": double.id, "room_number": "201", "room_type": "DOUBLE", "next_arrival": tomorrow.isoformat()},
+        {"room_id": suite.id, "room_number": "301", "room_type": "SUITE", "next_arrival": None},
+    ]
+
+
+@pytest.mark.django_db
+def test_mark_clean_releases_the_room_once(housekeeping_service, queue_repository, django_capture_on_commit_callbacks):
+    room = create_room("101", RoomType.SINGLE, RoomStatus.CLEANING)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        housekeeping_service.mark_clean(room.id)
+
+    room.refresh_from_db()
+    assert room.status == RoomStatus.AVAILABLE.value
+    queue_repository.remove.assert_called_once_with(room.id)
+
+    with pytest.raises(RoomNotAwaitingCleaningException):
+        housekeeping_service.mark_clean(room.id)
+    with pytest.raises(RoomNotFoundException):
+        housekeeping_service.mark_clean(9999)
+
+
+@pytest.mark.django_db
+def test_mark_clean_leaves_rooms_under_maintenance_alone(housekeeping_service, queue_repository):
+    room = create_room("101", RoomType.SINGLE, RoomStatus.MAINTENANCE)
+
+    with pytest.raises(RoomNotAwaitingCleaningException):
+        housekeeping_service.mark_clean(room.id)
+
+    room.refresh_from_db()
+    assert room.status == RoomStatus.MAINTENANCE.value
+
+
+@pytest.mark.django_db
+def test_mark_clean_view_requires_staff(api_client, mock_user, staff_user):
+    room = create_room("101", RoomType.SINGLE, RoomStatus.CLEANING)
+
+    api_client.force_authenticate(user=mock_user)
+    assert api_client.post(f"/housekeeping/rooms/{room.id}/clean/").status_code == status.HTTP_403_FORBIDDEN
+
+    api_client.force_authenticate(user=staff_user)
+    response = api_client.post(f"/housekeeping/rooms/{room.id}/clean/")
+    assert response.status_code == status.HTTP_200_OK
+    assert api_client.post(f"/housekeeping/rooms/{room.id}/clean/").status_code == status.HTTP_409_CONFLICT
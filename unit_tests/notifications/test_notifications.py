@@ -0,0 +1,475 @@
+import asyncio
+import json
+from datetime import date, timedelta
+from unittest.mock import patch, Mock, AsyncMock
+
+import fakeredis
+import pytest
+from django.core import mail
+from django.core.management import CommandError, call_command
+from django.db import transaction
+
+from bookings.enums import BookingStatus
+from bookings.models import Booking
+from bookings.services import BookingService
+from bookings.tasks import send_booking_email, send_booking_confirmation_email
+from notifications.async_worker import AsyncEmailWorker, DomainRateLimiter
+from notifications import messages
+from notifications.enums import OutboxStatus, NotificationKind
+from notifications.models import OutboxMessage
+from notifications.repository import EmailBufferRepository, NotificationDigestRepository
+from notifications.services import OutboxService, EmailBatchService, NotificationDigestService
+from notifications.tasks import flush_notification_digest
+from rooms.enums import RoomStatus, RoomType
+from rooms.models import Room
+from users.enums import UserRole
+from users.models import User
+from utils.broker import CircuitBreaker
+from utils.email_service import EmailService
+from utils.exceptions import BrokerUnavailableException
+from utils.redis_client import create_async_redis_client
+
+
+@pytest.fixture(autouse=True)
+def broker_circuit():
+    circuit = CircuitBreaker("Broker", failure_threshold=3, reset_timeout=30)
+    with patch('utils.broker.broker_circuit', circuit):
+        yield circuit
+
+
+@pytest.fixture
+def outbox_service():
+    return OutboxService()
+
+
+@pytest.fixture
+def mock_user(db):
+    return User.objects.create(
+        name="Outbox User",
+        email="outbox@example.com",
+        cpf="12345678909",
+        birth_date="1990-01-01",
+        role=UserRole.CLIENT.value
+    )
+
+
+@pytest.fixture
+def pending_booking(db, mock_user):
+    room = Room.objects.create(
+        number="101",
+        status=RoomStatus.AVAILABLE.value,
+        room_type=RoomType.SINGLE.value,
+        price=100.0
+    )
+    return Booking.objects.create(
+        client=mock_user,
+        room=room,
+        check_in_date=date.today(),
+        check_out_date=date.today() + timedelta(days=2),
+        status=BookingStatus.PENDING.value
+    )
+
+
+@pytest.mark.django_db
+def test_confirm_booking_writes_outbox_instead_of_publishing(mock_user, pending_booking):
+    with patch('bookings.tasks.send_booking_confirmation_email.delay') as mock_delay:
+        BookingService().confirm_booking(pending_booking.id, user=mock_user)
+
+    mock_delay.assert_not_called()
+    message = OutboxMessage.objects.get()
+    assert message.task_name == 'bookings.tasks.send_booking_confirmation_email'
+    assert message.args[0] == mock_user.email
+    assert message.status == OutboxStatus.PENDING.value
+
+
+@pytest.mark.django_db
+def test_outbox_message_discarded_on_rollback():
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            EmailService.send_checkin("client@example.com", {"room_number": "101"})
+            raise RuntimeError("booking change failed")
+
+    assert not OutboxMessage.objects.exists()
+
+
+@pytest.mark.django_db
+def test_relay_publishes_pending_messages(outbox_service):
+    EmailService.send_checkin("client@example.com", {"room_number": "101"})
+    EmailService.send_checkout("client@example.com", {"room_number": "101"})
+
+    with patch('utils.broker.current_app.send_task') as mock_send_task:
+        relayed = outbox_service.relay_pending()
+
+    assert relayed == 2
+    assert mock_send_task.call_count == 2
+    mock_send_task.assert_any_call(
+        'checkins.tasks.send_checkin_email',
+        args=["client@example.com", {"room_number": "101"}],
+        retry=False,
+        task_id=f"outbox-{OutboxMessage.objects.order_by('id').first().id}"
+    )
+    assert not OutboxMessage.objects.filter(status=OutboxStatus.PENDING.value).exists()
+
+
+@pytest.mark.django_db
+def test_relay_keeps_message_pending_when_publish_fails(outbox_service, settings):
+    settings.OUTBOX_MAX_ATTEMPTS = 2
+    EmailService.send_checkin("client@example.com", {"room_number": "101"})
+
+    with patch('utils.broker.current_app.send_task', side_effect=ConnectionError("broker down")):
+        assert outbox_service.relay_pending() == 0
+        message = OutboxMessage.objects.get()
+        assert message.status == OutboxStatus.PENDING.value
+        assert message.attempts == 1
+
+        outbox_service.relay_pending()
+
+    message.refresh_from_db()
+    assert message.status == OutboxStatus.FAILED.value
+    assert "broker down" in message.last_error
+
+
+@pytest.mark.django_db
+def test_relay_stops_publishing_while_broker_circuit_is_open(outbox_service, broker_circuit):
+    for room_number in ("101", "102", "103"):
+        EmailService.send_checkin("client@example.com", {"room_number": room_number})
+
+    with patch('utils.broker.current_app.send_task', side_effect=ConnectionError("broker down")) as mock_send_task:
+        for _ in range(5):
+            assert outbox_service.relay_pending() == 0
+
+    assert mock_send_task.call_count == broker_circuit.failure_threshold
+    assert broker_circuit.is_open
+    assert list(OutboxMessage.objects.order_by('id').values_list('attempts', 'status')) == [
+        (3, OutboxStatus.PENDING.value),
+        (0, OutboxStatus.PENDING.value),
+        (0, OutboxStatus.PENDING.value),
+    ]
+
+
+def buffered_message(index, attempts=0):
+    return {
+        "to": [f"client{index}@example.com"],
+        "subject": "Booking Confirmation",
+        "body": f"Your booking for Room {index} is confirmed!",
+        "attempts": attempts,
+    }
+
+
+def test_send_booking_email_buffers_when_batching_enabled(settings):
+    settings.EMAIL_BATCHING_ENABLED = True
+    with patch.object(EmailBatchService, 'enqueue') as mock_enqueue, \
+         patch('bookings.tasks.send_mail') as mock_send_mail:
+        send_booking_email("client@example.com", "Booking Created", "Pending confirmation.")
+
+    mock_enqueue.assert_called_once_with("client@example.com", "Booking Created", "Pending confirmation.", None)
+    mock_send_mail.assert_not_called()
+
+
+def test_enqueue_schedules_flush_when_batch_is_full(settings):
+    settings.EMAIL_BATCH_SIZE = 2
+    repository = Mock(spec=EmailBufferRepository)
+    repository.push.return_value = 2
+
+    with patch('notifications.services.publish') as mock_publish:
+        EmailBatchService(repository).enqueue("client@example.com", "Booking Created", "Pending confirmation.")
+
+    mock_publish.assert_called_once_with('notifications.tasks.flush_email_batch')
+
+
+def test_enqueue_leaves_the_buffer_to_the_async_worker_when_enabled(settings):
+    settings.EMAIL_BATCH_SIZE = 2
+    settings.ASYNC_EMAIL_WORKER_ENABLED = True
+    repository = Mock(spec=EmailBufferRepository)
+    repository.push.return_value = 2
+
+    with patch('notifications.services.publish') as mock_publish:
+        EmailBatchService(repository).enqueue("client@example.com", "Booking Created", "Pending confirmation.")
+
+    mock_publish.assert_not_called()
+
+
+def test_notification_worker_refuses_to_run_alongside_the_batch_task(settings):
+    settings.ASYNC_EMAIL_WORKER_ENABLED = False
+
+    with patch('notifications.management.commands.run_notification_worker.AsyncEmailWorker') as mock_worker:
+        with pytest.raises(CommandError):
+            call_command("run_notification_worker")
+
+    mock_worker.assert_not_called()
+
+
+def test_flush_sends_whole_batch_over_one_connection(settings):
+    settings.EMAIL_BATCH_SIZE = 10
+    repository = Mock(spec=EmailBufferRepository)
+    repository.claim_batch.side_effect = [("claim-1", [buffered_message(i) for i in range(3)])]
+    repository.reclaim_stale.return_value = 0
+
+    with patch('notifications.services.get_connection', wraps=mail.get_connection) as mock_get_connection:
+        sent = EmailBatchService(repository).flush()
+
+    assert sent == 3
+    assert len(mail.outbox) == 3
+    mock_get_connection.assert_called_once()
+    repository.requeue.assert_called_once_with([])
+    repository.dead_letter.assert_called_once_with([])
+    repository.acknowledge.assert_called_once_with("claim-1")
+
+
+def test_flush_sends_buffered_html_as_multipart(settings):
+    repository = Mock(spec=EmailBufferRepository)
+    message = dict(buffered_message(1), html="<p>Room 1 is confirmed!</p>")
+    repository.claim_batch.side_effect = [("claim-1", [message])]
+    repository.reclaim_stale.return_value = 0
+
+    EmailBatchService(repository).flush()
+
+    assert mail.outbox[0].body == "Your booking for Room 1 is confirmed!"
+    assert mail.outbox[0].alternatives == [("<p>Room 1 is confirmed!</p>", "text/html")]
+
+
+def test_flush_retries_failures_and_dead_letters_exhausted_messages(settings):
+    settings.EMAIL_MAX_ATTEMPTS = 3
+    repository = Mock(spec=EmailBufferRepository)
+    retryable, exhausted = buffered_message(1), buffered_message(2, attempts=2)
+    repository.claim_batch.side_effect = [("claim-1", [retryable, exhausted])]
+    repository.reclaim_stale.return_value = 0
+
+    with patch.object(EmailBatchService, 'send_batch', return_value=(0, [retryable, exhausted])):
+        EmailBatchService(repository).flush()
+
+    repository.requeue.assert_called_once_with([dict(retryable, attempts=1)])
+    repository.dead_letter.assert_called_once_with([dict(exhausted, attempts=3)])
+    repository.acknowledge.assert_called_once_with("claim-1")
+
+
+def test_flush_leaves_the_batch_claimed_when_it_dies_mid_batch(settings):
+    settings.EMAIL_CLAIM_TIMEOUT = 300
+    repository = Mock(spec=EmailBufferRepository)
+    repository.claim_batch.side_effect = [("claim-1", [buffered_message(1)])]
+    repository.reclaim_stale.return_value = 0
+
+    with patch.object(EmailBatchService, 'send_batch', side_effect=SystemExit):
+        with pytest.raises(SystemExit):
+            EmailBatchService(repository).flush()
+
+    repository.reclaim_stale.assert_called_once_with(300)
+    repository.acknowledge.assert_not_called()
+
+
+def test_domain_rate_limiter_waits_once_bucket_is_empty():
+    limiter = DomainRateLimiter(default_rate=2, domain_rates={"slow.com": 0})
+
+    with patch('notifications.async_worker.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        async def acquire_all():
+            for _ in range(3):
+                await limiter.acquire("example.com")
+            for _ in range(5):
+                await limiter.acquire("slow.com")
+
+        asyncio.run(acquire_all())
+
+    mock_sleep.assert_awaited_once()
+    assert mock_sleep.await_args.args[0] == pytest.approx(0.5, abs=0.05)
+
+
+def test_async_worker_reuses_smtp_connection_and_reports_failures():
+    smtp = Mock(connect=AsyncMock(), quit=AsyncMock())
+    smtp.send_message = AsyncMock(side_effect=[None, None, ConnectionError("rejected")])
+    messages = [buffered_message(i) for i in range(3)]
+
+    with patch('notifications.async_worker.aiosmtplib.SMTP', return_value=smtp) as mock_smtp:
+        worker = AsyncEmailWorker(concurrency=1, default_domain_rate=0, domain_rates={})
+        sent, failed = asyncio.run(worker.send_all(messages))
+
+    assert sent == 2
+    assert failed == [messages[2]]
+    assert mock_smtp.call_count == 1
+    assert smtp.send_message.await_count == 3
+    smtp.quit.assert_awaited_once()
+
+
+def test_async_worker_backs_off_before_retrying_and_dead_letters_exhausted_messages(settings):
+    settings.EMAIL_MAX_ATTEMPTS = 3
+    settings.EMAIL_RETRY_BACKOFF = 5
+    worker = AsyncEmailWorker(concurrency=1, default_domain_rate=0, domain_rates={})
+    worker._redis = Mock(rpush=AsyncMock(), zadd=AsyncMock())
+    retried, exhausted = buffered_message(1), buffered_message(2, attempts=2)
+
+    with patch('notifications.async_worker.time.time', return_value=1000.0):
+        asyncio.run(worker._handle_failure(retried))
+        asyncio.run(worker._handle_failure(exhausted))
+
+    key, scheduled = worker._redis.zadd.await_args.args
+    assert key == EmailBufferRepository.RETRY_KEY
+    assert list(scheduled.values()) == [1010.0]
+    assert json.loads(next(iter(scheduled)))["attempts"] == 1
+    worker._redis.rpush.assert_awaited_once()
+    assert worker._redis.rpush.await_args.args[0] == EmailBufferRepository.DEAD_LETTER_KEY
+
+
+def test_async_worker_acknowledges_a_claim_after_handling_every_message():
+    worker = AsyncEmailWorker(concurrency=2, default_domain_rate=0, domain_rates={})
+    pipeline = Mock(execute=AsyncMock())
+    worker._redis = Mock(pipeline=Mock(return_value=pipeline))
+    worker._in_flight_messages = 2
+    messages = [buffered_message(1), buffered_message(2)]
+
+    with patch.object(worker, '_deliver_buffered', new_callable=AsyncMock) as deliver:
+        asyncio.run(worker._deliver_claim("claim-1", messages))
+
+    assert deliver.await_count == 2
+    pipeline.delete.assert_called_once_with(EmailBufferRepository.PROCESSING_KEY_PREFIX + "claim-1")
+    pipeline.zrem.assert_called_once_with(EmailBufferRepository.CLAIMS_KEY, "claim-1")
+    pipeline.execute.assert_awaited_once()
+    assert worker._in_flight_messages == 0
+
+
+def test_async_worker_claims_delivers_and_acknowledges_through_the_buffer(settings):
+    settings.EMAIL_MAX_ATTEMPTS = 3
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    delivered, failed = buffered_message(1), buffered_message(2)
+    asyncio.run(redis.rpush(EmailBufferRepository.BUFFER_KEY, json.dumps(delivered), json.dumps(failed)))
+    worker = AsyncEmailWorker(concurrency=2, default_domain_rate=0, domain_rates={})
+    worker._redis = redis
+
+    async def deliver(message):
+        return message == delivered
+
+    async def run_once():
+        claim_id, messages = await EmailBufferRepository.aclaim_batch(redis, 2)
+        assert await redis.llen(EmailBufferRepository.PROCESSING_KEY_PREFIX + claim_id) == 2
+        worker._in_flight_messages = len(messages)
+        await worker._deliver_claim(claim_id, messages)
+        return claim_id
+
+    with patch.object(worker, 'deliver', side_effect=deliver):
+        claim_id = asyncio.run(run_once())
+
+    assert asyncio.run(redis.llen(EmailBufferRepository.BUFFER_KEY)) == 0
+    assert not asyncio.run(redis.exists(EmailBufferRepository.PROCESSING_KEY_PREFIX + claim_id))
+    assert asyncio.run(redis.zcard(EmailBufferRepository.CLAIMS_KEY)) == 0
+    [retry] = asyncio.run(redis.zrange(EmailBufferRepository.RETRY_KEY, 0, -1))
+    assert json.loads(retry)["to"] == failed["to"]
+
+
+def test_async_worker_redis_client_has_socket_timeouts(settings):
+    settings.REDIS_SOCKET_TIMEOUT = 0.5
+    client = create_async_redis_client()
+
+    connection_kwargs = client.connection_pool.connection_kwargs
+    assert connection_kwargs["socket_timeout"] == 0.5
+    assert connection_kwargs["socket_connect_timeout"] == 0.5
+
+
+def digest_event(kind, booking_id, **details):
+    return {"kind": kind.value, "details": {"booking_id": booking_id, **details}}
+
+
+def test_notification_held_for_digest_when_window_is_set(settings):
+    settings.NOTIFICATION_DIGEST_WINDOW = 30
+    with patch.object(NotificationDigestService, 'add') as mock_add, \
+         patch('bookings.tasks.send_mail') as mock_send_mail:
+        send_booking_confirmation_email("client@example.com", {"booking_id": 1, "room_number": "101"})
+
+    mock_add.assert_called_once_with(
+        "client@example.com", NotificationKind.BOOKING_CONFIRMATION, {"booking_id": 1, "room_number": "101"}
+    )
+    mock_send_mail.assert_not_called()
+
+
+def test_digest_schedules_one_flush_per_window(settings):
+    settings.NOTIFICATION_DIGEST_WINDOW = 30
+    repository = Mock(spec=NotificationDigestRepository)
+    repository.add_event.side_effect = [True, False]
+    service = NotificationDigestService(repository)
+
+    with patch('notifications.services.publish') as mock_publish:
+        service.add("client@example.com", NotificationKind.BOOKING_CREATION, {"booking_id": 1, "room_number": "101"})
+        service.add("client@example.com", NotificationKind.BOOKING_CONFIRMATION, {"booking_id": 1, "room_number": "101"})
+
+    mock_publish.assert_called_once_with(
+        'notifications.tasks.flush_notification_digest', args=["client@example.com"], countdown=30
+    )
+
+
+def test_digest_is_sent_immediately_when_flush_cannot_be_scheduled(settings):
+    settings.NOTIFICATION_DIGEST_WINDOW = 30
+    repository = Mock(spec=NotificationDigestRepository)
+    repository.add_event.return_value = True
+
+    with patch('notifications.services.publish', side_effect=BrokerUnavailableException()), \
+         patch('notifications.tasks.flush_notification_digest') as mock_flush:
+        NotificationDigestService(repository).add(
+            "client@example.com", NotificationKind.BOOKING_CREATION, {"booking_id": 1, "room_number": "101"}
+        )
+
+    mock_flush.assert_called_once_with("client@example.com")
+
+
+def test_digest_merge_drops_superseded_notifications():
+    events = [
+        digest_event(NotificationKind.BOOKING_CREATION, 1, room_number="101"),
+        digest_event(
+            NotificationKind.BOOKING_MODIFICATION, 1,
+            room_number_before="101", room_number_after="102",
+        ),
+        digest_event(NotificationKind.BOOKING_CREATION, 2, room_number="201"),
+        digest_event(
+            NotificationKind.BOOKING_MODIFICATION, 1,
+            room_number_before="102", room_number_after="103",
+        ),
+        digest_event(NotificationKind.BOOKING_CONFIRMATION, 1, room_number="103"),
+        digest_event(NotificationKind.BOOKING_CANCELLATION, 2, room_number="201"),
+    ]
+
+    merged = NotificationDigestService.merge(events)
+
+    assert merged == [
+        digest_event(
+            NotificationKind.BOOKING_MODIFICATION, 1,
+            room_number_before="101", room_number_after="103",
+        ),
+        digest_event(NotificationKind.BOOKING_CONFIRMATION, 1, room_number="103"),
+        digest_event(NotificationKind.BOOKING_CANCELLATION, 2, room_number="201"),
+    ]
+
+
+def test_flush_digest_sends_one_email_per_client(settings):
+    settings.EMAIL_BATCHING_ENABLED = False
+    events = [
+        digest_event(NotificationKind.BOOKING_CREATION, 1, room_number="101"),
+        digest_event(NotificationKind.BOOKING_CONFIRMATION, 1, room_number="101"),
+        digest_event(NotificationKind.CHECK_IN, 2, room_number="202"),
+    ]
+
+    with patch.object(NotificationDigestRepository, 'drain', return_value=events):
+        flush_notification_digest("client@example.com")
+
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].subject == "Booking Updates"
+    assert "pending confirmation" not in mail.outbox[0].body
+    assert "Your booking for Room 101 is confirmed!" in mail.outbox[0].body
+    assert "Your check-in for Room 202 is confirmed!" in mail.outbox[0].body
+
+
+def test_notification_templates_are_compiled_once():
+    messages._templates.clear()
+
+    with patch('notifications.messages.get_template', wraps=messages.get_template) as mock_get_template:
+        for _ in range(3):
+            messages.render_notification(NotificationKind.CHECK_IN, {"booking_id": 1, "room_number": "101"})
+
+    assert mock_get_template.call_count == len(NotificationKind) * 2 + 1
+
+
+def test_send_notification_as_text_and_html(settings):
+    settings.EMAIL_BATCHING_ENABLED = False
+    send_booking_confirmation_email("client@example.com", {"booking_id": 1, "room_number": "<101>"})
+
+    email = mail.outbox[0]
+    assert email.body == "Your booking for Room <101> is confirmed!"
+    html, mimetype = email.alternatives[0]
+    assert mimetype == "text/html"
+    assert "<h2>Booking Confirmation</h2>" in html
+    assert "Room <strong>&lt;101&gt;</strong> is confirmed!" in html
@@ -1,7 +1,13 @@
+from io import StringIO
+
 import pytest
+from django.core.management import call_command
+from django.db import transaction
 from django.urls import reverse
 from rest_framework import status
 from users.models import User
+from users.repository import UserRepository
+from utils.exceptions import UserAlreadyExistsException
 from datetime import date, timedelta
 
 
@@ -68,3 +74,127 @@ def test_invalid_cpf_format_registration(api_client, user_data):
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "Invalid CPF number." in response.data["detail"]["cpf"][0]
+
+
+@pytest.mark.django_db
+def test_registration_is_a_single_insert(api_client, user_data, django_assert_num_queries):
+    """Registration relies on the unique constraints instead of looking the email and CPF up first."""
+    url = reverse("users:client-register")
+    with django_assert_num_queries(3) as context:
+        response = api_client.post(url, data=user_data)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    statements = [query["sql"].split()[0] for query in context.captured_queries]
+    assert statements == ["SAVEPOINT", "INSERT", "RELEASE"]
+
+
+@pytest.mark.django_db
+def test_duplicate_registration_leaves_the_callers_transaction_usable(user_data):
+    """The INSERT runs in a savepoint, so a caller's transaction survives a duplicate."""
+    User.objects.create_user(
+        name="Jane Doe",
+        email=user_data["email"],
+        cpf="52998224725",
+        birth_date=date(1990, 1, 1),
+        password=user_data["password"]
+    )
+
+    with transaction.atomic():
+        with pytest.raises(UserAlreadyExistsException) as exc_info:
+            UserRepository.create_user(
+                name=user_data["name"],
+                email=user_data["email"],
+                cpf=user_data["cpf"],
+                birth_date=date(2000, 1, 1),
+                password=user_data["password"],
+            )
+        assert User.objects.count() == 1
+
+    assert exc_info.value.errors == {"email": ["A user with this email already exists."]}
+
+
+@pytest.mark.django_db
+def test_duplicate_cpf_registration(api_client, user_data):
+    """Test registration with a CPF that is already registered."""
+    User.objects.create_user(
+        name="Jane Doe",
+        email="jane.doe@example.com",
+        cpf=user_data["cpf"],
+        birth_date=date(1990, 1, 1),
+        password=user_data["password"]
+    )
+
+    response = api_client.post(reverse("users:client-register"), data=user_data)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "A user with this CPF already exists." in response.data["detail"]["cpf"][0]
+
+
+@pytest.mark.django_db
+def test_import_users_command(tmp_path, user_data):
+    """The import hashes every password and skips rows that clash with existing users."""
+    User.objects.create_user(
+        name="Jane Doe",
+        email="jane.doe@example.com",
+        cpf="52998224725",
+        birth_date=date(1990, 1, 1),
+        password="Existing123!"
+    )
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text(
+        "name,email,cpf,birth_date,password\n"
+        "John Doe,john.doe@example.com,718.820.060-20,2000-05-01,SecurePass123!\n"
+        "Jane Again,jane.doe@example.com,11144477735,1995-02-03,Other123!\n"
+    )
+
+    call_command("import_users", str(csv_path), "--batch-size", "2", "--workers", "1", stdout=StringIO())
+
+    imported = User.objects.get(email="john.doe@example.com")
+    assert imported.cpf == "71882006020"
+    assert imported.check_password("SecurePass123!")
+    assert User.objects.get(email="jane.doe@example.com").name == "Jane Doe"
+    assert not User.objects.filter(cpf="11144477735").exists()
+
+
+@pytest.mark.django_db
+def test_import_users_reports_invalid_rows_with_their_line(tmp_path):
+    """Invalid rows are reported and skipped, and only the rows actually inserted count as imported."""
+    User.objects.create_user(
+        name="Jane Doe", email="jane.doe@example.com", cpf="52998224725", birth_date=date(1990, 1, 1),
+        password="Existing123!"
+    )
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text(
+        "name,email,cpf,birth_date,password\n"
+        "John Doe,john.doe@example.com,718.820.060-20,2000-05-01,SecurePass123!\n"
+        "Jane Again,jane.doe@example.com,11144477735,1995-02-03,Other123!\n"
+        "Bad Date,bad.date@example.com,39053344705,2000-13-45,SecurePass123!\n"
+        "Bad CPF,bad.cpf@example.com,12345678900,2000-05-01,SecurePass123!\n"
+        "Short Row,short@example.com\n"
+    )
+    stdout, stderr = StringIO(), StringIO()
+
+    call_command("import_users", str(csv_path), "--batch-size", "2", "--workers", "1", stdout=stdout, stderr=stderr)
+
+    assert "Imported 1 rows" in stdout.getvalue()
+    assert "1 skipped as existing users, 3 invalid." in stdout.getvalue()
+    errors = stderr.getvalue().splitlines()
+    assert errors[0].startswith("Line 4: birth_date:")
+    assert errors[1].startswith("Line 5: cpf:")
+    assert errors[2] == "Line 6: missing cpf, birth_date, password."
+    assert set(User.objects.values_list("email", flat=True)) == {"jane.doe@example.com", "john.doe@example.com"}
+
+
+@pytest.mark.django_db
+def test_async_registration(api_client, user_data):
+    """The async endpoint registers the client with the password hashed in the hashing pool."""
+    url = reverse("users:client-register-async")
+    response = api_client.post(url, data=user_data)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["message"] == "Client successfully created."
+    assert User.objects.get(email=user_data["email"]).check_password(user_data["password"])
+
+    response = api_client.post(url, data={**user_data, "cpf": "52998224725"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "A user with this email already exists." in response.data["detail"]["email"][0]
@@ -0,0 +1,87 @@
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from celery import Celery
+
+from utils.broker import CircuitBreaker, publish
+from utils.exceptions import BrokerUnavailableException
+
+
+@pytest.fixture
+def stalled_broker(settings):
+    """
+    Accepts connections and never answers, like a broker that hangs after the TCP handshake.
+    """
+    server = socket.create_server(("127.0.0.1", 0))
+    connections = []
+
+    def accept():
+        while True:
+            try:
+                connections.append(server.accept()[0])
+            except OSError:
+                return
+
+    threading.Thread(target=accept, daemon=True).start()
+    app = Celery('stalled_broker', broker=f"redis://127.0.0.1:{server.getsockname()[1]}/0")
+    app.conf.broker_transport_options = settings.CELERY_BROKER_TRANSPORT_OPTIONS
+    app.conf.broker_connection_timeout = settings.CELERY_BROKER_CONNECTION_TIMEOUT
+    yield app
+    server.close()
+    for connection in connections:
+        connection.close()
+
+
+@pytest.fixture
+def circuit():
+    circuit = CircuitBreaker("Broker", failure_threshold=2, reset_timeout=30)
+    with patch('utils.broker.broker_circuit', circuit):
+        yield circuit
+
+
+def test_publish_sends_task_without_retries(circuit):
+    with patch('utils.broker.current_app.send_task') as mock_send_task:
+        publish('notifications.tasks.flush_email_batch', countdown=5)
+
+    mock_send_task.assert_called_once_with(
+        'notifications.tasks.flush_email_batch', args=None, retry=False, countdown=5
+    )
+
+
+def test_circuit_opens_after_consecutive_failures(circuit):
+    with patch('utils.broker.current_app.send_task', side_effect=ConnectionError("broker down")) as mock_send_task:
+        for _ in range(4):
+            with pytest.raises(BrokerUnavailableException):
+                publish('notifications.tasks.flush_email_batch')
+
+    assert circuit.is_open
+    assert mock_send_task.call_count == 2
+
+
+def test_stalled_publishes_time_out_and_open_the_circuit(circuit, stalled_broker, settings):
+    started = time.monotonic()
+    with patch('utils.broker.current_app', stalled_broker):
+        for _ in range(3):
+            with pytest.raises(BrokerUnavailableException):
+                publish('notifications.tasks.flush_email_batch')
+
+    assert circuit.is_open
+    assert time.monotonic() - started < 3 * settings.BROKER_PUBLISH_TIMEOUT
+
+
+def test_circuit_lets_one_trial_through_after_reset_timeout(circuit):
+    with patch('utils.circuit_breaker.time.monotonic', return_value=100.0):
+        circuit.record_failure()
+        circuit.record_failure()
+        assert not circuit.allow()
+
+    with patch('utils.circuit_breaker.time.monotonic', return_value=131.0):
+        assert circuit.allow()
+        assert not circuit.allow()
+        circuit.record_success()
+
+    assert not circuit.is_open
+    assert circuit.allow()
@@ -0,0 +1,40 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from django.db import DatabaseError
+from rest_framework import status
+
+
+@pytest.mark.django_db
+def test_health_check_reports_reachable_databases(api_client):
+    response = api_client.get("/health/db/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"status": "ok", "databases": {"default": "ok"}}
+
+
+def test_health_check_reports_unreachable_databases(api_client):
+    connection = Mock(alias="default")
+    connection.cursor.side_effect = DatabaseError("connection refused")
+    with patch('utils.db_pool.connections') as connections:
+        connections.all.return_value = [connection]
+        response = api_client.get("/health/db/")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.data["databases"] == {"default": "unavailable"}
+
+
+@pytest.mark.django_db
+def test_pool_metrics_are_reported_to_admins(auth_api_client):
+    pool = Mock()
+    pool.name = "default-web"
+    pool.get_stats.return_value = {"pool_min": 2, "pool_max": 10, "pool_size": 3, "pool_available": 1,
+                                   "requests_waiting": 0}
+    with patch('utils.db_pool.connections') as connections:
+        connections.all.return_value = [Mock(alias="default", pool=pool), Mock(alias="replica", spec=["alias"])]
+        response = auth_api_client.get("/metrics/db-pool/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["default"] == {"pooled": True, "name": "default-web", "pool_min": 2, "pool_max": 10,
+                                        "pool_size": 3, "pool_available": 1, "requests_waiting": 0}
+    assert response.data["replica"] == {"pooled": False}
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from bookings.models import Booking
+from bookings.repository import BookingRepository
+from rooms.models import Room
+from rooms.repository import RoomRepository
+from users.models import User
+from utils.db_router import PrimaryReplicaRouter, ReplicaStickinessMiddleware, _current_request, pin_to_primary
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.DB_REPLICAS = ['replica_1']
+    settings.DB_REPLICA_STICKINESS = 5
+    return settings.DB_REPLICAS
+
+
+def as_request(method: str, user=None):
+    request = getattr(RequestFactory(), method.lower())("/rooms/")
+    if user is not None:
+        request.user = user
+    return request
+
+
+def test_repository_reads_go_to_a_replica(replicas):
+    assert RoomRepository.get_all_rooms().db == 'replica_1'
+    assert RoomRepository().filter_rooms(room_type="single").db == 'replica_1'
+    assert BookingRepository.get_filtered_bookings({"status": "confirmed"}).db == 'replica_1'
+
+
+def test_other_reads_and_writes_stay_on_the_primary(replicas):
+    router = PrimaryReplicaRouter()
+
+    assert Room.objects.all().db == 'default'
+    assert router.db_for_write(Room) == 'default'
+    assert Booking.objects.select_for_update().db == 'default'
+
+
+def test_reads_without_replicas_go_to_the_primary(settings):
+    settings.DB_REPLICAS = []
+
+    assert RoomRepository.get_all_rooms().db == 'default'
+
+
+def test_reads_inside_a_transaction_go_to_the_primary(replicas):
+    with patch('utils.db_router.connections') as connections:
+        connections.__getitem__.return_value.in_atomic_block = True
+        assert RoomRepository.get_all_rooms().db == 'default'
+
+
+def test_async_repository_reads_go_to_a_replica(replicas):
+    routed = []
+
+    def record(self, model, **hints):
+        alias = original(self, model, **hints)
+        routed.append(alias)
+        raise Room.DoesNotExist
+
+    original = PrimaryReplicaRouter.db_for_read
+    with patch.object(PrimaryReplicaRouter, 'db_for_read', record):
+        with pytest.raises(Room.DoesNotExist):
+            async_to_sync(RoomRepository.aget_room_by_id)(1)
+
+    assert routed == ['replica_1']
+
+
+def test_writing_requests_read_from_the_primary(replicas):
+    token = _current_request.set(as_request("POST"))
+    try:
+        assert RoomRepository.get_all_rooms().db == 'default'
+    finally:
+        _current_request.reset(token)
+
+
+def test_user_reads_from_the_primary_after_their_own_write(replicas):
+    writer, other = User(id=1, email="writer@example.com"), User(id=2, email="other@example.com")
+    pin_to_primary(writer)
+
+    for user, expected in ((writer, 'default'), (other, 'replica_1')):
+        token = _current_request.set(as_request("GET", user))
+        try:
+            assert RoomRepository.get_all_rooms().db == expected
+        finally:
+            _current_request.reset(token)
+
+
+def test_middleware_pins_users_after_successful_writes(replicas):
+    user = User(id=1, email="writer@example.com")
+    ReplicaStickinessMiddleware(lambda request: HttpResponse(status=201))(as_request("POST", user))
+
+    token = _current_request.set(as_request("GET", user))
+    try:
+        assert RoomRepository.get_all_rooms().db == 'default'
+    finally:
+        _current_request.reset(token)
+
+
+def test_middleware_does_not_pin_after_failed_writes(replicas):
+    user = User(id=1, email="writer@example.com")
+    ReplicaStickinessMiddleware(lambda request: HttpResponse(status=400))(as_request("POST", user))
+
+    token = _current_request.set(as_request("GET", user))
+    try:
+        assert RoomRepository.get_all_rooms().db == 'replica_1'
+    finally:
+        _current_request.reset(token)
+
+
+def test_migrations_skip_replicas(replicas):
+    router = PrimaryReplicaRouter()
+
+    assert router.allow_migrate('replica_1', 'rooms') is False
+    assert router.allow_migrate('default', 'rooms') is None
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+
+from utils.load_shedding import LoadShedder, CRITICAL, NORMAL, LOW
+
+
+@pytest.fixture
+def load_shedder():
+    shedder = LoadShedder(max_in_flight=2, low_priority_max_in_flight=1, p95_latency_limit=1.0, latency_window=30)
+    with patch('utils.load_shedding.load_shedder', shedder):
+        yield shedder
+
+
+def test_routes_are_shed_by_priority(load_shedder):
+    assert load_shedder.admit("RoomListView", LOW)
+    assert not load_shedder.admit("RoomListView", LOW)
+    assert load_shedder.admit("BookingListView", NORMAL)
+    assert not load_shedder.admit("BookingListView", NORMAL)
+    assert load_shedder.admit("CheckInView", CRITICAL)
+
+    assert load_shedder.in_flight == 3
+    assert load_shedder.metrics()["shed"] == {"RoomListView": 1, "BookingListView": 1}
+
+
+def test_slow_low_priority_routes_are_shed_until_latency_recovers(load_shedder):
+    with patch('utils.load_shedding.time.monotonic', return_value=100.0):
+        for _ in range(20):
+            load_shedder.in_flight += 1
+            load_shedder.finish("RoomAvailabilityFilterView", 3.0)
+
+        assert load_shedder.p95("RoomAvailabilityFilterView") == 3.0
+        assert not load_shedder.admit("RoomAvailabilityFilterView", LOW)
+        assert load_shedder.admit("BookingListView", NORMAL)
+        load_shedder.finish("BookingListView", 0.1)
+
+    with patch('utils.load_shedding.time.monotonic', return_value=131.0):
+        assert load_shedder.admit("RoomAvailabilityFilterView", LOW)
+
+
+@pytest.mark.django_db
+def test_middleware_rejects_shed_requests_before_the_view(api_client, load_shedder):
+    load_shedder.in_flight = 2
+
+    response = api_client.get("/rooms/")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response["Retry-After"] == "5"
+
+    assert api_client.post("/checkin/1/").status_code == status.HTTP_401_UNAUTHORIZED
+    assert load_shedder.in_flight == 2
+
+
+@pytest.mark.django_db
+def test_metrics_view_reports_shed_counts_to_admins(api_client, auth_api_client, load_shedder):
+    load_shedder.admit("RoomListView", LOW)
+    load_shedder.admit("RoomListView", LOW)
+
+    response = auth_api_client.get("/metrics/load-shedding/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["shed"] == {"RoomListView": 1}
+    assert "LoadSheddingMetricsView" not in response.data["shed"]
@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db.backends.postgresql.base import ServerBindingCursor
+
+from rooms.enums import RoomStatus, RoomType
+from rooms.models import Room
+from rooms.repository import RoomRepository
+from utils.prepared_statements import prepared_statements
+
+
+def postgres_connection():
+    connection = MagicMock(vendor="postgresql")
+    connection.connection.cursor_factory = "client-binding"
+    connection.connection.prepare_threshold = None
+    return connection
+
+
+def test_prepares_statements_inside_the_block_when_enabled(settings):
+    settings.DB_PREPARED_STATEMENTS = True
+    connection = postgres_connection()
+    with patch('utils.prepared_statements.connections', {"default": connection}):
+        with prepared_statements():
+            assert connection.connection.cursor_factory is ServerBindingCursor
+            assert connection.connection.prepare_threshold == 0
+
+    assert connection.connection.cursor_factory == "client-binding"
+    assert connection.connection.prepare_threshold is None
+
+
+def test_restores_the_connection_when_the_query_fails(settings):
+    settings.DB_PREPARED_STATEMENTS = True
+    connection = postgres_connection()
+    with patch('utils.prepared_statements.connections', {"default": connection}):
+        with pytest.raises(RuntimeError):
+            with prepared_statements():
+                raise RuntimeError("query failed")
+
+    assert connection.connection.cursor_factory == "client-binding"
+    assert connection.connection.prepare_threshold is None
+
+
+def test_leaves_the_connection_alone_when_disabled(settings):
+    settings.DB_PREPARED_STATEMENTS = False
+    connection = postgres_connection()
+    with patch('utils.prepared_statements.connections', {"default": connection}):
+        with prepared_statements():
+            assert connection.connection.cursor_factory == "client-binding"
+
+    connection.ensure_connection.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_repository_queries_run_unchanged_on_other_databases(settings):
+    settings.DB_PREPARED_STATEMENTS = True
+    room = Room.objects.create(number="101", status=RoomStatus.AVAILABLE.value, room_type=RoomType.SINGLE.value,
+                               price=100)
+
+    assert RoomRepository.get_available_room(room_type=RoomType.SINGLE.value) == room
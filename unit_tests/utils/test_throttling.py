@@ -0,0 +1,142 @@
+import time
+from unittest.mock import Mock, patch
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from utils import throttling
+from utils.circuit_breaker import CircuitBreaker
+from utils.throttling import IPRateThrottle, PartnerRateThrottle, UserRateThrottle
+
+THROTTLE_CLASSES = [IPRateThrottle, UserRateThrottle, PartnerRateThrottle]
+
+
+@pytest.fixture
+def sliding_window():
+    script = Mock(return_value=[1, 0])
+    with patch('utils.throttling._sliding_window_script', return_value=script):
+        yield script
+
+
+@pytest.fixture
+def redis_server():
+    """
+    Runs the real sliding window script against an in-memory Redis.
+    """
+    client = fakeredis.FakeRedis(decode_responses=True)
+    throttling._sliding_window_script.cache_clear()
+    with patch('utils.throttling.get_redis_client', return_value=client):
+        yield client
+    throttling._sliding_window_script.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def redis_circuit():
+    circuit = CircuitBreaker("Throttling Redis", failure_threshold=1, reset_timeout=30)
+    with patch('utils.throttling.redis_circuit', circuit):
+        yield circuit
+
+
+class ThreePerMinuteThrottle(IPRateThrottle):
+    rate = "3/min"
+
+
+def anonymous_request():
+    return APIView().initialize_request(APIRequestFactory().get("/rooms/", REMOTE_ADDR="10.0.0.1"))
+
+
+@pytest.fixture(autouse=True)
+def partner_keys(settings):
+    settings.THROTTLE_PARTNER_KEYS = ["partner-secret"]
+
+
+def throttle_keys(request) -> list:
+    request = APIView().initialize_request(request)
+    keys = []
+    for throttle_class in THROTTLE_CLASSES:
+        key = throttle_class().get_cache_key(request, None)
+        if key is not None:
+            keys.append(key)
+    return keys
+
+
+def test_each_request_is_counted_in_exactly_one_scope():
+    factory = APIRequestFactory()
+    user = Mock(pk=7, is_authenticated=True)
+    authenticated = factory.get("/rooms/")
+    force_authenticate(authenticated, user=user)
+
+    assert throttle_keys(factory.get("/rooms/", REMOTE_ADDR="10.0.0.1")) == ["throttle:ip:10.0.0.1"]
+    assert throttle_keys(factory.get("/rooms/", HTTP_X_PARTNER_KEY="unknown", REMOTE_ADDR="10.0.0.1")) == [
+        "throttle:ip:10.0.0.1"
+    ]
+    assert throttle_keys(authenticated) == ["throttle:user:7"]
+    [partner_key] = throttle_keys(factory.get("/rooms/", HTTP_X_PARTNER_KEY="partner-secret"))
+    assert partner_key.startswith("throttle:partner:") and "partner-secret" not in partner_key
+
+
+def test_sliding_window_runs_one_script_call_per_request(sliding_window):
+    request = APIView().initialize_request(APIRequestFactory().get("/rooms/", REMOTE_ADDR="10.0.0.1"))
+    throttle = IPRateThrottle()
+
+    assert throttle.allow_request(request, None)
+
+    sliding_window.assert_called_once()
+    kwargs = sliding_window.call_args.kwargs
+    assert kwargs["keys"] == ["throttle:ip:10.0.0.1"]
+    assert kwargs["args"][:2] == [throttle.duration * 1000, throttle.num_requests]
+
+
+def test_sliding_window_allows_the_limit_and_then_denies(redis_server):
+    for _ in range(3):
+        assert ThreePerMinuteThrottle().allow_request(anonymous_request(), None)
+
+    throttle = ThreePerMinuteThrottle()
+    assert not throttle.allow_request(anonymous_request(), None)
+    assert 59 < throttle.wait() <= 60
+    assert redis_server.zcard("throttle:ip:10.0.0.1") == 3
+    assert 0 < redis_server.pttl("throttle:ip:10.0.0.1") <= 60000
+
+
+def test_sliding_window_admits_requests_again_once_the_window_moves_on(redis_server):
+    script = redis_server.register_script(throttling.SLIDING_WINDOW_SCRIPT)
+
+    assert script(keys=["throttle:test"], args=[100, 2, "a"]) == [1, 0]
+    assert script(keys=["throttle:test"], args=[100, 2, "b"]) == [1, 0]
+    allowed, wait_ms = script(keys=["throttle:test"], args=[100, 2, "c"])
+    assert allowed == 0 and 0 <= wait_ms <= 100
+
+    time.sleep(0.15)
+    assert script(keys=["throttle:test"], args=[100, 2, "d"]) == [1, 0]
+    assert redis_server.zrange("throttle:test", 0, -1) == ["d"]
+
+
+@pytest.mark.django_db
+def test_throttled_requests_get_429_with_retry_after(api_client, sliding_window):
+    sliding_window.return_value = [0, 12500]
+
+    response = api_client.get("/rooms/")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response["Retry-After"] == "13"
+
+
+@pytest.mark.django_db
+def test_throttling_fails_open_when_redis_is_down(api_client, sliding_window):
+    sliding_window.side_effect = RedisConnectionError("redis down")
+
+    assert api_client.get("/rooms/").status_code == status.HTTP_200_OK
+
+
+def test_throttling_skips_redis_while_it_is_down(sliding_window, redis_circuit):
+    sliding_window.side_effect = RedisConnectionError("redis down")
+
+    for _ in range(3):
+        assert IPRateThrottle().allow_request(anonymous_request(), None)
+
+    assert redis_circuit.is_open
+    sliding_window.assert_called_once()
@@ -0,0 +1,94 @@
+import csv
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+
+from users.enums import UserRole
+from users.models import User
+from users.repository import UserRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports users from a CSV file with name, email, cpf, birth_date (YYYY-MM-DD) and password columns. "
+        "Rows are validated like registrations, passwords are hashed in a process pool and users are inserted "
+        "in batches; rows whose email or CPF already exists are skipped and invalid rows are reported."
+    )
+    REQUIRED_COLUMNS = ("name", "email", "cpf", "birth_date", "password")
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to import.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Users inserted per statement.")
+        parser.add_argument("--workers", type=int, help="Hashing processes, defaults to the number of CPUs.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        imported = skipped = 0
+        invalid = []
+
+        with open(options["path"], newline="", encoding="utf-8") as csv_file, \
+                ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            rows = self._numbered_rows(csv.DictReader(csv_file))
+            while batch := list(islice(rows, batch_size)):
+                valid = []
+                for line, row in batch:
+                    user, error = self._build_user(row)
+                    if error:
+                        invalid.append((line, error))
+                    else:
+                        valid.append((user, row["password"]))
+                # Ship passwords to the workers in chunks so the pickling cost stays small next to PBKDF2.
+                hashes = executor.map(make_password, [password for _, password in valid], chunksize=32)
+                users = []
+                for (user, _), password in zip(valid, hashes):
+                    user.password = password
+                    users.append(user)
+                inserted = UserRepository.bulk_create_users(users, batch_size)
+                imported += inserted
+                skipped += len(users) - inserted
+                self.stdout.write(f"{imported + skipped + len(invalid)} rows processed.")
+
+        for line, error in invalid:
+            self.stderr.write(f"Line {line}: {error}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported} rows from {options['path']}: {skipped} skipped as existing users, "
+            f"{len(invalid)} invalid."
+        ))
+
+    @staticmethod
+    def _numbered_rows(reader: csv.DictReader) -> Iterator[Tuple[int, dict]]:
+        for row in reader:
+            yield reader.line_num, row
+
+    def _build_user(self, row: dict) -> Tuple[Optional[User], Optional[str]]:
+        """
+        Returns the user for a row, or the reason it is invalid. bulk_create skips User.save(), so the
+        row goes through the same field validation and clean() as a registration.
+        """
+        missing = [column for column in self.REQUIRED_COLUMNS if not (row.get(column) or "").strip()]
+        if missing:
+            return None, f"missing {', '.join(missing)}."
+
+        user = User(
+            name=row["name"],
+            email=User.objects.normalize_email(row["email"]),
+            cpf=row["cpf"],
+            birth_date=row["birth_date"],
+            role=row.get("role") or UserRole.CLIENT.value,
+        )
+        try:
+            # Duplicates are left to the unique constraints, which skip them on insert.
+            user.full_clean(exclude=["password"], validate_unique=False, validate_constraints=False)
+        except ValidationError as e:
+            return None, self._describe(e)
+        return user, None
+
+    @staticmethod
+    def _describe(error: ValidationError) -> str:
+        return " ".join(
+            f"{field}: {' '.join(field_messages)}" for field, field_messages in error.message_dict.items()
+        )
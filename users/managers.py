@@ -1,7 +1,20 @@
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
 
+from users.signals import users_updated
 
-class UserManager(BaseUserManager):
+
+class UserQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # Also covers bulk_update(), which updates through this method.
+        user_ids = list(self.values_list("pk", flat=True))
+        updated = super().update(**kwargs)
+        if user_ids:
+            users_updated.send(sender=self.model, user_ids=user_ids)
+        return updated
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     def create_user(self, name, email, cpf, birth_date, password=None, **extra_fields):
         if not email:
             raise ValueError("The Email field must be set.")
@@ -1,4 +1,12 @@
+from typing import List, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
 from users.models import User
+from users.signals import users_updated
+from utils.exceptions import UserAlreadyExistsException
 
 
 class UserRepository:
@@ -10,11 +18,91 @@ class UserRepository:
             birth_date: str,
             password: str,
     ) -> User:
-        user = User.objects.create_user(
+        user = User(
+            name=name,
+            email=User.objects.normalize_email(email),
+            cpf=cpf,
+            birth_date=birth_date,
+        )
+        user.set_password(password)
+        UserRepository._insert(user)
+        return user
+
+    @staticmethod
+    async def acreate_user(
+            name: str,
+            email: str,
+            cpf: str,
+            birth_date: str,
+            password_hash: str,
+    ) -> User:
+        user = User(
             name=name,
-            email=email,
+            email=User.objects.normalize_email(email),
             cpf=cpf,
             birth_date=birth_date,
-            password=password,
+            password=password_hash,
         )
+        await sync_to_async(UserRepository._insert)(user)
         return user
+
+    @staticmethod
+    def _insert(user: User) -> None:
+        """
+        Inserts the user with a single INSERT: duplicates are caught by the unique constraints instead
+        of prior lookups. The savepoint keeps a caller's transaction usable after a duplicate.
+        """
+        try:
+            with transaction.atomic():
+                user.save(force_insert=True)
+        except IntegrityError:
+            conflicts = UserRepository._conflicting_fields(user)
+            if not conflicts:
+                raise
+            raise UserAlreadyExistsException({
+                field: [User._meta.get_field(field).error_messages['unique']] for field in conflicts
+            })
+
+    @staticmethod
+    def _conflicting_fields(user: User) -> List[str]:
+        """
+        The database reports a single violated constraint, and how it names it depends on the backend,
+        so the rejected row is looked up to report every field already taken, like validation did.
+        """
+        taken = User.objects.filter(Q(email=user.email) | Q(cpf=user.cpf)).values_list("email", "cpf")
+        conflicts = set()
+        for email, cpf in taken:
+            if email == user.email:
+                conflicts.add("email")
+            if cpf == user.cpf:
+                conflicts.add("cpf")
+        return [field for field in ("email", "cpf") if field in conflicts]
+
+    @staticmethod
+    def get_user_by_id(user_id: int) -> User:
+        return User.objects.get(id=user_id)
+
+    @staticmethod
+    async def aget_user_by_email(email: str) -> Optional[User]:
+        return await User.objects.filter(email=email).afirst()
+
+    @staticmethod
+    async def aset_password_hash(user: User, password_hash: str) -> None:
+        user.password = password_hash
+        await user.asave(update_fields=["password"])
+
+    @staticmethod
+    def bulk_create_users(users: list, batch_size: int) -> int:
+        """
+        Inserts the users, skipping those whose email or CPF already exists, and returns how many were
+        inserted. Every password hash has its own salt, so the inserted rows are the ones holding them.
+        bulk_create skips post_save, so users_updated is sent for them instead.
+        """
+        if not users:
+            return 0
+        User.objects.bulk_create(users, batch_size=batch_size, ignore_conflicts=True)
+        inserted = User.objects.filter(password__in=[user.password for user in users])
+        user_ids = list(inserted.values_list("pk", flat=True))
+        if user_ids:
+            users_updated.send(sender=User, user_ids=user_ids)
+        return len(user_ids)
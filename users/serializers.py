@@ -1,9 +1,11 @@
 from datetime import date
 
+from localflavor.br.validators import BRCPFValidator
 from rest_framework import serializers
 
 from users.enums import UserRole
 from users.models import User
+from users.repository import UserRepository
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -13,7 +15,10 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ['name', 'email', 'cpf', 'birth_date', 'password',]
         extra_kwargs = {
-            'role': {'default': UserRole.CLIENT.value}
+            'role': {'default': UserRole.CLIENT.value},
+            # Uniqueness is left to the INSERT itself (UserRepository.create_user), so validation runs no queries.
+            'email': {'validators': []},
+            'cpf': {'validators': [BRCPFValidator()]},
         }
 
     @staticmethod
@@ -23,22 +28,5 @@ class UserSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("You must be at least 18 years old to register.")
         return value
 
-    @staticmethod
-    def validate_email(value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("This email is already in use.")
-        return value
-
-    @staticmethod
-    def validate_cpf(value):
-        cpf = value.replace(".", "").replace("-", "")
-        if User.objects.filter(cpf=cpf).exists():
-            raise serializers.ValidationError("This CPF is already in use.")
-        return value
-
     def create(self, validated_data):
-        password = validated_data.pop('password')
-        user = User.objects.create(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        return UserRepository.create_user(**validated_data)
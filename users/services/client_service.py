@@ -12,7 +12,12 @@ from bookings.repository import BookingRepository
 from rooms.enums import RoomStatus
 from rooms.repository import RoomRepository
 from users.repository import UserRepository
-from utils.exceptions import BookingCannotBeConfirmedException, UnauthorizedCancellationException
+from utils.exceptions import (
+    BookingCannotBeConfirmedException,
+    UnauthorizedCancellationException,
+    UserAlreadyExistsException,
+)
+from utils.hashing import amake_password
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +33,6 @@ class ClientService:
         self.room_repository = room_repository or RoomRepository()
         self.user_repository = user_repository or UserRepository()
 
-    @transaction.atomic
     def create_user(
             self,
             name: str,
@@ -48,6 +52,41 @@ class ClientService:
             logger.info(f"User {user.id} created successfully.")
             return user
 
+        except UserAlreadyExistsException as e:
+            logger.info(f"Registration rejected: {e.message}")
+            raise
+
+        except Exception as e:
+            logger.error(f"Error during user creation: {e}")
+            raise
+
+    async def acreate_user(
+            self,
+            name: str,
+            email: str,
+            cpf: str,
+            birth_date: str,
+            password: str,
+    ) -> User:
+        """
+        create_user for async views: the password is hashed in the hashing process pool instead of
+        on the event loop.
+        """
+        try:
+            user = await self.user_repository.acreate_user(
+                name=name,
+                email=email,
+                cpf=cpf,
+                birth_date=birth_date,
+                password_hash=await amake_password(password)
+            )
+            logger.info(f"User {user.id} created successfully.")
+            return user
+
+        except UserAlreadyExistsException as e:
+            logger.info(f"Registration rejected: {e.message}")
+            raise
+
         except Exception as e:
             logger.error(f"Error during user creation: {e}")
             raise
@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# Sent with the ids of users written without post_save: UserQuerySet.update() and UserRepository.bulk_create_users().
+users_updated = Signal()
@@ -1,9 +1,10 @@
 from django.urls import path
 
-from users.views import ClientRegistrationView
+from users.views import AsyncClientRegistrationView, ClientRegistrationView
 
 app_name = 'users'
 
 urlpatterns = [
     path('register/', ClientRegistrationView.as_view(), name='client-register'),
+    path('register/async/', AsyncClientRegistrationView.as_view(), name='client-register-async'),
 ]
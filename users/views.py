@@ -6,6 +6,17 @@ from rest_framework.views import APIView
 
 from users.serializers import UserSerializer
 from users.services.client_service import ClientService
+from utils.async_views import AsyncAPIView
+from utils.exceptions import UserAlreadyExistsException
+
+
+def validation_error(errors: dict) -> Response:
+    # Duplicates found by the INSERT are reported like the serializer's field errors.
+    return Response({
+        "status": "error",
+        "message": "Validation error.",
+        "detail": errors
+    }, status=status.HTTP_400_BAD_REQUEST)
 
 
 class ClientRegistrationView(APIView):
@@ -47,11 +58,59 @@ class ClientRegistrationView(APIView):
                     },
                     status=status.HTTP_201_CREATED
                 )
+            except UserAlreadyExistsException as e:
+                return validation_error(e.errors)
             except Exception as e:
                 raise e
         else:
-            return Response({
-                "status": "error",
-                "message": "Validation error.",
-                "detail": serializer.errors
-            }, status=status.HTTP_400_BAD_REQUEST)
+            return validation_error(serializer.errors)
+
+
+class AsyncClientRegistrationView(AsyncAPIView):
+    """
+    ClientRegistrationView for ASGI deployments: the password is hashed in the hashing process pool
+    (utils.hashing) while the event loop keeps serving other requests.
+    """
+    permission_classes = [AllowAny]
+
+    def __init__(
+            self,
+            client_service: ClientService = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.client_service = client_service or ClientService()
+
+    @swagger_auto_schema(
+        operation_description="Register a new client with email, CPF, birth date, and password. "
+                              "Same contract as /users/register/, served asynchronously.",
+        request_body=UserSerializer,
+        responses={
+            201: "Client successfully created.",
+            400: "Validation error.",
+            500: "Internal server error."
+        }
+    )
+    async def post(self, request):
+        serializer = UserSerializer(data=request.data)
+        if not serializer.is_valid():
+            return validation_error(serializer.errors)
+
+        try:
+            await self.client_service.acreate_user(
+                name=serializer.validated_data['name'],
+                email=serializer.validated_data['email'],
+                cpf=serializer.validated_data['cpf'],
+                birth_date=serializer.validated_data['birth_date'],
+                password=serializer.validated_data['password']
+            )
+        except UserAlreadyExistsException as e:
+            return validation_error(e.errors)
+        return Response(
+            {
+                "status": "success",
+                "message": "Client successfully created.",
+                "detail": serializer.data
+            },
+            status=status.HTTP_201_CREATED
+        )
@@ -0,0 +1,62 @@
+import asyncio
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+def same_schema_as(handler: Callable) -> Callable:
+    """
+    Gives an async handler the swagger_auto_schema of the sync handler it stands in for.
+    """
+    def decorator(async_handler: Callable) -> Callable:
+        if hasattr(handler, "_swagger_auto_schema"):
+            async_handler._swagger_auto_schema = handler._swagger_auto_schema
+        return async_handler
+    return decorator
+
+
+def sync_handler(handler: Callable) -> Callable:
+    """
+    Runs a sync handler of a parent view from an AsyncAPIView. Django does not allow sync and async
+    handlers on one view, so handlers without an async version (writes) run in a thread instead.
+    """
+    @same_schema_as(handler)
+    async def wrapper(self, request, *args, **kwargs):
+        return await sync_to_async(handler)(self, request, *args, **kwargs)
+
+    wrapper.__name__ = handler.__name__
+    return wrapper
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines. DRF only dispatches sync handlers, so this runs the same
+    request cycle (authentication, permissions, throttling, exception handling) and awaits the
+    handler. The checks in initial() may hit the database or Redis, so they run in a thread.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
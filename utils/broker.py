@@ -0,0 +1,36 @@
+import logging
+from typing import Optional
+
+from celery import current_app
+from django.conf import settings
+
+from utils.circuit_breaker import CircuitBreaker
+from utils.exceptions import BrokerUnavailableException
+
+logger = logging.getLogger(__name__)
+
+
+broker_circuit = CircuitBreaker(
+    "Broker",
+    failure_threshold=settings.BROKER_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.BROKER_CIRCUIT_RESET_TIMEOUT,
+)
+
+
+def publish(task_name: str, args: Optional[list] = None, **options) -> None:
+    """
+    Publishes a task without Celery's publish retries, so an unhealthy broker costs at most
+    one socket timeout (BROKER_PUBLISH_TIMEOUT) and, once the circuit is open, nothing at all.
+    Raises BrokerUnavailableException when the task was not published.
+    """
+    if not broker_circuit.allow():
+        raise BrokerUnavailableException()
+
+    try:
+        current_app.send_task(task_name, args=args, retry=False, **options)
+    except Exception as e:
+        broker_circuit.record_failure()
+        logger.error(f"Failed to publish {task_name}: {e}")
+        raise BrokerUnavailableException() from e
+
+    broker_circuit.record_success()
@@ -9,3 +9,16 @@ class IsAdminUser(BasePermission):
 
     def has_permission(self, request, view):
         return bool(request.user and request.user.role == UserRole.ADMIN.value)
+
+
+class IsStaffOrAdminUser(BasePermission):
+    """
+    Allows access only to authenticated users with the STAFF or ADMIN role.
+    """
+
+    def has_permission(self, request, view):
+        return bool(
+            request.user
+            and request.user.is_authenticated
+            and request.user.role in (UserRole.STAFF.value, UserRole.ADMIN.value)
+        )
@@ -0,0 +1,46 @@
+import logging
+
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+
+def _pool(connection):
+    # Only the PostgreSQL backend has pools; `pool` is None there when pooling is disabled.
+    return getattr(connection, 'pool', None)
+
+
+def pool_metrics() -> dict:
+    """
+    psycopg_pool statistics of this process's pool for each database alias: configured and current
+    size, idle connections, requests waiting for a connection, and counters since the pool started.
+    """
+    metrics = {}
+    for connection in connections.all():
+        pool = _pool(connection)
+        if pool is None:
+            metrics[connection.alias] = {"pooled": False}
+            continue
+        metrics[connection.alias] = {
+            "pooled": True,
+            "name": pool.name,
+            **pool.get_stats(),
+        }
+    return metrics
+
+
+def check_databases() -> dict:
+    """
+    Runs a trivial query on every database alias, returning whether each one answered. With a
+    pool, the connection is checked out (and health-checked) and then returned to the pool.
+    """
+    results = {}
+    for connection in connections.all():
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            results[connection.alias] = True
+        except DatabaseError as e:
+            logger.error(f"Database {connection.alias} failed its health check: {e}")
+            results[connection.alias] = False
+    return results
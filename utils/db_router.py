@@ -0,0 +1,156 @@
+import logging
+import random
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+_current_request: ContextVar = ContextVar('db_routing_request', default=None)
+
+
+def replica_for_read(func: Callable) -> Callable:
+    """
+    Lets the reads of a repository method go to a replica. Querysets it returns are bound to the
+    database chosen here, so they read from the same place when they are evaluated later.
+    """
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            # The async ORM runs queries in a thread, which gets a copy of this context.
+            token = _replica_reads.set(True)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _replica_reads.reset(token)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _replica_reads.set(True)
+        try:
+            result = func(*args, **kwargs)
+            if isinstance(result, QuerySet):
+                result = result.using(result.db)
+            return result
+        finally:
+            _replica_reads.reset(token)
+    return wrapper
+
+
+def _pin_key(user_id: int) -> str:
+    return f"db:primary-pin:{user_id}"
+
+
+def pin_to_primary(user) -> None:
+    """
+    Sends the user's replica reads to the primary for DB_REPLICA_STICKINESS seconds, so they see
+    their own write even while the replicas are catching up.
+    """
+    if not settings.DB_REPLICAS or user is None or not user.is_authenticated:
+        return
+    try:
+        cache.set(_pin_key(user.pk), True, settings.DB_REPLICA_STICKINESS)
+    except Exception as e:
+        logger.warning(f"Could not pin user {user.pk} to the primary database: {e}")
+
+
+def _pinned_to_primary() -> bool:
+    request = _current_request.get()
+    if request is None:
+        return False
+    if request.method not in SAFE_METHODS:
+        return True
+
+    pinned: Optional[bool] = getattr(request, '_db_pinned_to_primary', None)
+    if pinned is None:
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            pinned = False
+        else:
+            try:
+                pinned = bool(cache.get(_pin_key(user.pk)))
+            except Exception as e:
+                logger.warning(f"Replica stickiness unavailable, reading from the primary: {e}")
+                pinned = True
+        request._db_pinned_to_primary = pinned
+    return pinned
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes, and reads outside replica_for_read, go to the primary. Reads inside replica_for_read go to
+    a random replica from DB_REPLICAS, unless they run in a transaction on the primary (the write
+    paths, select_for_update) or the request writes or belongs to a user pinned after a write.
+    """
+
+    def db_for_read(self, model, **hints):
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        if not _replica_reads.get() or not settings.DB_REPLICAS or _pinned_to_primary():
+            return None
+        return random.choice(settings.DB_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema through replication.
+        if db in settings.DB_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Makes the current request visible to PrimaryReplicaRouter and pins users to the primary after
+    a successful write. Runs natively under ASGI as well.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = _current_request.set(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        if self._is_write(request, response):
+            pin_to_primary(getattr(request, 'user', None))
+        return response
+
+    async def __acall__(self, request):
+        token = _current_request.set(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        if self._is_write(request, response):
+            # request.user may still be Django's lazy session user, which queries the database.
+            await sync_to_async(pin_to_primary)(getattr(request, 'user', None))
+        return response
+
+    @staticmethod
+    def _is_write(request, response) -> bool:
+        return request.method not in SAFE_METHODS and response.status_code < 400
@@ -1,31 +1,40 @@
+from notifications.services import OutboxService
+
 
 class EmailService:
+    """
+    Email tasks are written to the transactional outbox instead of being published directly,
+    so they only go out if the surrounding booking change commits.
+    """
+
     @staticmethod
     def send_booking_confirmation(client_email, booking_details):
-        from bookings.tasks import send_booking_confirmation_email
-        send_booking_confirmation_email.delay(client_email, booking_details)
+        OutboxService().enqueue('bookings.tasks.send_booking_confirmation_email', client_email, booking_details)
 
     @staticmethod
     def send_booking_cancellation(client_email, booking_details):
-        from bookings.tasks import send_booking_cancellation_email
-        send_booking_cancellation_email.delay(client_email, booking_details)
+        OutboxService().enqueue('bookings.tasks.send_booking_cancellation_email', client_email, booking_details)
 
     @staticmethod
     def send_booking_creation(client_email, booking_details):
-        from bookings.tasks import send_booking_creation_email
-        send_booking_creation_email.delay(client_email, booking_details)
+        OutboxService().enqueue('bookings.tasks.send_booking_creation_email', client_email, booking_details)
 
     @staticmethod
     def send_booking_modification(client_email, booking_details):
-        from bookings.tasks import send_booking_modification_email
-        send_booking_modification_email.delay(client_email, booking_details)
+        OutboxService().enqueue('bookings.tasks.send_booking_modification_email', client_email, booking_details)
 
     @staticmethod
     def send_checkin(client_email, booking_details):
-        from checkins.tasks import send_checkin_email
-        send_checkin_email.delay(client_email, booking_details)
+        OutboxService().enqueue('checkins.tasks.send_checkin_email', client_email, booking_details)
 
     @staticmethod
     def send_checkout(client_email, booking_details):
-        from checkins.tasks import send_checkout_email
-        send_checkout_email.delay(client_email, booking_details)
+        OutboxService().enqueue('checkins.tasks.send_checkout_email', client_email, booking_details)
+
+    @staticmethod
+    def send_checkin_batch(notifications):
+        OutboxService().enqueue('checkins.tasks.send_checkin_batch_email', notifications)
+
+    @staticmethod
+    def send_checkout_batch(notifications):
+        OutboxService().enqueue('checkins.tasks.send_checkout_batch_email', notifications)
@@ -111,3 +111,45 @@ class UnauthorizedOrInvalidBookingException(ExceptionMessageBuilder):
         self.message = "Unauthorized action or invalid booking status."
         self.status_code = status.HTTP_400_BAD_REQUEST
         self.detail = {"title": self.title, "message": self.message}
+
+
+class BrokerUnavailableException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Broker Unavailable"
+        self.message = "The message broker is unavailable, try again later."
+        self.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class RoomNotAwaitingCleaningException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Room Not Awaiting Cleaning"
+        self.message = "This room is not waiting for housekeeping."
+        self.status_code = status.HTTP_409_CONFLICT
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class InvalidKioskTokenException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Invalid Check-In Token"
+        self.message = "The check-in token is invalid."
+        self.status_code = status.HTTP_401_UNAUTHORIZED
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class CheckInNotOpenException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Check-In Not Open"
+        self.message = "Check-in is not open for this booking today."
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class UserAlreadyExistsException(ExceptionMessageBuilder):
+    def __init__(self, errors: dict):
+        self.title = "User Already Exists"
+        self.message = "A user with this email or CPF already exists."
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        # Field-keyed like serializer errors, e.g. {"email": ["A user with this email already exists."]}.
+        self.errors = errors
+        self.detail = {"title": self.title, "message": self.message, **errors}
@@ -21,7 +21,9 @@ def custom_exception_handler(exc, context):
             custom_response["detail"] = extra_details
 
         logger.error(f"Handled exception: {exc}, Context: {context}")
-        return Response(custom_response, status=response.status_code)
+        # Keep the headers DRF sets for throttling and authentication errors.
+        headers = {header: response[header] for header in ("Retry-After", "WWW-Authenticate") if header in response}
+        return Response(custom_response, status=response.status_code, headers=headers)
 
     if isinstance(exc, ExceptionMessageBuilder):
         custom_response = {
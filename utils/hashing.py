@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+
+logger = logging.getLogger(__name__)
+
+# Created on first use so processes that never hash (Celery workers, management commands) do not spawn it.
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_hashing_executor() -> ProcessPoolExecutor:
+    """
+    Returns the process pool password hashing runs in. PBKDF2 is CPU-bound, so async views
+    await it here instead of blocking their event loop. The pool holds PASSWORD_HASHING_WORKERS
+    processes, which bounds how many CPUs hashing can take from the web process.
+    """
+    global _executor
+    if _executor is None:
+        # Spawned rather than forked: the web process already runs threads (asgiref, DB pools).
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASHING_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        )
+        logger.info(f"Started {settings.PASSWORD_HASHING_WORKERS} password hashing processes.")
+    return _executor
+
+
+async def amake_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hashing_executor(), make_password, password)
+
+
+async def acheck_password(password: str, encoded: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hashing_executor(), check_password, password, encoded)
+
+
+def must_update(encoded: str) -> bool:
+    """
+    Whether a hash was made with outdated hasher settings. check_password's setter cannot run in
+    the pool, so async callers rehash themselves when this is true.
+    """
+    preferred = get_hasher()
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
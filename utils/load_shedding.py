@@ -0,0 +1,159 @@
+import logging
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import JsonResponse
+
+logger = logging.getLogger(__name__)
+
+CRITICAL = 'critical'
+NORMAL = 'normal'
+LOW = 'low'
+
+
+class LoadShedder:
+    """
+    Per-process admission control. Tracks requests in flight and a moving p95 latency per view
+    class, and rejects work by route priority when limits are exceeded:
+
+    - critical routes are always admitted;
+    - normal routes are rejected once `max_in_flight` requests are in flight;
+    - low routes are rejected once `low_priority_max_in_flight` requests are in flight, or
+      while their own p95 over the last `latency_window` seconds exceeds `p95_latency_limit`.
+    """
+
+    def __init__(
+            self,
+            max_in_flight: int,
+            low_priority_max_in_flight: int,
+            p95_latency_limit: float,
+            latency_window: float,
+            latency_samples: int = 200
+    ):
+        self.max_in_flight = max_in_flight
+        self.low_priority_max_in_flight = low_priority_max_in_flight
+        self.p95_latency_limit = p95_latency_limit
+        self.latency_window = latency_window
+        self.latency_samples = latency_samples
+        self.in_flight = 0
+        self.shed_counts: Dict[str, int] = defaultdict(int)
+        self._latencies: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.latency_samples))
+        self._lock = threading.Lock()
+
+    def p95(self, view_name: str) -> float:
+        """
+        p95 latency of the view over the last `latency_window` seconds, 0 without samples.
+        """
+        cutoff = time.monotonic() - self.latency_window
+        with self._lock:
+            latencies = self._latencies[view_name]
+            while latencies and latencies[0][0] < cutoff:
+                latencies.popleft()
+            durations = sorted(duration for _, duration in latencies)
+        if not durations:
+            return 0.0
+        return durations[math.ceil(len(durations) * 0.95) - 1]
+
+    def admit(self, view_name: str, priority: str) -> bool:
+        if priority != CRITICAL:
+            limit = self.low_priority_max_in_flight if priority == LOW else self.max_in_flight
+            if self.in_flight >= limit or priority == LOW and self.p95(view_name) > self.p95_latency_limit:
+                with self._lock:
+                    self.shed_counts[view_name] += 1
+                return False
+
+        with self._lock:
+            self.in_flight += 1
+        return True
+
+    def finish(self, view_name: str, duration: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._latencies[view_name].append((time.monotonic(), duration))
+
+    def metrics(self) -> dict:
+        with self._lock:
+            view_names = list(self._latencies)
+            shed_counts = dict(self.shed_counts)
+            in_flight = self.in_flight
+        return {
+            "in_flight": in_flight,
+            "shed": shed_counts,
+            "p95_latency": {view_name: self.p95(view_name) for view_name in view_names},
+        }
+
+
+load_shedder = LoadShedder(
+    max_in_flight=settings.LOAD_SHEDDING_MAX_IN_FLIGHT,
+    low_priority_max_in_flight=settings.LOAD_SHEDDING_LOW_PRIORITY_MAX_IN_FLIGHT,
+    p95_latency_limit=settings.LOAD_SHEDDING_P95_LATENCY_LIMIT,
+    latency_window=settings.LOAD_SHEDDING_LATENCY_WINDOW,
+)
+
+
+class LoadSheddingMiddleware:
+    """
+    Rejects requests with 503 and Retry-After when LoadShedder does not admit them, before the
+    view runs. Route priorities come from LOAD_SHEDDING_ROUTE_PRIORITIES, keyed by view class name.
+    Runs natively under ASGI as well, so async views are not funnelled through a sync thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # Admission only touches in-process counters, so it can run on the event loop.
+            self.process_view = self._aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        try:
+            return self.get_response(request)
+        finally:
+            self._finish(request, started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        try:
+            return await self.get_response(request)
+        finally:
+            self._finish(request, started)
+
+    @staticmethod
+    def _finish(request, started: float) -> None:
+        view_name: Optional[str] = getattr(request, '_load_shedding_view', None)
+        if view_name is not None:
+            load_shedder.finish(view_name, time.perf_counter() - started)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        return self._admit(request, view_func)
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        return self._admit(request, view_func)
+
+    @staticmethod
+    def _admit(request, view_func):
+        view_name = getattr(view_func, 'view_class', view_func).__name__
+        priority = settings.LOAD_SHEDDING_ROUTE_PRIORITIES.get(view_name, NORMAL)
+
+        if not load_shedder.admit(view_name, priority):
+            logger.warning(f"Shed {priority} priority request to {view_name}.")
+            response = JsonResponse(
+                {"error": "The server is overloaded, try again later."},
+                status=503
+            )
+            response['Retry-After'] = str(settings.LOAD_SHEDDING_RETRY_AFTER)
+            return response
+
+        request._load_shedding_view = view_name
+        return None
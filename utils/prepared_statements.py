@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@contextmanager
+def prepared_statements(using: str = DEFAULT_DB_ALIAS):
+    """
+    Runs the queries inside the block as server-side prepared statements when DB_PREPARED_STATEMENTS
+    is enabled. Django binds parameters on the client by default, so a statement cannot be reused; here
+    the psycopg connection switches to server-side binding and prepares every statement on its first
+    execution. psycopg keeps the prepared statements, and so PostgreSQL keeps their plans, for the
+    lifetime of the connection, which the pool reuses across requests. Also usable as a decorator.
+    """
+    connection = connections[using]
+    if not settings.DB_PREPARED_STATEMENTS or connection.vendor != 'postgresql':
+        yield
+        return
+
+    from django.db.backends.postgresql.base import ServerBindingCursor
+
+    connection.ensure_connection()
+    raw_connection = connection.connection
+    cursor_factory, prepare_threshold = raw_connection.cursor_factory, raw_connection.prepare_threshold
+    raw_connection.cursor_factory = ServerBindingCursor
+    raw_connection.prepare_threshold = 0
+    try:
+        yield
+    finally:
+        raw_connection.cursor_factory = cursor_factory
+        raw_connection.prepare_threshold = prepare_threshold
@@ -0,0 +1,44 @@
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+from redis import asyncio as aioredis
+
+
+@lru_cache(maxsize=None)
+def get_redis_client() -> redis.Redis:
+    """
+    Returns a process-wide Redis client. The client keeps its own connection pool,
+    so it is safe to share between threads.
+    """
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_binary_redis_client() -> redis.Redis:
+    """
+    Same as get_redis_client, but returns raw bytes, for values such as bitmaps.
+    """
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+
+
+def create_async_redis_client() -> aioredis.Redis:
+    """
+    Returns a new asyncio Redis client with the same timeouts as get_redis_client. It is not shared,
+    since its connections belong to the event loop that uses them; close it with aclose().
+    """
+    return aioredis.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
@@ -0,0 +1,118 @@
+import hashlib
+import logging
+import uuid
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+from rest_framework.throttling import SimpleRateThrottle
+
+from utils.circuit_breaker import CircuitBreaker
+from utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+redis_circuit = CircuitBreaker(
+    "Throttling Redis",
+    failure_threshold=settings.THROTTLE_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.THROTTLE_CIRCUIT_RESET_TIMEOUT,
+)
+
+# Trims the window, counts it and records the request in one atomic round trip. Uses the Redis
+# clock so every web server sees the same window. Returns {allowed, milliseconds to wait}.
+SLIDING_WINDOW_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local window_ms = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms - window_ms)
+if redis.call('ZCARD', KEYS[1]) < limit then
+    redis.call('ZADD', KEYS[1], now_ms, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window_ms)
+    return {1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, tonumber(oldest[2]) + window_ms - now_ms}
+"""
+
+
+@lru_cache(maxsize=None)
+def _sliding_window_script():
+    # Sent with EVALSHA, so the script body crosses the network only once per process.
+    return get_redis_client().register_script(SLIDING_WINDOW_SCRIPT)
+
+
+def get_partner_key(request) -> Optional[str]:
+    partner_key = request.META.get('HTTP_X_PARTNER_KEY')
+    return partner_key if partner_key in settings.THROTTLE_PARTNER_KEYS else None
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Rate limit over a sliding window kept in a Redis sorted set, with rates from
+    REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']. If Redis is unavailable the request is let through,
+    and while redis_circuit is open requests are let through without calling Redis.
+    """
+    cache_format = 'throttle:%(scope)s:%(ident)s'
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None or not redis_circuit.allow():
+            return True
+
+        try:
+            allowed, wait_ms = _sliding_window_script()(
+                keys=[self.key], args=[int(self.duration * 1000), self.num_requests, uuid.uuid4().hex]
+            )
+        except Exception as e:
+            redis_circuit.record_failure()
+            logger.warning(f"Throttling unavailable, allowing request: {e}")
+            return True
+
+        redis_circuit.record_success()
+        self.wait_seconds = wait_ms / 1000
+        return bool(allowed)
+
+    def wait(self):
+        return getattr(self, 'wait_seconds', None)
+
+
+class IPRateThrottle(SlidingWindowRateThrottle):
+    """
+    Anonymous requests without a partner key, by client IP.
+    """
+    scope = 'ip'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated or get_partner_key(request):
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class UserRateThrottle(SlidingWindowRateThrottle):
+    """
+    Authenticated requests, by user.
+    """
+    scope = 'user'
+
+    def get_cache_key(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': request.user.pk}
+
+
+class PartnerRateThrottle(SlidingWindowRateThrottle):
+    """
+    Requests carrying a known X-Partner-Key header, by partner key.
+    """
+    scope = 'partner'
+
+    def get_cache_key(self, request, view):
+        partner_key = get_partner_key(request)
+        if partner_key is None or request.user and request.user.is_authenticated:
+            return None
+        ident = hashlib.sha256(partner_key.encode()).hexdigest()[:16]
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
@@ -1,3 +1,61 @@
-from django.shortcuts import render
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from utils import db_pool, load_shedding
+from utils.custom_permissions import IsAdminUser
+
+
+class LoadSheddingMetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Load shedding state of the worker process serving the request: requests in flight, "
+                              "requests shed per view and p95 latency per view in seconds.",
+        responses={
+            200: "Load shedding metrics",
+            403: "Only admins can view metrics."
+        }
+    )
+    def get(self, request):
+        return Response(load_shedding.load_shedder.metrics(), status=status.HTTP_200_OK)
+
+
+class DatabasePoolMetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Connection pool statistics of the worker process serving the request, "
+                              "per database alias.",
+        responses={
+            200: "Connection pool metrics",
+            403: "Only admins can view metrics."
+        }
+    )
+    def get(self, request):
+        return Response(db_pool.pool_metrics(), status=status.HTTP_200_OK)
+
+
+class DatabaseHealthView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_description="Checks that every database answers through the connection pool.",
+        responses={
+            200: "All databases are reachable",
+            503: "At least one database is unreachable"
+        }
+    )
+    def get(self, request):
+        databases = db_pool.check_databases()
+        healthy = all(databases.values())
+        return Response(
+            {
+                "status": "ok" if healthy else "unavailable",
+                "databases": {alias: "ok" if ok else "unavailable" for alias, ok in databases.items()},
+            },
+            status=status.HTTP_200_OK if healthy else status.HTTP_503_SERVICE_UNAVAILABLE
+        )